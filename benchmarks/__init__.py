@@ -0,0 +1,14 @@
+# -*- coding: utf-8 -*-
+"""Benchmarks for the bfio readers and writers.
+
+The benchmarks write a synthetic image with each backend, then time reading it
+back with several access patterns. Results are written as JSON so they can be
+compared between runs and machines.
+
+Run all benchmarks from the root of the repository with::
+
+    python -m benchmarks --output results.json
+
+Use ``python -m benchmarks --help`` to select backends, dtypes, numbers of
+workers, cases and the size of the synthetic image.
+"""
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""Access patterns measured by the benchmarks.
+
+Every read case takes an open BioReader and the benchmark options, runs the
+access pattern once and returns the number of pixel bytes it read.
+"""
+
+import typing
+
+import numpy
+
+from bfio import BioReader
+
+
+def read_full_plane(br: BioReader, options: typing.Dict) -> int:
+    """Read the first plane of the image."""
+    data = br.read(Z=0, C=[0], T=[0])
+    return data.nbytes
+
+
+def read_random_roi(br: BioReader, options: typing.Dict) -> int:
+    """Read small regions at random positions of random planes.
+
+    The same regions are read every time the case runs.
+    """
+    rng = numpy.random.default_rng(options["seed"])
+    size = min(options["roi_size"], br.X, br.Y)
+    nbytes = 0
+    for _ in range(options["roi_count"]):
+        y = int(rng.integers(0, br.Y - size + 1))
+        x = int(rng.integers(0, br.X - size + 1))
+        z = int(rng.integers(0, br.Z))
+        data = br.read(X=(x, x + size), Y=(y, y + size), Z=z, C=[0], T=[0])
+        nbytes += data.nbytes
+    return nbytes
+
+
+def read_zstack(br: BioReader, options: typing.Dict) -> int:
+    """Read a column through all z-slices at the center of the image."""
+    size = min(options["roi_size"], br.X, br.Y)
+    y = (br.Y - size) // 2
+    x = (br.X - size) // 2
+    data = br.read(X=(x, x + size), Y=(y, y + size), C=[0], T=[0])
+    return data.nbytes
+
+
+def iterate_tiles(br: BioReader, options: typing.Dict) -> int:
+    """Iterate over the tiles of the first plane with the tile iterator."""
+    tile_size = options["tile_size"]
+    nbytes = 0
+    for images, _ in br(tile_size=(tile_size, tile_size)):
+        nbytes += images.nbytes
+    return nbytes
+
+
+READ_CASES = {
+    "read_full_plane": read_full_plane,
+    "read_random_roi": read_random_roi,
+    "read_zstack": read_zstack,
+    "iterate_tiles": iterate_tiles,
+}
+
+CASES = ["write"] + list(READ_CASES)
@@ -0,0 +1,366 @@
+# -*- coding: utf-8 -*-
+"""Run the benchmarks and collect machine readable results."""
+
+import datetime
+import logging
+import multiprocessing
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import typing
+from pathlib import Path
+
+import bfio
+from bfio import BioReader
+
+from benchmarks.cases import READ_CASES
+from benchmarks.synthetic import EXTENSIONS, synthetic_image, write_image
+
+logger = logging.getLogger("bfio.benchmarks")
+
+# Packages whose versions are recorded with the results
+PACKAGES = ["numpy", "tifffile", "imagecodecs", "zarr", "bfiocpp", "ome-types"]
+
+
+def measure(
+    fn: typing.Callable[[], int],
+    repeat: int,
+    setup: typing.Optional[typing.Callable[[], None]] = None,
+    warmup: int = 1,
+) -> typing.Dict:
+    """Time a function several times.
+
+    Args:
+        fn: The function to time. It returns the number of bytes it processed.
+        repeat: Number of timed calls.
+        setup: Called before every call, and not timed. *Defaults to None.*
+        warmup: Number of untimed calls before the timed calls.
+            *Defaults to 1.*
+
+    Returns:
+        A dictionary with the timings in seconds, their statistics, the bytes
+        processed per call and the throughput in MB/s based on the median.
+    """
+    for _ in range(warmup):
+        if setup is not None:
+            setup()
+        fn()
+
+    times = []
+    nbytes = 0
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        nbytes = fn()
+        times.append(time.perf_counter() - start)
+
+    median = statistics.median(times)
+    return {
+        "times": times,
+        "min": min(times),
+        "median": median,
+        "mean": statistics.mean(times),
+        "stdev": statistics.stdev(times) if len(times) > 1 else 0.0,
+        "bytes": nbytes,
+        "throughput_mb_s": nbytes / median / 1e6 if median > 0 else None,
+    }
+
+
+def environment() -> typing.Dict:
+    """Describe the machine and software the benchmarks ran with."""
+    from importlib import metadata
+
+    packages = {}
+    for package in PACKAGES:
+        try:
+            packages[package] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            packages[package] = None
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=Path(__file__).parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "bfio": bfio.__version__,
+        "git_commit": commit,
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "packages": packages,
+    }
+
+
+def _remove(path: Path) -> None:
+    if path.is_dir():
+        shutil.rmtree(path)
+    elif path.exists():
+        path.unlink()
+
+
+def run_benchmarks(
+    backends: typing.List[str],
+    dtypes: typing.List[str],
+    workers: typing.List[int],
+    cases: typing.List[str],
+    shape: typing.Tuple[int, int, int, int, int],
+    repeat: int = 5,
+    roi_size: int = 256,
+    roi_count: int = 100,
+    tile_size: int = 512,
+    seed: int = 0,
+    timeout: float = 600,
+    workdir: typing.Optional[Path] = None,
+) -> typing.Dict:
+    """Run every case for every combination of backend, dtype and workers.
+
+    Every case runs in a new process, so cases do not share caches or thread
+    pools, and a case that crashes or hangs is stopped. A failing case is
+    recorded with its error and the remaining cases still run, so unsupported
+    combinations show up in the results.
+
+    Args:
+        backends: The backends to benchmark.
+        dtypes: The pixel types of the synthetic images.
+        workers: The values of max_workers to benchmark.
+        cases: The cases to run, from ``benchmarks.cases.CASES``.
+        shape: The (Y, X, Z, C, T) shape of the synthetic images.
+        repeat: Number of timed runs of every case. *Defaults to 5.*
+        roi_size: Width and height of the regions read by the region cases.
+            *Defaults to 256.*
+        roi_count: Number of regions read by read_random_roi.
+            *Defaults to 100.*
+        tile_size: Size of the tiles returned by the tile iterator.
+            *Defaults to 512.*
+        seed: Seed used to generate images and regions. *Defaults to 0.*
+        timeout: Seconds after which a case is stopped. *Defaults to 600.*
+        workdir: Directory to write the images to, created if it does not
+            exist. *Defaults to a temporary directory that is removed
+            afterwards.*
+
+    Returns:
+        A dictionary with the environment, the configuration and a list of
+        results, one per case and combination.
+    """
+    options = {
+        "roi_size": roi_size,
+        "roi_count": roi_count,
+        "tile_size": tile_size,
+        "seed": seed,
+    }
+    config = {
+        "backends": backends,
+        "dtypes": dtypes,
+        "workers": workers,
+        "cases": cases,
+        "shape": list(shape),
+        "repeat": repeat,
+        "timeout": timeout,
+        **options,
+    }
+    results = []
+
+    tmp = None
+    if workdir is None:
+        tmp = tempfile.TemporaryDirectory()
+        workdir = Path(tmp.name)
+    workdir = Path(workdir)
+    workdir.mkdir(parents=True, exist_ok=True)
+
+    try:
+        for dtype in dtypes:
+            for backend in backends:
+                for max_workers in workers:
+                    path = workdir / f"bench_{backend}_{dtype}{EXTENSIONS[backend]}"
+                    params = {
+                        "backend": backend,
+                        "dtype": dtype,
+                        "max_workers": max_workers,
+                        "shape": list(shape),
+                    }
+
+                    # The write case leaves the image behind for the read cases
+                    if "write" in cases:
+                        results.append(
+                            _run_case("write", path, params, options, repeat, timeout)
+                        )
+                    else:
+                        _remove(path)
+                        try:
+                            image = synthetic_image(shape, dtype, seed)
+                            write_image(path, image, backend, max_workers)
+                        except Exception:
+                            logger.exception(f"Could not write {path.name}")
+
+                    for case in cases:
+                        if case in READ_CASES:
+                            results.append(
+                                _run_case(case, path, params, options, repeat, timeout)
+                            )
+                    _remove(path)
+    finally:
+        if tmp is not None:
+            tmp.cleanup()
+
+    return {"environment": environment(), "config": config, "results": results}
+
+
+def _measure_case(connection, case, path, params, options, repeat) -> None:
+    """Measure a case and send the result, or the error, through a pipe."""
+    try:
+        if case == "write":
+            dtype = params["dtype"]
+            image = synthetic_image(tuple(params["shape"]), dtype, options["seed"])
+
+            def write():
+                write_image(path, image, params["backend"], params["max_workers"])
+                return image.nbytes
+
+            result = measure(write, repeat, lambda: _remove(path))
+        else:
+            fn = READ_CASES[case]
+            with BioReader(
+                path, backend=params["backend"], max_workers=params["max_workers"]
+            ) as br:
+                result = measure(lambda: fn(br, options), repeat)
+        connection.send((result, None))
+    except Exception as err:
+        connection.send((None, f"{type(err).__name__}: {err}"))
+    finally:
+        connection.close()
+
+
+def _run_case(case, path, params, options, repeat, timeout) -> typing.Dict:
+    logger.info(f"Running {case} with {params}")
+    context = multiprocessing.get_context("spawn")
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(
+        target=_measure_case,
+        args=(sender, case, path, params, options, repeat),
+        daemon=True,
+    )
+    process.start()
+    sender.close()
+
+    result, error = None, None
+    try:
+        if receiver.poll(timeout):
+            result, error = receiver.recv()
+        else:
+            error = f"TimeoutError: no result after {timeout} seconds"
+    except EOFError:
+        error = "ProcessError: the benchmark process exited unexpectedly"
+    finally:
+        receiver.close()
+        if process.is_alive():
+            process.kill()
+        process.join()
+
+    if error is not None:
+        logger.warning(f"{case} failed with {params}: {error}")
+        return {"case": case, **params, "error": error}
+    return {"case": case, **params, **result, "error": None}
+
+
+def summary(results: typing.Dict) -> str:
+    """Format the results as a table of median times and throughputs."""
+    lines = [
+        f"{'case':<16} {'backend':<12} {'dtype':<8} {'workers':>7} "
+        + f"{'median (s)':>11} {'MB/s':>9}"
+    ]
+    for r in results["results"]:
+        row = f"{r['case']:<16} {r['backend']:<12} {r['dtype']:<8} "
+        row += f"{r['max_workers']:>7} "
+        if r["error"] is None:
+            row += f"{r['median']:>11.4f} {r['throughput_mb_s']:>9.1f}"
+        else:
+            row += f"{'failed':>11} {'':>9} {r['error'][:60]}"
+        lines.append(row)
+    return "\n".join(lines)
+
+
+def _parse_shape(value: str) -> typing.Tuple[int, int, int, int, int]:
+    shape = [int(v) for v in value.lower().split("x")]
+    return tuple(shape + [1] * (5 - len(shape)))
+
+
+def main(argv: typing.Optional[typing.List[str]] = None) -> None:
+    """Run the benchmarks from the command line."""
+    import argparse
+    import json
+
+    from benchmarks.cases import CASES
+
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description=__doc__.strip()
+    )
+    parser.add_argument(
+        "--backends", nargs="+", default=list(EXTENSIONS), choices=list(EXTENSIONS)
+    )
+    parser.add_argument("--dtypes", nargs="+", default=["uint8", "uint16", "float32"])
+    parser.add_argument("--workers", nargs="+", type=int, default=[1, 4])
+    parser.add_argument("--cases", nargs="+", default=CASES, choices=CASES)
+    parser.add_argument(
+        "--shape",
+        type=_parse_shape,
+        default=(4096, 4096, 4, 1, 1),
+        help="Image shape as YxXxZxCxT, e.g. 4096x4096x4.",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--roi-size", type=int, default=256)
+    parser.add_argument("--roi-count", type=int, default=100)
+    parser.add_argument("--tile-size", type=int, default=512)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=600,
+        help="Seconds after which a case is stopped and recorded as failed.",
+    )
+    parser.add_argument("--workdir", type=Path, default=None)
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=None,
+        help="Write the JSON results to this file instead of stdout.",
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    results = run_benchmarks(
+        backends=args.backends,
+        dtypes=args.dtypes,
+        workers=args.workers,
+        cases=args.cases,
+        shape=args.shape,
+        repeat=args.repeat,
+        roi_size=args.roi_size,
+        roi_count=args.roi_count,
+        tile_size=args.tile_size,
+        seed=args.seed,
+        timeout=args.timeout,
+        workdir=args.workdir,
+    )
+
+    print(summary(results), file=sys.stderr)
+    if args.output is None:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+    else:
+        with open(args.output, "w") as fw:
+            json.dump(results, fw, indent=2)
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""Reproducible synthetic images for benchmarking."""
+
+import typing
+from pathlib import Path
+
+import numpy
+
+from bfio import BioWriter
+
+# File extension written by each backend
+EXTENSIONS = {
+    "python": ".ome.tif",
+    "zarr": ".ome.zarr",
+    "zarr3": ".ome.zarr",
+    "tensorstore": ".ome.zarr",
+}
+
+
+def synthetic_plane(
+    shape: typing.Tuple[int, int], dtype: numpy.dtype, rng: numpy.random.Generator
+) -> numpy.ndarray:
+    """Generate one plane that compresses like a fluorescence image.
+
+    The plane is a smooth, blocky background with sparse bright spots and
+    noise, so it is neither incompressible noise nor trivially compressible.
+
+    Args:
+        shape: The (Y, X) shape of the plane.
+        dtype: The pixel type.
+        rng: The random number generator.
+
+    Returns:
+        A plane scaled to a quarter of the range of integer types, or to [0, 1]
+        for floating point types.
+    """
+    block = 64
+    coarse = rng.random((shape[0] // block + 1, shape[1] // block + 1))
+    plane = numpy.repeat(numpy.repeat(coarse, block, 0), block, 1)
+    plane = plane[: shape[0], : shape[1]] * 0.2
+
+    spots = rng.random(shape) > 0.999
+    plane[spots] += 0.6
+    plane += rng.normal(0, 0.02, shape)
+    numpy.clip(plane, 0, 1, out=plane)
+
+    dtype = numpy.dtype(dtype)
+    if dtype.kind in "ui":
+        return (plane * (numpy.iinfo(dtype).max // 4)).astype(dtype)
+    return plane.astype(dtype)
+
+
+def synthetic_image(
+    shape: typing.Tuple[int, int, int, int, int],
+    dtype: numpy.dtype,
+    seed: int = 0,
+) -> numpy.ndarray:
+    """Generate a reproducible 5D image.
+
+    Args:
+        shape: The (Y, X, Z, C, T) shape of the image.
+        dtype: The pixel type.
+        seed: Seed of the random number generator. *Defaults to 0.*
+
+    Returns:
+        The image with shape (Y, X, Z, C, T).
+    """
+    rng = numpy.random.default_rng(seed)
+    image = numpy.empty(shape, dtype=dtype)
+    for t in range(shape[4]):
+        for c in range(shape[3]):
+            for z in range(shape[2]):
+                image[:, :, z, c, t] = synthetic_plane(shape[:2], dtype, rng)
+    return image
+
+
+def write_image(
+    path: Path, image: numpy.ndarray, backend: str, max_workers: int = 1
+) -> None:
+    """Write a 5D (Y, X, Z, C, T) image with a bfio backend.
+
+    Args:
+        path: The output path, which should end with the extension of the
+            backend in ``EXTENSIONS``.
+        image: The image to write.
+        backend: The name of the BioWriter backend.
+        max_workers: Number of workers used by the writer. *Defaults to 1.*
+    """
+    with BioWriter(
+        path,
+        backend=backend,
+        max_workers=max_workers,
+        X=image.shape[1],
+        Y=image.shape[0],
+        Z=image.shape[2],
+        C=image.shape[3],
+        T=image.shape[4],
+        dtype=image.dtype,
+    ) as bw:
+        bw[:] = image
@@ -1,16 +1,26 @@
 # -*- coding: utf-8 -*-
 # import core packages
+import asyncio
 import io
+import json
 import logging
+import multiprocessing
+import os
 import shutil
 import struct
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import OrderedDict, deque, namedtuple
+from functools import lru_cache
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    wait,
+)
+from multiprocessing import shared_memory
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 import threading
 
 # Third party packages
-import imagecodecs
 import numpy
 import ome_types
 from tifffile import tifffile
@@ -22,6 +32,7 @@ import bfio.base_classes
 from bfio.utils import (
     start,
     clean_ome_xml_for_known_issues,
+    downsample,
     pixels_per_cm,
 )
 
@@ -31,19 +42,698 @@ logging.basicConfig(
 )
 logger = logging.getLogger("bfio.backends")
 
+CacheInfo = namedtuple(
+    "CacheInfo", ["hits", "misses", "evictions", "maxsize", "currsize"]
+)
+
+# Units of length that OME-NGFF accepts for space axes
+_NGFF_SPACE_UNITS = {
+    "angstrom",
+    "attometer",
+    "centimeter",
+    "decimeter",
+    "exameter",
+    "femtometer",
+    "foot",
+    "gigameter",
+    "hectometer",
+    "inch",
+    "kilometer",
+    "megameter",
+    "meter",
+    "micrometer",
+    "mile",
+    "millimeter",
+    "nanometer",
+    "parsec",
+    "petameter",
+    "picometer",
+    "terameter",
+    "yard",
+    "yoctometer",
+    "yottameter",
+    "zeptometer",
+    "zettameter",
+}
+
+# Size, tile grid and IFD tags of a sub-resolution level written by PythonWriter
+PyramidLevel = namedtuple(
+    "PyramidLevel", ["Y", "X", "tiles", "numtiles", "bytecountformat", "tags"]
+)
+
+
+class TileCache(object):
+    """Thread safe LRU cache of decoded tiles with a byte budget.
+
+    Tiles are keyed by ``(page_index, tile_index)``. When adding a tile would
+    exceed ``maxsize`` bytes, the least recently used tiles are evicted. Tiles
+    larger than ``maxsize`` are never cached.
+    """
+
+    def __init__(self, maxsize: int):
+        """Initialize the tile cache.
+
+        Args:
+            maxsize: Maximum number of bytes of decoded tiles to keep.
+        """
+        self.maxsize = maxsize
+        self._tiles = OrderedDict()
+        self._currsize = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return the cached tile for key, or None if it is not cached."""
+        with self._lock:
+            tile = self._tiles.get(key)
+            if tile is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+                self._tiles.move_to_end(key)
+            return tile
+
+    def put(self, key, tile: numpy.ndarray):
+        """Add a decoded tile to the cache, evicting old tiles if needed."""
+        if tile.nbytes > self.maxsize:
+            return
+        with self._lock:
+            if key in self._tiles:
+                self._tiles.move_to_end(key)
+                return
+            self._tiles[key] = tile
+            self._currsize += tile.nbytes
+            while self._currsize > self.maxsize:
+                _, evicted = self._tiles.popitem(last=False)
+                self._currsize -= evicted.nbytes
+                self._evictions += 1
+
+    def clear(self):
+        """Remove all tiles from the cache and reset the counters."""
+        with self._lock:
+            self._tiles.clear()
+            self._currsize = 0
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def info(self) -> CacheInfo:
+        """Return the cache statistics."""
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                self.maxsize,
+                self._currsize,
+            )
+
+    def __len__(self):
+        return len(self._tiles)
+
+
+# State of a tile worker process, set up by _init_tile_worker
+_worker = {}
+
+
+def _init_tile_worker(shm_name, shape, dtype, initializer, initargs):
+    shm = shared_memory.SharedMemory(name=shm_name)
+    _worker["shm"] = shm
+    _worker["buffer"] = numpy.ndarray(shape, dtype, buffer=shm.buf)
+    if initializer is not None:
+        initializer(*initargs)
+
+
+def _open_tiff_worker(file_path, level):
+    tif = tifffile.TiffFile(file_path)
+    pages = tif.pages if level is None else tif.series[0].levels[level]
+    _worker["tif"] = tif
+    _worker["keyframe"] = pages[0].keyframe
+
+
+def _decode_tile(slot, offset, bytecount, index):
+    """Decode a tile into a slot of the shared buffer.
+
+    Returns:
+        False if the tile is empty and should be filled with nodata.
+    """
+    if bytecount == 0:
+        return False
+    fh = _worker["tif"].filehandle
+    fh.seek(offset)
+    segment, _, _ = _worker["keyframe"].decode(fh.read(bytecount), index)
+    if segment is None:
+        return False
+    buffer = _worker["buffer"]
+    buffer[slot] = segment.reshape(buffer.shape[1:])
+    return True
+
+
+def _encode_tile(slot, compression, level, predictor):
+    tile = _worker["buffer"][slot]
+    return _encode_varying_tile(
+        tile.reshape(tile.shape + (1,)), compression, level, predictor
+    )
+
+
+def _constant_value(tile: numpy.ndarray) -> Optional[bytes]:
+    """Get the value of a tile whose pixels are all equal.
+
+    Pixels are compared by their bits, so floating point tiles mixing 0.0 and
+    -0.0 are not constant, and tiles of NaN are.
+
+    Returns:
+        The value as bytes, or None if the pixels of the tile differ.
+    """
+    flat = tile.reshape(-1)
+    if tile.dtype.kind == "f":
+        flat = flat.view(f"u{tile.dtype.itemsize}")
+    first = flat[0]
+    # most tiles can be rejected from their first row
+    if not (flat[: tile.shape[1]] == first).all() or not (flat == first).all():
+        return None
+    return first.tobytes()
+
+
+def _encode_varying_tile(tile, compression, level, predictor):
+    """Encode a tile, unless all of its pixels are equal.
+
+    Returns:
+        ``(value, None)`` for a constant tile, where value is the pixel value as
+        bytes, otherwise ``(None, encoded)``.
+    """
+    value = _constant_value(tile)
+    if value is not None:
+        return value, None
+    return None, _tile_encoder(compression, level, predictor)(tile)
+
+
+# Compression schemes written by the PythonWriter. Each maps to the TIFF
+# compression tag, the keyword that sets the compression level (None if the
+# codec has no level), the default level, and codec arguments that keep the
+# compression lossless.
+TIFF_COMPRESSIONS = {
+    "none": (tifffile.COMPRESSION.NONE, None, None, {}),
+    "deflate": (tifffile.COMPRESSION.ADOBE_DEFLATE, "level", 1, {}),
+    "lzw": (tifffile.COMPRESSION.LZW, None, None, {}),
+    "packbits": (tifffile.COMPRESSION.PACKBITS, None, None, {}),
+    "lzma": (tifffile.COMPRESSION.LZMA, "level", None, {}),
+    "zstd": (tifffile.COMPRESSION.ZSTD, "level", 1, {}),
+    "jpegxl": (tifffile.COMPRESSION.JPEGXL, "effort", None, {"lossless": True}),
+    "jpeg2000": (
+        tifffile.COMPRESSION.JPEG2000,
+        None,
+        None,
+        {"codecformat": 0, "reversible": True},
+    ),
+}
+
+# Codecs that compress images rather than bytes, and cannot be used with a predictor
+_IMAGE_COMPRESSIONS = {"jpegxl", "jpeg2000"}
+
+
+def tiff_predictor(compression: str, dtype: numpy.dtype) -> int:
+    """Get the TIFF predictor tag that suits a compression and pixel type.
+
+    Args:
+        compression: A compression scheme from ``TIFF_COMPRESSIONS``.
+        dtype: The pixel type.
+
+    Returns:
+        The horizontal differencing predictor (2) for integers, or the floating
+        point predictor (3) for floats.
+
+    Raises:
+        ValueError: If the compression or pixel type does not support a predictor.
+    """
+    dtype = numpy.dtype(dtype)
+    if compression == "none" or compression in _IMAGE_COMPRESSIONS:
+        raise ValueError(f"A predictor cannot be used with {compression} compression.")
+    if dtype.kind == "f":
+        return tifffile.PREDICTOR.FLOATINGPOINT.value
+    if dtype.kind in "iu" and dtype.itemsize <= 4:
+        return tifffile.PREDICTOR.HORIZONTAL.value
+    raise ValueError(f"A predictor cannot be used with {dtype} pixels.")
+
+
+@lru_cache(maxsize=None)
+def _tile_encoder(compression: str, level: Optional[int], predictor: int):
+    """Get a function that encodes a (height, width, samples) tile to bytes."""
+    tag, level_arg, default_level, kwargs = TIFF_COMPRESSIONS[compression]
+    if tag == tifffile.COMPRESSION.NONE:
+        return lambda data: data.tobytes()
+
+    kwargs = dict(kwargs)
+    if level_arg is not None:
+        kwargs[level_arg] = default_level if level is None else level
+    compressor = tifffile.TIFF.COMPRESSORS[tag]
+
+    if predictor == tifffile.PREDICTOR.NONE:
+        return lambda data: compressor(data, **kwargs)
+
+    predictorfunc = tifffile.TIFF.PREDICTORS[predictor]
+
+    def encode(data):
+        return compressor(predictorfunc(data, axis=-2), **kwargs)
+
+    return encode
+
+
+class TilePyramid(object):
+    """Build sub-resolution levels of an image from its full resolution tiles.
+
+    Each level halves the height and width of the previous one, and is split
+    into tiles of the same size as the full resolution image. When a tile is
+    added, it is downsampled into the tile of the next level that contains it.
+    Once every tile of the previous level inside a tile of the next level has
+    been added, that tile is returned so it can be written, and is downsampled
+    in turn. Levels are built while an image is written, without holding the
+    full resolution image in memory.
+
+    Tiles may be added again when a region of the image is overwritten. The
+    tile of the next level is then updated and returned again, so complete
+    tiles of the sub-resolution levels are kept until the pyramid is flushed.
+
+    Tiles of a full resolution image must be added whole, i.e. the writes must
+    be aligned to the tile grid.
+    """
+
+    def __init__(
+        self, shape: Tuple[int, int], levels: int, tile_size: int, method: str
+    ):
+        """Initialize the pyramid.
+
+        Args:
+            shape: The (Y, X) shape of the full resolution image.
+            levels: Number of sub-resolution levels.
+            tile_size: Height and width of the tiles.
+            method: The downsampling method, see :func:`bfio.utils.downsample`.
+        """
+        self.tile_size = tile_size
+        self.method = method
+        self.shapes = [tuple(shape)]
+        for _ in range(levels):
+            self.shapes.append(tuple((s + 1) // 2 for s in self.shapes[-1]))
+        self.tiles = [
+            tuple((s + tile_size - 1) // tile_size for s in shape)
+            for shape in self.shapes
+        ]
+        self._pending = {}
+        self._complete = {}
+        self._lock = threading.Lock()
+
+    @property
+    def levels(self) -> int:
+        """Number of sub-resolution levels."""
+        return len(self.shapes) - 1
+
+    def tile_shape(self, level: int, y: int, x: int) -> Tuple[int, int]:
+        """Get the shape of the part of a tile that is inside the image."""
+        ts = self.tile_size
+        Y, X = self.shapes[level]
+        return min(ts, Y - y * ts), min(ts, X - x * ts)
+
+    def add(self, plane, level: int, y: int, x: int, tile: numpy.ndarray) -> List:
+        """Add a complete tile of a level.
+
+        Args:
+            plane: Any hashable that identifies the plane the tile belongs to.
+            level: The resolution level of the tile, 0 for full resolution.
+            y: The row of the tile in the tile grid of its level.
+            x: The column of the tile in the tile grid of its level.
+            tile: The tile, with Y and X as the first dimensions. It may be
+                padded beyond the edge of the image.
+
+        Returns:
+            A list of ``(plane, level, y, x, tile)`` for every tile of a
+            sub-resolution level that became complete or was updated. The tiles
+            are padded to the full tile size.
+        """
+        if level >= self.levels:
+            return []
+
+        ts = self.tile_size
+        h, w = self.tile_shape(level, y, x)
+        reduced = downsample(tile[:h, :w], self.method)
+        key = (plane, level + 1, y // 2, x // 2)
+        oy, ox = (y % 2) * ts // 2, (x % 2) * ts // 2
+
+        with self._lock:
+            if key in self._complete:
+                # a tile of a complete tile was added again, so update a copy
+                # that is safe to return while the previous one is written
+                parent = self._complete[key].copy()
+                missing = set()
+            elif key in self._pending:
+                parent, missing = self._pending.pop(key)
+            else:
+                parent = numpy.zeros((ts, ts) + tile.shape[2:], tile.dtype)
+                rows, cols = self.tiles[level]
+                missing = {
+                    (cy, cx)
+                    for cy in range(2 * key[2], min(2 * key[2] + 2, rows))
+                    for cx in range(2 * key[3], min(2 * key[3] + 2, cols))
+                }
+            parent[oy : oy + reduced.shape[0], ox : ox + reduced.shape[1]] = reduced
+            missing.discard((y, x))
+            if missing:
+                self._pending[key] = (parent, missing)
+                return []
+            self._complete[key] = parent
+
+        return [key + (parent,)] + self.add(*key, parent)
+
+    def flush(self) -> List:
+        """Complete the tiles that were only partly added.
+
+        Parts of these tiles that were never added are filled with zeros.
+
+        Returns:
+            A list of ``(plane, level, y, x, tile)`` for every remaining tile,
+            ordered from the lowest to the highest level.
+        """
+        tiles = []
+        while True:
+            with self._lock:
+                if not self._pending:
+                    self._complete.clear()
+                    return tiles
+                key = min(self._pending, key=lambda k: k[1])
+                tile = self._pending.pop(key)[0]
+                self._complete[key] = tile
+            tiles.append(key + (tile,))
+            tiles.extend(self.add(*key, tile))
+
+
+class TileProcessPool(object):
+    """A pool of worker processes that exchange tiles through shared memory.
+
+    Every task is given a slot of a shared memory buffer to read a tile from or
+    to write a tile to, so tiles are never pickled. Decoding and encoding in
+    processes scales past the point where threads contend for the GIL. Only as
+    many tasks as there are slots are in flight at once, which bounds the memory
+    used by the pool.
+
+    Workers are started with the ``spawn`` method, so scripts using this pool
+    must guard their entry point with ``if __name__ == "__main__":``.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        tile_shape: Tuple[int, int],
+        dtype: numpy.dtype,
+        initializer=None,
+        initargs: Tuple = (),
+        slots: Optional[int] = None,
+    ):
+        """Start the worker processes.
+
+        Args:
+            max_workers: Number of worker processes.
+            tile_shape: Shape of a tile.
+            dtype: Data type of a tile.
+            initializer: A module level function called in every worker once
+                the shared buffer is attached. *Defaults to None.*
+            initargs: Arguments passed to ``initializer``.
+            slots: Number of tiles in the shared buffer. *Defaults to twice the
+                number of workers.*
+        """
+        self.max_workers = max_workers
+        self.slots = 2 * max_workers if slots is None else slots
+        dtype = numpy.dtype(dtype)
+        shape = (self.slots,) + tuple(tile_shape)
+        self._shm = shared_memory.SharedMemory(
+            create=True, size=int(numpy.prod(shape)) * dtype.itemsize
+        )
+        self.buffer = numpy.ndarray(shape, dtype, buffer=self._shm.buf)
+        self._executor = ProcessPoolExecutor(
+            max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_tile_worker,
+            initargs=(self._shm.name, shape, dtype.str, initializer, initargs),
+        )
+
+    def run(self, fn, tasks, before=None, after=None, ordered=False):
+        """Run every task in the worker processes.
+
+        Args:
+            fn: A module level function, called in a worker as
+                ``fn(slot, *args)`` for each task.
+            tasks: An iterable of ``(args, item)`` pairs. ``args`` are sent to
+                the worker, ``item`` is passed to ``before`` and ``after``.
+            before: Called as ``before(slot, item)`` before a task is
+                submitted, for example to copy a tile into its slot.
+            after: Called as ``after(slot, item, result)`` when a task is done,
+                for example to copy a tile out of its slot.
+            ordered: Call ``after`` in the order the tasks were given, instead
+                of the order they finish in. *Defaults to False.*
+        """
+        free = list(range(len(self.buffer)))
+        pending = {}
+        tasks = iter(tasks)
+        while True:
+            for args, item in tasks:
+                slot = free.pop()
+                if before is not None:
+                    before(slot, item)
+                pending[self._executor.submit(fn, slot, *args)] = (slot, item)
+                if len(free) == 0:
+                    break
+            if len(pending) == 0:
+                break
+
+            if ordered:
+                done = [next(iter(pending))]
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                slot, item = pending.pop(future)
+                result = future.result()
+                if after is not None:
+                    after(slot, item, result)
+                free.append(slot)
+
+    def shutdown(self, wait: bool = True):
+        """Stop the workers and free the shared memory."""
+        self._executor.shutdown(wait=wait)
+        self.buffer = None
+        self._shm.close()
+        self._shm.unlink()
+
+
+class SidecarIndex(object):
+    """Sidecar file caching the tile index and metadata of an OME tiled tiff.
+
+    The sidecar stores the tile offsets and bytecounts of every page, the image
+    dimensions, the data type, the OME XML and the file offset of the first
+    page of the resolution level, so that reopening an image does not need to
+    walk its IFDs or parse its metadata. The sidecar is only used
+    if the size and modification time of the image match the values recorded
+    when the sidecar was written.
+
+    The file starts with an 8 byte magic number and the length of a JSON
+    header, followed by the header and the tile offsets and bytecounts as a
+    little endian ``(2, pages, tiles)`` uint64 array, which is memory mapped
+    when loaded.
+    """
+
+    logger = logging.getLogger("bfio.backends.SidecarIndex")
+
+    _MAGIC = b"BFIOIDX1"
+    _VERSION = 2
+    _ALIGNMENT = 64
+
+    def __init__(
+        self,
+        header: Dict,
+        dataoffsets: numpy.ndarray,
+        databytecounts: numpy.ndarray,
+    ):
+        """Initialize the sidecar index.
+
+        Args:
+            header: Dictionary with the image dimensions, data type, and OME XML.
+            dataoffsets: Tile offsets of each page, shape ``(pages, tiles)``.
+            databytecounts: Tile bytecounts of each page, shape ``(pages, tiles)``.
+        """
+        self.header = header
+        self.dataoffsets = dataoffsets
+        self.databytecounts = databytecounts
+
+    @property
+    def dims(self) -> Dict[str, int]:
+        """Image dimensions, keyed by ``X``, ``Y``, ``Z``, ``C`` and ``T``."""
+        return self.header["dims"]
+
+    @property
+    def dtype(self) -> numpy.dtype:
+        """Pixel data type, including byte order."""
+        return numpy.dtype(self.header["dtype"])
+
+    @property
+    def ome_xml(self) -> str:
+        """OME XML of the image."""
+        return self.header["ome_xml"]
+
+    @property
+    def page_offset(self) -> int:
+        """File offset of the first page of the resolution level."""
+        return self.header["page_offset"]
+
+    @staticmethod
+    def path(file_path: Path, level: Optional[int] = None) -> Path:
+        """Path to the sidecar index of an image."""
+        suffix = ".bfidx" if level is None else f".{level}.bfidx"
+        return file_path.with_name(file_path.name + suffix)
+
+    @staticmethod
+    def _file_stats(file_path: Path) -> Dict[str, int]:
+        stat = file_path.stat()
+        return {"file_size": stat.st_size, "file_mtime_ns": stat.st_mtime_ns}
+
+    @classmethod
+    def load(
+        cls, file_path: Path, level: Optional[int] = None
+    ) -> Optional["SidecarIndex"]:
+        """Load the sidecar index of an image.
+
+        Args:
+            file_path: Path to the image.
+            level: Resolution level of the image. *Defaults to None.*
+
+        Returns:
+            The sidecar index, or None if the sidecar does not exist or is stale.
+        """
+        index_path = cls.path(file_path, level)
+        if not index_path.exists():
+            return None
+
+        try:
+            with open(index_path, "rb") as fr:
+                magic, header_size = struct.unpack("<8sQ", fr.read(16))
+                if magic != cls._MAGIC:
+                    raise ValueError("not a bfio sidecar index")
+                header = json.loads(fr.read(header_size).decode("utf-8"))
+        except (OSError, ValueError, struct.error) as err:
+            cls.logger.warning(f"load(): Ignoring invalid sidecar {index_path}: {err}")
+            return None
+
+        if (
+            header.get("version") != cls._VERSION
+            or header.get("level") != level
+            or any(header.get(k) != v for k, v in cls._file_stats(file_path).items())
+        ):
+            cls.logger.debug(f"load(): Sidecar {index_path} is out of date.")
+            return None
+
+        data = numpy.memmap(
+            index_path,
+            dtype="<u8",
+            mode="r",
+            offset=header["data_offset"],
+            shape=(2,) + tuple(header["shape"]),
+        )
+
+        return cls(header, data[0], data[1])
+
+    @classmethod
+    def write(
+        cls,
+        file_path: Path,
+        level: Optional[int],
+        dims: Dict[str, int],
+        dtype: numpy.dtype,
+        ome_xml: str,
+        page_offset: int,
+        dataoffsets: numpy.ndarray,
+        databytecounts: numpy.ndarray,
+    ) -> "SidecarIndex":
+        """Write the sidecar index of an image.
+
+        The sidecar is written to a temporary file first and then moved into
+        place, so concurrent readers never load a partially written index.
+
+        Args:
+            file_path: Path to the image.
+            level: Resolution level of the image.
+            dims: Image dimensions, keyed by ``X``, ``Y``, ``Z``, ``C`` and ``T``.
+            dtype: Pixel data type.
+            ome_xml: OME XML of the image.
+            page_offset: File offset of the first page of the resolution level.
+            dataoffsets: Tile offsets of each page, shape ``(pages, tiles)``.
+            databytecounts: Tile bytecounts of each page, shape ``(pages, tiles)``.
+
+        Returns:
+            The sidecar index.
+        """
+        header = {
+            "version": cls._VERSION,
+            "level": level,
+            "dims": {k: int(v) for k, v in dims.items()},
+            "dtype": numpy.dtype(dtype).str,
+            "shape": list(dataoffsets.shape),
+            "ome_xml": ome_xml,
+            "page_offset": int(page_offset),
+        }
+        header.update(cls._file_stats(file_path))
+
+        # The data offset depends on the header length, so update it until stable
+        header["data_offset"] = 0
+        while True:
+            header_bytes = json.dumps(header).encode("utf-8")
+            data_offset = 16 + len(header_bytes)
+            data_offset += (cls._ALIGNMENT - data_offset % cls._ALIGNMENT) % (
+                cls._ALIGNMENT
+            )
+            if data_offset == header["data_offset"]:
+                break
+            header["data_offset"] = data_offset
+
+        data = numpy.stack([dataoffsets, databytecounts]).astype("<u8")
+
+        index_path = cls.path(file_path, level)
+        tmp_path = index_path.with_name(index_path.name + f".{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as fw:
+            fw.write(struct.pack("<8sQ", cls._MAGIC, len(header_bytes)))
+            fw.write(header_bytes)
+            fw.write(b"\0" * (data_offset - fw.tell()))
+            fw.write(data.tobytes())
+        os.replace(tmp_path, index_path)
+
+        return cls(header, data[0], data[1])
+
 
 class PythonReader(bfio.base_classes.AbstractReader):
     logger = logging.getLogger("bfio.backends.PythonReader")
 
     _rdr: tifffile.TiffFile = None
-    _offsets_bytes = None
+    _dataoffsets: numpy.ndarray = None
+    _databytecounts: numpy.ndarray = None
+    _tile_cache: TileCache = None
+    _memmap: numpy.memmap = None
+    _memmap_checked: bool = False
+    _sidecar: SidecarIndex = None
     _STATE_DICT = ["_metadata", "frontend"]
 
     def __init__(self, frontend):
         super().__init__(frontend)
 
+        if self.frontend._cache_size:
+            self._tile_cache = TileCache(self.frontend._cache_size)
+
         self.logger.debug("__init__(): Initializing _rdr (tifffile.TiffFile)...")
         self._rdr = tifffile.TiffFile(self.frontend._file_path)
+
+        # A valid sidecar index was validated when it was written
+        if self.frontend._sidecar_index and self._load_sidecar(
+            self.frontend._file_path, self.frontend.level
+        ):
+            self._rdr.filehandle.close()
+            return
+
         if self._rdr.ome_metadata is None:
             raise TypeError(
                 "No OME metadata detected, use the java backend to read this file."
@@ -119,43 +809,111 @@ class PythonReader(bfio.base_classes.AbstractReader):
                 + "Use the java backend to read this image."
             )
 
+        if self.frontend._sidecar_index:
+            self._write_sidecar()
+
         # Close the reader until we need it
         self._rdr.filehandle.close()
 
+    def _load_sidecar(self, file_path: Path, level: Optional[int]) -> bool:
+        """Load the tile index and dimensions from a sidecar index.
+
+        Args:
+            file_path: Path to the image.
+            level: Resolution level of the image.
+
+        Returns:
+            True if a valid sidecar index was found.
+        """
+        sidecar = SidecarIndex.load(file_path, level)
+        if sidecar is None:
+            return False
+
+        self.logger.debug("_load_sidecar(): Loaded sidecar index.")
+        self._sidecar = sidecar
+        self._dataoffsets = sidecar.dataoffsets
+        self._databytecounts = sidecar.databytecounts
+
+        # Only the first page of a level is needed once the tiles are indexed,
+        # so it is read from its offset instead of parsing the series
+        self._rdr_pages = self._rdr.pages
+        if level is not None:
+            self._rdr.filehandle.seek(sidecar.page_offset)
+            self._rdr_pages = [tifffile.TiffPage(self._rdr, index=0)]
+
+        return True
+
+    def _write_sidecar(self):
+        """Index the tile offsets and save them with the metadata in a sidecar."""
+        self._build_page_index()
+        pixels = self._metadata.images[0].pixels
+        try:
+            self._sidecar = SidecarIndex.write(
+                self.frontend._file_path,
+                self.frontend.level,
+                {
+                    "X": pixels.size_x,
+                    "Y": pixels.size_y,
+                    "Z": pixels.size_z,
+                    "C": pixels.size_c,
+                    "T": pixels.size_t,
+                },
+                numpy.dtype(self.frontend._DTYPE[pixels.type.value]).newbyteorder(
+                    ">" if pixels.big_endian else "<"
+                ),
+                self._rdr.ome_metadata,
+                self._rdr_pages[0].offset,
+                self._dataoffsets,
+                self._databytecounts,
+            )
+        except OSError as err:
+            self.logger.warning(f"_write_sidecar(): Could not write sidecar: {err}")
+
     def __getstate__(self) -> Dict:
         state_dict = {n: getattr(self, n) for n in self._STATE_DICT}
         state_dict.update({"file_path": self.frontend._file_path})
         state_dict.update({"level": self.frontend.level})
+        state_dict.update({"cache_size": self.frontend._cache_size})
+        state_dict.update({"sidecar_index": self._sidecar is not None})
 
         return state_dict
 
     def __setstate__(self, state) -> None:
         for k, v in state.items():
-            if k == "file_path" or k == "level":
+            if k in ["file_path", "level", "cache_size", "sidecar_index"]:
                 pass
             else:
                 setattr(self, k, v)
 
         self._lock = threading.Lock()
+        if state.get("cache_size"):
+            self._tile_cache = TileCache(state["cache_size"])
         self._rdr = tifffile.TiffFile(state["file_path"])
-        self._rdr_pages = self._rdr.pages
-        if state["level"] is not None:
-            if len(self._rdr.series) != 0:
-                series = self._rdr.series[0]
-                self._rdr_pages = series.levels[state["level"]]
+        # The frontend may not be restored yet, so paths are taken from the state
+        if not (
+            state.get("sidecar_index")
+            and self._load_sidecar(Path(state["file_path"]), state["level"])
+        ):
+            self._rdr_pages = self._rdr.pages
+            if state["level"] is not None:
+                if len(self._rdr.series) != 0:
+                    series = self._rdr.series[0]
+                    self._rdr_pages = series.levels[state["level"]]
         self._rdr.filehandle.close()
 
     def read_metadata(self):
         self.logger.debug("read_metadata(): Reading metadata...")
 
         if self._metadata is None:
+            if self._sidecar is None:
+                ome_xml = self._rdr.ome_metadata
+            else:
+                ome_xml = self._sidecar.ome_xml
             try:
-                self._metadata = ome_types.from_xml(
-                    self._rdr.ome_metadata, validate=False
-                )
+                self._metadata = ome_types.from_xml(ome_xml, validate=False)
             except (ET.ParseError, ValueError):
                 if self.frontend.clean_metadata:
-                    cleaned = clean_ome_xml_for_known_issues(self._rdr.ome_metadata)
+                    cleaned = clean_ome_xml_for_known_issues(ome_xml)
                     self._metadata = ome_types.from_xml(cleaned, validate=False)
                     self.logger.warning(
                         "read_metadata(): OME XML required reformatting."
@@ -163,89 +921,172 @@ class PythonReader(bfio.base_classes.AbstractReader):
                 else:
                     raise
 
-        return self._metadata
+            # sub-resolution dimensions are stored in the sidecar
+            if self._sidecar is not None:
+                pixels = self._metadata.images[0].pixels
+                pixels.size_x = self._sidecar.dims["X"]
+                pixels.size_y = self._sidecar.dims["Y"]
 
-    class _TiffBytesOffsets:
-        def __init__(self, parent, index):
-            self._tiff_frame = tifffile.TiffFrame(parent, index)
-
-        def get_offset(self):
-            return self._tiff_frame._nextifd()
-
-        def get_index(self):
-            return self._tiff_frame.index
+        return self._metadata
 
-        def get_dataoffsets(self):
-            return self._tiff_frame.dataoffsets
+    def _build_page_index(self):
+        """Build arrays of the tile offsets and bytecounts of every page.
 
-        def get_databytecounts(self):
-            return self._tiff_frame.databytecounts
+        The index is built once, on the first read, by walking the IFDs
+        sequentially. Subsequent reads look up any page in constant time.
+        """
+        self.logger.debug("_build_page_index(): Indexing tile offsets...")
+        keyframe = self._rdr_pages[0]
+        pixels = self._metadata.images[0].pixels
+        num_pages = pixels.size_z * pixels.size_c * pixels.size_t
+        num_tiles = len(keyframe.dataoffsets)
 
-    def _page_offsets_bytes(self, index: int):
-        if index == 0:
-            return self._rdr_pages[0].dataoffsets, self._rdr_pages[0].databytecounts
-        parent = self._rdr
+        dataoffsets = numpy.zeros((num_pages, num_tiles), dtype=numpy.uint64)
+        databytecounts = numpy.zeros((num_pages, num_tiles), dtype=numpy.uint64)
+        dataoffsets[0] = keyframe.dataoffsets
+        databytecounts[0] = keyframe.databytecounts
 
-        if self._offsets_bytes is None or self._offsets_bytes.get_index() + 1 != index:
-            self._rdr.pages._seek(int(index))
-        else:
-            self._rdr.filehandle.seek(self._offsets_bytes.get_offset())
-
-        obc = self._TiffBytesOffsets(parent, index)
-        self._offsets_bytes = obc
-        return obc.get_dataoffsets(), obc.get_databytecounts()
+        if self.frontend.level is not None:
+            # pages of a sub-resolution level are indexed by the series
+            for index in range(1, num_pages):
+                page = self._rdr_pages[index]
+                dataoffsets[index] = page.dataoffsets
+                databytecounts[index] = page.databytecounts
+        elif num_pages > 1:
+            self._rdr.pages._seek(1)
+            for index in range(1, num_pages):
+                frame = tifffile.TiffFrame(self._rdr, index)
+                dataoffsets[index] = frame.dataoffsets
+                databytecounts[index] = frame.databytecounts
+                if index + 1 < num_pages:
+                    self._rdr.filehandle.seek(frame._nextifd())
+
+        self._dataoffsets = dataoffsets
+        self._databytecounts = databytecounts
 
     def _chunk_indices(self, X, Y, Z, C=[0], T=[0]):
         self.logger.debug(f"_chunk_indices(): (X,Y,Z,C,T) -> ({X},{Y},{Z},{C},{T})")
         assert all(len(D) == 2 for D in [X, Y, Z])
         assert all(isinstance(D, list) for D in [C, T])
 
-        offsets = []
-        bytecounts = []
+        if self._dataoffsets is None:
+            self._build_page_index()
 
         ts = self.frontend._TILE_SIZE
 
         x_tiles = numpy.arange(X[0] // ts, numpy.ceil(X[1] / ts), dtype=int)
+        y_tiles = numpy.arange(Y[0] // ts, numpy.ceil(Y[1] / ts), dtype=int)
         y_tile_stride = numpy.ceil(self.frontend.x / ts).astype(int)
+        tiles = (y_tiles[:, None] * y_tile_stride + x_tiles[None, :]).ravel()
+
+        pages = numpy.asarray(
+            [
+                self.frontend.Z * (self.frontend.C * t + c) + z
+                for t in T
+                for c in C
+                for z in range(Z[0], Z[1])
+            ],
+            dtype=int,
+        )
+
+        offsets = self._dataoffsets[numpy.ix_(pages, tiles)].ravel().tolist()
+        bytecounts = self._databytecounts[numpy.ix_(pages, tiles)].ravel().tolist()
+        keys = [(p, t) for p in pages.tolist() for t in tiles.tolist()]
+
+        return offsets, bytecounts, keys
+
+    def _open_memmap(self) -> bool:
+        """Memory map the file if its tiles are stored uncompressed.
+
+        Uncompressed tiles can be viewed directly in the memory map, so reads
+        skip the segment reader and the decoder entirely.
+
+        Returns:
+            True if tiles can be read from the memory map.
+        """
+        if self._memmap_checked:
+            return self._memmap is not None
+        self._memmap_checked = True
+
+        keyframe = self._rdr_pages[0].keyframe
+        if (
+            keyframe.compression != tifffile.COMPRESSION.NONE
+            or keyframe.predictor != tifffile.PREDICTOR.NONE
+            or keyframe.fillorder != tifffile.FILLORDER.MSB2LSB
+            or keyframe.samplesperpixel != 1
+            or keyframe.tiledepth != 1
+            or keyframe.dtype is None
+            or keyframe.bitspersample != 8 * keyframe.dtype.itemsize
+        ):
+            return False
 
-        for t in T:
-            t_index = self.frontend.Z * self.frontend.C * t
-            for c in C:
-                c_index = t_index + self.frontend.Z * c
-                for z in range(Z[0], Z[1]):
-                    index = z + c_index
+        # sparse tiles (zero bytecount) must go through the decoder
+        tile_bytes = keyframe.tilelength * keyframe.tilewidth * keyframe.dtype.itemsize
+        if not numpy.all(numpy.asarray(self._databytecounts) == tile_bytes):
+            return False
 
-                    dataoffsets, databytecounts = self._page_offsets_bytes(index)
-                    for y in range(Y[0] // ts, int(numpy.ceil(Y[1] / ts))):
-                        y_offset = int(y * y_tile_stride)
-                        ind = (x_tiles + y_offset).tolist()
+        self.logger.debug("_open_memmap(): Reading uncompressed tiles in place.")
+        self._memmap_dtype = keyframe.dtype.newbyteorder(self._rdr.byteorder)
+        self._memmap_shape = (1, keyframe.tilelength, keyframe.tilewidth, 1)
+        self._memmap = numpy.memmap(self.frontend._file_path, numpy.uint8, "r")
 
-                        o = [dataoffsets[i] for i in ind]
-                        b = [databytecounts[i] for i in ind]
+        return True
 
-                        offsets.extend(o)
-                        bytecounts.extend(b)
+    def _mapped_tile(self, offset: int) -> numpy.ndarray:
+        return numpy.ndarray(
+            self._memmap_shape, self._memmap_dtype, self._memmap, int(offset)
+        )
 
-        return offsets, bytecounts
+    def _process_mapped_chunk(self, args):
+        index, offset = args
+        self._copy_tile(self._mapped_tile(offset), index)
 
     def _process_chunk(self, args):
         keyframe = self._keyframe
-        out = self._image
-
-        w, l, d, c, t = self._tile_indices[args[1]]
 
         # copy decoded segments to output array
         segment, _, shape = keyframe.decode(*args)
 
         if segment is None:
             segment = keyframe.nodata
+        elif self._tile_cache is not None:
+            self._tile_cache.put(self._tile_keys[args[1]], segment)
 
         self.logger.debug("_process_chunk(): shape = {}".format(shape))
-        self.logger.debug(
-            "_process_chunk(): (w,l,d) = {},{},{}".format(w[0], l[0], d[0])
-        )
 
-        if self.load_tiles:
+        self._copy_tile(segment, args[1])
+
+    def _crop_tile(self, segment, out, region, y, x, plane):
+        """Copy the part of the tile at (y, x) that is inside a region.
+
+        Args:
+            segment: The decoded tile, or a scalar fill value for empty tiles.
+            out: The (Y, X, Z, C, T) output of the region.
+            region: The absolute (Y, X) bounds of the region.
+            y: The absolute y-position of the tile.
+            x: The absolute x-position of the tile.
+            plane: The (Z, C, T) index of the tile in the output.
+        """
+        ts = self.frontend._TILE_SIZE
+        (Y0, Y1), (X0, X1) = region
+        y0, y1 = max(y, Y0), min(y + ts, Y1)
+        x0, x1 = max(x, X0), min(x + ts, X1)
+        target = out[(slice(y0 - Y0, y1 - Y0), slice(x0 - X0, x1 - X0)) + plane]
+        if numpy.ndim(segment) == 0:
+            target[:] = segment
+        else:
+            target[:] = segment[0, y0 - y : y1 - y, x0 - x : x1 - x, 0]
+
+    def _copy_tile(self, segment, index):
+        out = self._image
+
+        w, l, d, c, t = self._tile_indices[index]
+
+        self.logger.debug("_copy_tile(): (w,l,d) = {},{},{}".format(w[0], l[0], d[0]))
+
+        if self._region is not None:
+            self._crop_tile(segment, out, self._region, l[1], w[1], (d[0], c[0], t[0]))
+        elif self.load_tiles:
             width = out.shape[6]
             height = out.shape[5]
             out[
@@ -267,38 +1108,274 @@ class PythonReader(bfio.base_classes.AbstractReader):
     def _read_image(self, X, Y, Z, C, T, output):
         # Get keyframe
         self._keyframe = self._rdr_pages[0].keyframe
-        # Open the file
+        # Open the file if needed, it stays open until the reader is closed
         fh = self._rdr_pages[0].parent.filehandle
-        # fh = self._rdr.series[0].levels[0].parent.filehandle
         fh.open()
 
         # Set tile size if request size is < _TILE_SIZE for efficiency
-        self._TILE_SIZE = (
-            min(self._image.shape[-2], self.frontend._TILE_SIZE),
-            min(self._image.shape[-1], self.frontend._TILE_SIZE),
-        )
+        if self._region is not None:
+            self._TILE_SIZE = (self.frontend._TILE_SIZE, self.frontend._TILE_SIZE)
+        else:
+            self._TILE_SIZE = (
+                min(self._image.shape[-2], self.frontend._TILE_SIZE),
+                min(self._image.shape[-1], self.frontend._TILE_SIZE),
+            )
 
         # Get binary data info
-        offsets, bytecounts = self._chunk_indices(X, Y, Z, C, T)
+        offsets, bytecounts, self._tile_keys = self._chunk_indices(X, Y, Z, C, T)
+        indices = list(range(len(offsets)))
 
         self.logger.debug("read_image(): _tile_indices = {}".format(self._tile_indices))
 
-        if self.frontend._max_workers > 1:
-            with ThreadPoolExecutor(self.frontend._max_workers) as executor:
-                # cast to list so that any read errors are raised
+        # Uncompressed tiles are copied straight out of the memory map
+        if self._open_memmap():
+            if self.frontend._max_workers > 1:
                 list(
-                    executor.map(
-                        self._process_chunk, fh.read_segments(offsets, bytecounts)
+                    self._get_executor().map(
+                        self._process_mapped_chunk, enumerate(offsets)
                     )
                 )
+            else:
+                for args in enumerate(offsets):
+                    self._process_mapped_chunk(args)
+            return
+
+        # Copy cached tiles, and only read the tiles that were not cached
+        if self._tile_cache is not None:
+            misses = []
+            for index, key in enumerate(self._tile_keys):
+                segment = self._tile_cache.get(key)
+                if segment is None:
+                    misses.append(index)
+                else:
+                    self._copy_tile(segment, index)
+            offsets = [offsets[i] for i in misses]
+            bytecounts = [bytecounts[i] for i in misses]
+            indices = misses
+
+        if self.frontend._max_workers > 1 and self.frontend._executor_type == "process":
+            self._decode_in_processes(offsets, bytecounts, indices, self._store_tile)
+        elif self.frontend._max_workers > 1:
+            # cast to list so that any read errors are raised
+            list(
+                self._get_executor().map(
+                    self._process_chunk,
+                    fh.read_segments(offsets, bytecounts, indices),
+                )
+            )
         else:
-            for args in fh.read_segments(offsets, bytecounts):
+            for args in fh.read_segments(offsets, bytecounts, indices):
                 self._process_chunk(args)
 
-        # Close the file
-        fh.close()
+    def _store_tile(self, index, segment):
+        """Cache a tile decoded by a worker process and copy it to the output."""
+        if self._tile_cache is not None and numpy.ndim(segment) > 0:
+            self._tile_cache.put(self._tile_keys[index], segment.copy())
+        self._copy_tile(segment, index)
+
+    def _get_tile_pool(self) -> TileProcessPool:
+        """Get the process pool used to decode tiles when executor="process".
+
+        Like the thread pool, it is created on first use and lives as long as
+        the reader.
+        """
+        if (
+            self._tile_pool is not None
+            and self._tile_pool.max_workers != self.frontend._max_workers
+        ):
+            self._tile_pool.shutdown()
+            self._tile_pool = None
+        if self._tile_pool is None:
+            keyframe = self._rdr_pages[0].keyframe
+            self._tile_pool = TileProcessPool(
+                self.frontend._max_workers,
+                (keyframe.tilelength, keyframe.tilewidth),
+                keyframe.dtype,
+                _open_tiff_worker,
+                (str(self.frontend._file_path), self.frontend.level),
+            )
+        return self._tile_pool
+
+    def _decode_in_processes(self, offsets, bytecounts, indices, consume):
+        """Read and decode tiles in worker processes.
+
+        Args:
+            offsets: File offsets of the tiles.
+            bytecounts: Compressed sizes of the tiles.
+            indices: An index for each tile, passed on to ``consume``.
+            consume: Called as ``consume(index, segment)`` in this process for
+                every decoded tile. ``segment`` is only valid during the call.
+        """
+        pool = self._get_tile_pool()
+        nodata = self._rdr_pages[0].keyframe.nodata
+
+        def after(slot, index, decoded):
+            if decoded:
+                consume(index, pool.buffer[slot][None, :, :, None])
+            else:
+                consume(index, nodata)
+
+        tasks = (
+            ((int(offset), int(bytecount), index), index)
+            for offset, bytecount, index in zip(offsets, bytecounts, indices)
+        )
+        pool.run(_decode_tile, tasks, after=after)
+
+    def read_regions(self, regions):
+        """Read many regions, reading and decoding each tile only once.
+
+        Tiles needed by several regions are decoded once and cropped into
+        every region that overlaps them. The reader is only locked while the
+        compressed tiles are read from the file, so several threads can decode
+        regions at once.
+
+        Args:
+            regions: A list of (X, Y, Z, C, T, output) tuples, where X and Y are
+                the absolute bounds of a region and output is the
+                (Y, X, Z, C, T) array to copy the region into.
+        """
+        ts = self.frontend._TILE_SIZE
+        y_tile_stride = -(-self.frontend.X // ts)
+
+        # Map every tile to the regions that overlap it
+        targets = {}
+        for X, Y, Z, C, T, output in regions:
+            region = (Y, X)
+            for ti, t in enumerate(T):
+                for ci, c in enumerate(C):
+                    for zi, z in enumerate(range(Z[0], Z[1])):
+                        page = self.frontend.Z * (self.frontend.C * t + c) + z
+                        for y in range(Y[0] - Y[0] % ts, Y[1], ts):
+                            for x in range(X[0] - X[0] % ts, X[1], ts):
+                                key = (page, (y // ts) * y_tile_stride + x // ts)
+                                targets.setdefault(key, []).append(
+                                    (output, region, y, x, (zi, ci, ti))
+                                )
+        keys = list(targets)
+
+        def scatter(key, segment):
+            for output, region, y, x, plane in targets[key]:
+                self._crop_tile(segment, output, region, y, x, plane)
+
+        # Only the file handle and the indices of the reader are shared, so the
+        # lock is released before tiles are decoded and regions can be read by
+        # many threads at once
+        with self._lock:
+            keyframe = self._rdr_pages[0].keyframe
+            fh = self._rdr_pages[0].parent.filehandle
+            fh.open()
+            if self._dataoffsets is None:
+                self._build_page_index()
+            executor = self._get_executor() if self.frontend._max_workers > 1 else None
+
+            if self._open_memmap():
+
+                def process(key):
+                    scatter(key, self._mapped_tile(self._dataoffsets[key]))
+
+                args = keys
+            else:
+                # Copy cached tiles, and only read the tiles that were not cached
+                if self._tile_cache is not None:
+                    misses = []
+                    for key in keys:
+                        segment = self._tile_cache.get(key)
+                        if segment is None:
+                            misses.append(key)
+                        else:
+                            scatter(key, segment)
+                    keys = misses
+
+                offsets = [int(self._dataoffsets[key]) for key in keys]
+                bytecounts = [int(self._databytecounts[key]) for key in keys]
+                indices = list(range(len(keys)))
+
+                if (
+                    self.frontend._max_workers > 1
+                    and self.frontend._executor_type == "process"
+                ):
+
+                    def consume(index, segment):
+                        if self._tile_cache is not None and numpy.ndim(segment) > 0:
+                            self._tile_cache.put(keys[index], segment.copy())
+                        scatter(keys[index], segment)
+
+                    self._decode_in_processes(offsets, bytecounts, indices, consume)
+                    return
+
+                def process(args):
+                    segment, _, _ = keyframe.decode(*args)
+                    index = args[1]
+                    if segment is None:
+                        segment = keyframe.nodata
+                    elif self._tile_cache is not None:
+                        self._tile_cache.put(keys[index], segment)
+                    scatter(keys[index], segment)
+
+                args = list(fh.read_segments(offsets, bytecounts, indices))
+
+        if executor is not None:
+            # cast to list so that any read errors are raised
+            list(executor.map(process, args))
+        else:
+            for arg in args:
+                process(arg)
+
+    def tile_grid(self, index: int) -> numpy.ndarray:
+        """Return a read-only view of the tiles of one page.
+
+        Args:
+            index: The page index, ``Z + frontend.Z * (C + frontend.C * T)``.
+
+        Returns:
+            A memory mapped array with shape ``(tiles_y, tiles_x, tile, tile)``.
+
+        Raises:
+            ValueError: If the tiles are compressed or not stored contiguously
+                in raster order.
+        """
+        with self._lock:
+            self._rdr_pages[0].parent.filehandle.open()
+            if self._dataoffsets is None:
+                self._build_page_index()
+            if not self._open_memmap():
+                raise ValueError(
+                    "The tile grid can only be memory mapped for uncompressed "
+                    + "tiled images."
+                )
+
+        offsets = numpy.asarray(self._dataoffsets[index], dtype=numpy.int64)
+        tile_bytes = self._memmap_shape[1] * self._memmap_shape[2]
+        tile_bytes *= self._memmap_dtype.itemsize
+        if len(offsets) > 1 and not numpy.all(numpy.diff(offsets) == tile_bytes):
+            raise ValueError(
+                "The tiles of page {} are not stored contiguously.".format(index)
+            )
+
+        ts_y, ts_x = self._memmap_shape[1:3]
+        shape = (
+            int(numpy.ceil(self.frontend.Y / ts_y)),
+            int(numpy.ceil(self.frontend.X / ts_x)),
+            ts_y,
+            ts_x,
+        )
+        return numpy.ndarray(shape, self._memmap_dtype, self._memmap, int(offsets[0]))
+
+    def cache_info(self):
+        """Return the tile cache statistics, or None if caching is disabled."""
+        if self._tile_cache is None:
+            return None
+        return self._tile_cache.info()
+
+    def cache_clear(self):
+        """Remove all decoded tiles from the tile cache."""
+        if self._tile_cache is not None:
+            self._tile_cache.clear()
 
     def close(self):
+        self._shutdown_executor()
+        self._memmap = None
+        self._memmap_checked = False
         if self._rdr is not None:
             self._rdr.close()
 
@@ -316,6 +1393,7 @@ class TiffIFDHeader:
     ifdsize: int = 0
     descriptionoffset: int
     descriptionlenoffset: int
+    subifdsoffset: Optional[Tuple] = None
     _ifdstart: int = 8
     _ifdpos = 0
     _value = None
@@ -368,6 +1446,13 @@ class TiffIFDHeader:
         self.ifd.write(self._pack(self.offsetformat, pos))
         self.ifd.seek(self.ifdsize)
 
+    def set_subifds(self, positions):
+        offset, pos = self.subifdsoffset
+        self.ifd.seek(offset if pos is None else pos)
+        for position in positions:
+            self.ifd.write(self._pack(self.offsetformat, position))
+        self.ifd.seek(self.ifdsize)
+
 
 class TiffIFDHeaders(object):
     tags: List[Tuple] = []
@@ -388,6 +1473,21 @@ class TiffIFDHeaders(object):
             for _ in range(self.page_count)
         ]
 
+        # sub-resolution levels of each page are stored in SubIFDs
+        self.levels = writer._levels
+        self.subheaders = [
+            [
+                TiffIFDHeader(
+                    level.numtiles,
+                    level.bytecountformat,
+                    self.tiff.offsetformat,
+                    self.tiff.byteorder,
+                )
+                for level in self.levels
+            ]
+            for _ in range(self.page_count)
+        ]
+
         # Generate the first header
         self._generate_page(0)
 
@@ -424,16 +1524,28 @@ class TiffIFDHeaders(object):
         return self.headers[index]
 
     def _generate_page(self, index):
+        header = self.headers[index]
+        self._generate_ifd(header, self.tags)
+
+        # the sub-resolution levels follow the page they belong to
+        if self.levels:
+            positions = []
+            for subheader, level in zip(self.subheaders[index], self.levels):
+                positions.append(self._ifdpos)
+                self._generate_ifd(subheader, level.tags)
+                subheader.set_next_ifd(0)
+            header.set_subifds(positions)
+            header.set_next_ifd(self._ifdpos)
+
+    def _generate_ifd(self, header, tags):
         tagnoformat = self.tiff.tagnoformat
         offsetformat = self.tiff.offsetformat
         offsetsize = self.tiff.offsetsize
         tagsize = self.tiff.tagsize
         tagbytecounts = 325
         tagoffsets = 324
-        tags = self.tags
 
         # create IFD in memory, do not write to disk
-        header = self.headers[index]
         header._ifdstart = self._ifdpos
         header.ifd.write(self._pack(tagnoformat, len(tags)))
         tagoffset = header.ifd.tell()
@@ -465,6 +1577,9 @@ class TiffIFDHeaders(object):
                 elif code == tagbytecounts:
                     header.databytecountsoffset = offset, pos
 
+                elif code == 330:
+                    header.subifdsoffset = offset, pos
+
                 elif code == 270 and value.endswith(b"\0\0\0\0"):
                     # image description buffer
                     header.descriptionoffset = self._ifdpos + pos
@@ -478,6 +1593,9 @@ class TiffIFDHeaders(object):
             elif code == tagbytecounts:
                 header.databytecountsoffset = offset, None
 
+            elif code == 330:
+                header.subifdsoffset = offset, None
+
         header.ifdsize = header.ifd.tell()
         if header.ifdsize % 2:
             header.ifd.write(b"\0")
@@ -490,7 +1608,7 @@ class TiffIFDHeaders(object):
         header.set_next_ifd(self._ifdpos)
 
     def __len__(self):
-        return sum(self[i].ifdsize for i in range(len(self.headers)))
+        return sum(header.ifdsize for header in self.headers + sum(self.subheaders, []))
 
 
 class PythonWriter(bfio.base_classes.AbstractWriter):
@@ -628,6 +1746,8 @@ class PythonWriter(bfio.base_classes.AbstractWriter):
             f"Image:{Path(self.frontend._file_path).name}"
         )
 
+        # sub-resolution levels add up to a third of the full resolution size
+        pyramid_size = 4 / 3 if self.frontend._pyramid_levels > 0 else 1
         if (
             self.frontend.X
             * self.frontend.Y
@@ -635,6 +1755,7 @@ class PythonWriter(bfio.base_classes.AbstractWriter):
             * self.frontend.C
             * self.frontend.T
             * self.frontend.bpp
+            * pyramid_size
             > 2**31
         ):
             big_tiff = True
@@ -661,7 +1782,18 @@ class PythonWriter(bfio.base_classes.AbstractWriter):
 
         offsetsize = self._writer.tiff.offsetsize
 
-        self._compresstag = tifffile.COMPRESSION.ADOBE_DEFLATE
+        compression = self.frontend._compression
+        self._compresstag = TIFF_COMPRESSIONS[compression][0]
+        self._predictortag = tifffile.PREDICTOR.NONE.value
+        if self.frontend._predictor:
+            self._predictortag = tiff_predictor(compression, self._datadtype)
+        self._encoder_args = (
+            compression,
+            self.frontend._compression_level,
+            self._predictortag,
+        )
+        # (offset, bytecount) of the tiles written for each constant value
+        self._constant_tiles = {}
 
         # normalize data shape to 5D or 6D, depending on volume:
         #   (pages, planar_samples, height, width, contig_samples)
@@ -688,6 +1820,8 @@ class PythonWriter(bfio.base_classes.AbstractWriter):
         self._addtag(305, "s", 0, f"bfio v{version}")  # Software
         # addtag(306, 's', 0, datetime, writeonce=True)
         self._addtag(259, "H", 1, self._compresstag)  # Compression
+        if self._predictortag != tifffile.PREDICTOR.NONE:
+            self._addtag(317, "H", 1, self._predictortag)  # Predictor
         self._addtag(256, "I", 1, self._datashape[-2])  # ImageWidth
         self._addtag(257, "I", 1, self._datashape[-3])  # ImageLength
         self._addtag(322, "I", 1, self.frontend._TILE_SIZE)  # TileWidth
@@ -775,6 +1909,17 @@ class PythonWriter(bfio.base_classes.AbstractWriter):
         )
         self._bytecountformat = self._bytecountformat * self._numtiles
 
+        self._pyramid = None
+        self._levels = []
+        if self.frontend._pyramid_levels > 0:
+            self._addtag(
+                330,  # SubIFDs
+                18 if big_tiff else 13,
+                self.frontend._pyramid_levels,
+                [0] * self.frontend._pyramid_levels,
+            )
+            self._init_levels(bytecount_format)
+
         # the entries in an IFD must be sorted in ascending order by tag code
         self._tags = sorted(self._tags, key=lambda x: x[0])
 
@@ -805,6 +1950,88 @@ class PythonWriter(bfio.base_classes.AbstractWriter):
         fh.seek(skip, 1)
         self._dataoffset = headers_size + skip
 
+    def _init_levels(self, bytecount_format):
+        """Create the tags of the sub-resolution levels of the pyramid.
+
+        Each level halves the size of the previous one. Sub-resolution levels
+        are marked as reduced resolution images and have the same tile size and
+        pixel format as the full resolution image.
+        """
+        ts = self.frontend._TILE_SIZE
+        self._pyramid = TilePyramid(
+            (self.frontend.Y, self.frontend.X),
+            self.frontend._pyramid_levels,
+            ts,
+            self.frontend._downsample,
+        )
+        tags = self._tags
+        shared_tags = [
+            tag
+            for tag in tags
+            if tag[0] not in (256, 257, 270, 282, 283, 296, 305, 324, 325, 330)
+        ]
+
+        for (Y, X), tiles in zip(self._pyramid.shapes[1:], self._pyramid.tiles[1:]):
+            numtiles = tiles[0] * tiles[1]
+            bytecounts = [ts**2 * self._datadtype.itemsize] * numtiles
+            bytecountformat = bytecount_format(bytecounts)
+
+            self._tags = list(shared_tags)
+            self._addtag(254, "I", 1, 1)  # NewSubfileType = reduced resolution
+            self._addtag(256, "I", 1, X)  # ImageWidth
+            self._addtag(257, "I", 1, Y)  # ImageLength
+            self._addtag(self._tagbytecounts, bytecountformat, numtiles, bytecounts)
+            self._addtag(
+                self._tagoffsets,
+                self._writer.tiff.offsetformat,
+                numtiles,
+                [0] * numtiles,
+            )
+            self._levels.append(
+                PyramidLevel(
+                    Y,
+                    X,
+                    tiles,
+                    numtiles,
+                    bytecountformat * numtiles,
+                    sorted(self._tags, key=lambda x: x[0]),
+                )
+            )
+
+        self._tags = tags
+
+    def _reduce_tile(self, page_index, tile_index, tile):
+        """Add a full resolution tile to the pyramid.
+
+        Yields:
+            ``(header, tile_index, tile)`` for every tile of a sub-resolution
+            level that is complete and can be written.
+        """
+        if self._pyramid is None:
+            return
+        y, x = divmod(tile_index, self._tiles[1])
+        yield from self._level_tiles(self._pyramid.add(page_index, 0, y, x, tile))
+
+    def _level_tiles(self, tiles):
+        for page_index, level, y, x, tile in tiles:
+            yield (
+                self.headers.subheaders[page_index][level - 1],
+                y * self._levels[level - 1].tiles[1] + x,
+                tile,
+            )
+
+    def _flush_pyramid(self):
+        """Write the sub-resolution tiles that were only partly covered by writes.
+
+        Parts of these tiles that were not written are filled with zeros.
+        """
+        if self._pyramid is None:
+            return
+        for header, index, tile in self._level_tiles(self._pyramid.flush()):
+            self._put_tile(
+                header, index, *_encode_varying_tile(tile, *self._encoder_args)
+            )
+
     def iter_tiles(self, data, tile, tiles):
         """Return iterator over tiles in data array of normalized shape."""
         shape = data.shape
@@ -825,6 +2052,29 @@ class PythonWriter(bfio.base_classes.AbstractWriter):
                         ]
                         yield chunk
 
+    def _pending_tiles(self) -> int:
+        """Get the maximum number of tiles being encoded at once."""
+        if self.frontend._max_pending_tiles is not None:
+            return self.frontend._max_pending_tiles
+        return 2 * self.frontend._max_workers
+
+    def _get_tile_pool(self) -> TileProcessPool:
+        """Get the process pool used to encode tiles when executor="process"."""
+        if self._tile_pool is not None and (
+            self._tile_pool.max_workers != self.frontend._max_workers
+            or self._tile_pool.slots != self._pending_tiles()
+        ):
+            self._tile_pool.shutdown()
+            self._tile_pool = None
+        if self._tile_pool is None:
+            self._tile_pool = TileProcessPool(
+                self.frontend._max_workers,
+                (self.frontend._TILE_SIZE, self.frontend._TILE_SIZE),
+                self.frontend.dtype,
+                slots=self._pending_tiles(),
+            )
+        return self._tile_pool
+
     def _write_tiles(self, data, X, Y, Z, C, T):
         assert len(X) == 2 and len(Y) == 2
         if self.frontend._TILE_SIZE != 2**10:
@@ -834,8 +2084,6 @@ class PythonWriter(bfio.base_classes.AbstractWriter):
                 "X or Y positions are not on tile boundary, tile may save incorrectly"
             )
 
-        fh = self._writer.filehandle
-
         x_tiles = list(
             range(
                 X[0] // self.frontend._TILE_SIZE,
@@ -873,31 +2121,88 @@ class PythonWriter(bfio.base_classes.AbstractWriter):
                         )
                     )
 
-        def compress(page_index, tile_index, data, level=1):
-            return (page_index, tile_index, imagecodecs.deflate_encode(data, level))
+        def tiles_to_write():
+            # sub-resolution tiles are written as soon as they are complete
+            for page_index, tileiter in tileiters:
+                for tileindex, tile in zip(tiles, tileiter):
+                    yield self.headers[page_index], tileindex, tile
+                    yield from self._reduce_tile(page_index, tileindex, tile)
+
+        def compress(header, tile_index, data):
+            return (header, tile_index) + _encode_varying_tile(
+                data, *self._encoder_args
+            )
 
-        if self.frontend._max_workers > 1:
-            with ThreadPoolExecutor(max_workers=self.frontend._max_workers) as executor:
-                compressed_tiles = []
-                for page_index, tileiter in tileiters:
-                    for tileindex, tile in zip(tiles, tileiter):
-                        compressed_tiles.append(
-                            executor.submit(compress, page_index, tileindex, tile)
-                        )
+        if self.frontend._max_workers > 1 and self.frontend._executor_type == "process":
+            pool = self._get_tile_pool()
+
+            def tasks():
+                for item in tiles_to_write():
+                    yield self._encoder_args, item
+
+            def before(slot, item):
+                pool.buffer[slot] = item[2][..., 0]
+
+            def after(slot, item, result):
+                header, tileindex, _ = item
+                self._put_tile(header, tileindex, *result)
 
-                for thread in as_completed(compressed_tiles):
-                    page_index, tileindex, tile = thread.result()
-                    self.headers[page_index].databyteoffsets[tileindex] = fh.tell()
-                    fh.write(tile)
-                    self.headers[page_index].databytecounts[tileindex] = len(tile)
+            pool.run(_encode_tile, tasks(), before, after, ordered=True)
+
+        elif self.frontend._max_workers > 1:
+            # Tiles are written in the order they were submitted, so the file
+            # layout is the same as a serial write. Only a limited number of
+            # tiles are in flight, which bounds memory for large writes.
+            executor = self._get_executor()
+            window = self._pending_tiles()
+            pending = deque()
+            for header, tileindex, tile in tiles_to_write():
+                if len(pending) >= window:
+                    self._put_tile(*pending.popleft().result())
+                pending.append(executor.submit(compress, header, tileindex, tile))
+
+            while pending:
+                self._put_tile(*pending.popleft().result())
 
         else:
-            for page_index, tileiter in tileiters:
-                for tileindex, tile in zip(tiles, tileiter):
-                    _, _, t = compress(page_index, tileindex, tile)
-                    self.headers[page_index].databyteoffsets[tileindex] = fh.tell()
-                    fh.write(t)
-                    self.headers[page_index].databytecounts[tileindex] = len(t)
+            for header, tileindex, tile in tiles_to_write():
+                self._put_tile(*compress(header, tileindex, tile))
+
+    def _put_tile(self, header, tile_index, value, encoded):
+        """Write an encoded tile and record its offset and byte count.
+
+        Tiles whose pixels all have the same value are encoded and written only
+        the first time the value is seen. Later constant tiles with that value
+        point to the same bytes in the file.
+
+        Args:
+            header: The IFD header of the page or sub-resolution level the tile
+                belongs to.
+            tile_index: The index of the tile in the page.
+            value: The pixel value of a constant tile as bytes, or None.
+            encoded: The encoded tile, or None for a constant tile.
+        """
+        fh = self._writer.filehandle
+        if value is None:
+            offset = fh.tell()
+            fh.write(encoded)
+            bytecount = len(encoded)
+        elif value in self._constant_tiles:
+            offset, bytecount = self._constant_tiles[value]
+        else:
+            tile = numpy.full(
+                (self.frontend._TILE_SIZE, self.frontend._TILE_SIZE, 1),
+                numpy.frombuffer(value, self.frontend.dtype)[0],
+                self.frontend.dtype,
+            )
+            encoded = _tile_encoder(*self._encoder_args)(tile)
+            offset = fh.tell()
+            fh.write(encoded)
+            bytecount = len(encoded)
+            self._constant_tiles[value] = (offset, bytecount)
+
+        header.databyteoffsets[tile_index] = offset
+        header.databytecounts[tile_index] = bytecount
 
     def close(self):
         """close_image Close the image.
@@ -905,8 +2210,10 @@ class PythonWriter(bfio.base_classes.AbstractWriter):
         This function should be called when an image will no longer be written
         to. This allows for proper closing and organization of metadata.
         """
+        self._shutdown_executor()
         if self._writer is not None:
-            for header in self.headers:
+            self._flush_pyramid()
+            for header in self.headers.headers + sum(self.headers.subheaders, []):
                 self._writer.filehandle.seek(header._ifdstart)
                 self._writer.filehandle.write(header.getvalue())
             self._writer.filehandle.close()
@@ -993,6 +2300,10 @@ try:
             out = self._image
             interleaved = self.frontend.metadata.images[0].pixels.interleaved
 
+            # Bioformats reads arbitrary regions, so read the region directly
+            if self._region is not None:
+                Y, X = self._region
+
             self._prev_read_cached_loc = None
             self._cached_read_data = None
             for ti, t in enumerate(T):
@@ -1213,6 +2524,7 @@ except ModuleNotFoundError:
 try:
     import zarr
     from numcodecs import Blosc
+    from zarr.core.buffer import default_buffer_prototype
 
     def _list_zarr_children(path, child_type="array"):
         """Filesystem-based fallback for enumerating zarr v2 store children.
@@ -1238,6 +2550,23 @@ try:
                     children.append(child.name)
         return sorted(children)
 
+    def _group_by_shard(tile_indices, shards):
+        """Group tiles by the zarr chunk or shard that holds them.
+
+        Args:
+            tile_indices: Tile indices of a read or write, as stored in
+                ``_tile_indices``.
+            shards: The (T, C, Z, Y, X) chunk or shard shape.
+
+        Returns:
+            A list with the tile indices of every chunk or shard.
+        """
+        groups = {}
+        for dims in tile_indices:
+            key = tuple(d[1] // s for d, s in zip(dims[::-1], shards))
+            groups.setdefault(key, []).append(dims)
+        return list(groups.values())
+
     class ZarrReader(bfio.base_classes.AbstractReader):
         logger = logging.getLogger("bfio.backends.ZarrReader")
 
@@ -1415,48 +2744,78 @@ try:
 
                 return omexml
 
-        def _process_chunk(self, dims):
-            X, Y, Z, C, T = dims
+        def _read_plane(self, selection, out):
+            """Read a selection straight into a view of the output.
 
-            ts = self.frontend._TILE_SIZE
+            Zarr fetches and decodes all chunks covered by the selection
+            concurrently and copies each one into place, so neither per-tile
+            slicing nor a temporary copy of the data is needed.
+            """
+            self._rdr.get_basic_selection(
+                selection,
+                out=default_buffer_prototype().nd_buffer.from_numpy_array(out),
+            )
 
+        def _plane_reads(self, X, Y, Z, C, T, output, region):
+            """Get the selection and output view of every requested plane."""
             if self._axes_list == []:
                 self._get_axis_info()
 
-            # actual zarr array can be of 2-5D, but bfio interface
-            # is 5D
-            requested_slices = []
-            if "t" in self._axes_list:
-                requested_slices.append(slice(T[1], T[1] + 1))
-            if "c" in self._axes_list:
-                requested_slices.append(slice(C[1], C[1] + 1))
-            if "z" in self._axes_list:
-                requested_slices.append(slice(Z[1], Z[1] + 1))
-
-            requested_slices.append(slice(Y[1], Y[1] + ts))
-            requested_slices.append(slice(X[1], X[1] + ts))
-            data = self._rdr[tuple(requested_slices)].squeeze()
-            self._image[
-                Y[0] : Y[0] + data.shape[-2],
-                X[0] : X[0] + data.shape[-1],
-                Z[0],
-                C[0],
-                T[0],
-            ] = data
+            if region is not None:
+                (y0, y1), (x0, x1) = region
+            else:
+                y0, y1 = Y[0], min(Y[1], self._rdr.shape[-2])
+                x0, x1 = X[0], min(X[1], self._rdr.shape[-1])
+
+            # actual zarr array can be of 2-5D, but bfio interface is 5D, and
+            # axes missing from the array can only have index 0
+            reads = []
+            for ti, t in enumerate(T):
+                for ci, c in enumerate(C):
+                    index = {
+                        "t": t,
+                        "c": c,
+                        "z": slice(Z[0], Z[1]),
+                        "y": slice(y0, y1),
+                        "x": slice(x0, x1),
+                    }
+                    selection = tuple(index[axis] for axis in self._axes_list)
+                    out = output[: y1 - y0, : x1 - x0, :, ci, ti]
+                    if "z" in self._axes_list:
+                        out = out.transpose(2, 0, 1)
+                    else:
+                        out = out[:, :, 0]
+                    reads.append((selection, out))
+            return reads
 
         def _read_image(self, X, Y, Z, C, T, output):
-            if self.frontend._max_workers > 1:
-                with ThreadPoolExecutor(self.frontend._max_workers) as executor:
-                    executor.map(self._process_chunk, self._tile_indices)
+            reads = self._plane_reads(X, Y, Z, C, T, self._image, self._region)
+            if self.frontend._max_workers > 1 and len(reads) > 1:
+                # cast to list to wait for the reads and raise their errors
+                list(self._get_executor().map(lambda r: self._read_plane(*r), reads))
             else:
-                for args in self._tile_indices:
-                    self._process_chunk(args)
+                for selection, out in reads:
+                    self._read_plane(selection, out)
+
+        async def _aread_plane(self, selection, out):
+            out[...] = await self._rdr.async_array.getitem(selection)
+
+        async def aread_image(self, X, Y, Z, C, T, output, region=None):
+            """Read an image on the running event loop.
+
+            Unlike ``read_image``, no state is kept on the backend and no lock is
+            taken, so any number of reads can await zarr's asynchronous API
+            concurrently.
+            """
+            reads = self._plane_reads(X, Y, Z, C, T, output, region)
+            await asyncio.gather(*(self._aread_plane(*r) for r in reads))
 
         def close(self):
-            pass
+            self._shutdown_executor()
 
     class ZarrWriter(bfio.base_classes.AbstractWriter):
         logger = logging.getLogger("bfio.backends.ZarrWriter")
+        _pyramid = None
 
         def __init__(self, frontend):
             super().__init__(frontend)
@@ -1473,18 +2832,11 @@ try:
                   In the future, it may be reasonable to not enforce read-only
 
             """
+            self._init_pyramid()
             if self.frontend.append is False:
                 if self.frontend._file_path.exists():
                     shutil.rmtree(self.frontend._file_path)
 
-            shape = (
-                self.frontend.T,
-                self.frontend.C,
-                self.frontend.Z,
-                self.frontend.Y,
-                self.frontend.X,
-            )
-
             compressor = Blosc(cname="zstd", clevel=1, shuffle=Blosc.SHUFFLE)
             mode = "w"
             if self.frontend.append is True:
@@ -1510,12 +2862,7 @@ try:
                     fw.write(str(self.frontend._metadata.to_xml()))
 
                 self._root.attrs["multiscales"] = [
-                    {
-                        "version": "0.1",
-                        "name": self.frontend._file_path.name,
-                        "datasets": [{"path": "0"}],
-                        "metadata": {"method": "mean"},
-                    }
+                    {"version": "0.4", **self._multiscales()}
                 ]
 
             store_path = str(self.frontend._file_path.resolve())
@@ -1523,22 +2870,19 @@ try:
                 self.frontend.append is True
                 and len(_list_zarr_children(store_path, "array")) > 0
             ):
-                writer = self._root["0"]
+                self._writers = [self._root["0"]]
             else:
-                writer = self._root.create_array(
-                    name="0",
-                    shape=shape,
-                    chunks=(
-                        1,
-                        1,
-                        1,
-                        self.frontend._TILE_SIZE,
-                        self.frontend._TILE_SIZE,
-                    ),
-                    dtype=self.frontend.dtype,
-                    compressors=compressor,
-                    fill_value=0,
-                )
+                self._writers = [
+                    self._root.create_array(
+                        name=str(level),
+                        shape=self._level_shape(level),
+                        chunks=self.frontend._chunk_shape(),
+                        dtype=self.frontend.dtype,
+                        compressors=compressor,
+                        fill_value=0,
+                    )
+                    for level in range(self.frontend._pyramid_levels + 1)
+                ]
 
             # This is recommended to do for cloud storage to increase read/write
             # speed, but it also increases write speed locally when threading.
@@ -1551,43 +2895,153 @@ try:
             ):
                 zarr.consolidate_metadata(str(self.frontend._file_path.resolve()))
 
-            self._writer = writer
+            self._writer = self._writers[0]
+
+        def _init_pyramid(self):
+            """Set up streaming generation of the sub-resolution levels."""
+            self._pyramid = None
+            self._level_lock = threading.Lock()
+            if self.frontend._pyramid_levels > 0:
+                if self.frontend.append:
+                    raise ValueError("pyramid_levels cannot be used when appending.")
+                self._pyramid = TilePyramid(
+                    (self.frontend.Y, self.frontend.X),
+                    self.frontend._pyramid_levels,
+                    self.frontend._TILE_SIZE,
+                    self.frontend._downsample,
+                )
 
-        def _process_chunk(self, dims):
+        def _level_shape(self, level):
+            Y, X = (
+                (self.frontend.Y, self.frontend.X)
+                if self._pyramid is None
+                else self._pyramid.shapes[level]
+            )
+            return (self.frontend.T, self.frontend.C, self.frontend.Z, Y, X)
+
+        def _multiscales(self):
+            """Describe the resolution levels as OME-NGFF multiscales metadata.
+
+            Every level has a scale transformation with the physical size of its
+            pixels, or the size in full resolution pixels if the physical size is
+            unknown.
+            """
+            axes = [
+                {"name": "t", "type": "time"},
+                {"name": "c", "type": "channel"},
+            ]
+            scale = [1.0, 1.0]
+            for axis in "zyx":
+                size, unit = getattr(self.frontend, f"physical_size_{axis}")
+                axes.append({"name": axis, "type": "space"})
+                if unit is not None and unit.name.lower() in _NGFF_SPACE_UNITS:
+                    axes[-1]["unit"] = unit.name.lower()
+                scale.append(1.0 if size is None else float(size))
+
+            datasets = []
+            for level in range(self.frontend._pyramid_levels + 1):
+                datasets.append(
+                    {
+                        "path": str(level),
+                        "coordinateTransformations": [
+                            {
+                                "type": "scale",
+                                "scale": scale[:3] + [s * 2**level for s in scale[3:]],
+                            }
+                        ],
+                    }
+                )
+
+            return {
+                "name": self.frontend._file_path.name,
+                "axes": axes,
+                "datasets": datasets,
+                "type": self.frontend._downsample,
+                "metadata": {"method": self.frontend._downsample},
+            }
+
+        def _write_level_tile(self, plane, level, y, x, tile):
+            ts = self.frontend._TILE_SIZE
+            h, w = self._pyramid.tile_shape(level, y, x)
+            t, c, z = plane
+            # level tiles of the same chunk can be finished by different workers
+            with self._level_lock:
+                self._writers[level][
+                    t, c, z, y * ts : y * ts + h, x * ts : x * ts + w
+                ] = tile[:h, :w]
+
+        def _write_block(self, tiles):
+            """Write the tiles of one chunk or shard with one zarr call per plane.
+
+            Writing part of a chunk or shard reads and rewrites all of it, so
+            tiles that share one are written together by the same worker.
+            """
             out = self._image
+            ts = self.frontend._TILE_SIZE
+            planes = {}
+            for dims in tiles:
+                planes.setdefault((dims[3], dims[4]), []).append(dims)
+
+            for (C, T), plane_tiles in planes.items():
+                X, Y, Z = (min(d[i] for d in plane_tiles) for i in range(3))
+                z1 = max(d[2][1] for d in plane_tiles) + 1
+                y1 = max(
+                    d[1][1] + min(ts, self.frontend.Y - d[1][1], out.shape[0] - d[1][0])
+                    for d in plane_tiles
+                )
+                x1 = max(
+                    d[0][1] + min(ts, self.frontend.X - d[0][1], out.shape[1] - d[0][0])
+                    for d in plane_tiles
+                )
+                self._writer[T[1], C[1], Z[1] : z1, Y[1] : y1, X[1] : x1] = out[
+                    Y[0] : Y[0] + y1 - Y[1],
+                    X[0] : X[0] + x1 - X[1],
+                    Z[0] : Z[0] + z1 - Z[1],
+                    C[0],
+                    T[0],
+                ].transpose(2, 0, 1)
+
+            for dims in tiles:
+                self._reduce_chunk(dims)
+
+        def _reduce_chunk(self, dims):
+            """Downsample a written tile into the sub-resolution levels."""
+            if self._pyramid is None:
+                return
 
+            out = self._image
             X, Y, Z, C, T = dims
-
-            y1e = min([Y[1] + self.frontend._TILE_SIZE, self.frontend._DIMS["Y"]])
-            y0e = min([Y[0] + self.frontend._TILE_SIZE, out.shape[0]])
-            x1e = min([X[1] + self.frontend._TILE_SIZE, self.frontend._DIMS["X"]])
-            x0e = min([X[0] + self.frontend._TILE_SIZE, out.shape[1]])
-            self._writer[
-                T[1] : T[1] + 1,
-                C[1] : C[1] + 1,
-                Z[1] : Z[1] + 1,
-                Y[1] : y1e,
-                X[1] : x1e,
-            ] = out[
-                Y[0] : y0e,
-                X[0] : x0e,
-                Z[0] : Z[0] + 1,
-                C[0] : C[0] + 1,
-                T[0] : T[0] + 1,
-            ].transpose(
-                4, 3, 2, 0, 1
-            )
+            ts = self.frontend._TILE_SIZE
+            y0e = min([Y[0] + ts, out.shape[0]])
+            x0e = min([X[0] + ts, out.shape[1]])
+            for tile in self._pyramid.add(
+                (T[1], C[1], Z[1]),
+                0,
+                Y[1] // ts,
+                X[1] // ts,
+                out[Y[0] : y0e, X[0] : x0e, Z[0], C[0], T[0]],
+            ):
+                self._write_level_tile(*tile)
 
         def _write_image(self, X, Y, Z, C, T, image):
+            # chunk and shard sides either divide the tile size or are multiples
+            # of it, so tiles in different groups never share a chunk
+            blocks = _group_by_shard(
+                self._tile_indices, self._writer.shards or self._writer.chunks
+            )
             if self.frontend._max_workers > 1:
-                with ThreadPoolExecutor(self.frontend._max_workers) as executor:
-                    executor.map(self._process_chunk, self._tile_indices)
+                # cast to list to wait for the writes to finish
+                list(self._get_executor().map(self._write_block, blocks))
             else:
-                for args in self._tile_indices:
-                    self._process_chunk(args)
+                for tiles in blocks:
+                    self._write_block(tiles)
 
         def close(self):
-            pass
+            self._shutdown_executor()
+            if self._pyramid is not None:
+                for tile in self._pyramid.flush():
+                    self._write_level_tile(*tile)
+                self._pyramid = None
 
     class Zarr3Reader(ZarrReader):
         """Reader for zarr v3 format stores using zarr-python v3 API."""
@@ -1732,18 +3186,11 @@ try:
 
         def _init_writer(self):
             """Initialize file writing for zarr v3 format."""
+            self._init_pyramid()
             if self.frontend.append is False:
                 if self.frontend._file_path.exists():
                     shutil.rmtree(self.frontend._file_path)
 
-            shape = (
-                self.frontend.T,
-                self.frontend.C,
-                self.frontend.Z,
-                self.frontend.Y,
-                self.frontend.X,
-            )
-
             mode = "w"
             if self.frontend.append is True:
                 mode = "a"
@@ -1770,20 +3217,7 @@ try:
 
                 self._root.attrs["ome"] = {
                     "version": "0.5",
-                    "multiscales": [
-                        {
-                            "name": self.frontend._file_path.name,
-                            "axes": [
-                                {"name": "t", "type": "time"},
-                                {"name": "c", "type": "channel"},
-                                {"name": "z", "type": "space"},
-                                {"name": "y", "type": "space"},
-                                {"name": "x", "type": "space"},
-                            ],
-                            "datasets": [{"path": "0"}],
-                            "metadata": {"method": "mean"},
-                        }
-                    ],
+                    "multiscales": [self._multiscales()],
                 }
 
             # Check for existing arrays when appending
@@ -1792,29 +3226,27 @@ try:
                     k for k, v in self._root.members() if isinstance(v, zarr.Array)
                 )
                 if len(existing_arrays) > 0:
-                    writer = self._root["0"]
-                    self._writer = writer
+                    self._writers = [self._root["0"]]
+                    self._writer = self._writers[0]
                     return
 
-            writer = self._root.create_array(
-                name="0",
-                shape=shape,
-                chunks=(
-                    1,
-                    1,
-                    1,
-                    self.frontend._TILE_SIZE,
-                    self.frontend._TILE_SIZE,
-                ),
-                dtype=self.frontend.dtype,
-                serializer=zarr.codecs.BytesCodec(),
-                compressors=zarr.codecs.ZstdCodec(level=1),
-                fill_value=0,
-            )
+            self._writers = [
+                self._root.create_array(
+                    name=str(level),
+                    shape=self._level_shape(level),
+                    chunks=self.frontend._chunk_shape(),
+                    dtype=self.frontend.dtype,
+                    serializer=zarr.codecs.BytesCodec(),
+                    shards=self.frontend._shards,
+                    compressors=zarr.codecs.ZstdCodec(level=1),
+                    fill_value=0,
+                )
+                for level in range(self.frontend._pyramid_levels + 1)
+            ]
 
             # Skip zarr.consolidate_metadata() — not part of v3 spec
 
-            self._writer = writer
+            self._writer = self._writers[0]
 
 except ModuleNotFoundError:
     logger.info(
@@ -6,10 +6,149 @@ import ome_types
 import threading
 import typing
 
+from concurrent.futures import Executor, ThreadPoolExecutor
 from pathlib import Path
 from queue import Queue
 
 
+class SupertileBuffer(object):
+    """Buffering state of a single tile iterator.
+
+    Tile iterators move supertiles between the image and a pixel buffer, and
+    cut tiles from or assemble tiles in the pixel buffer. Every iterator keeps
+    this state in its own SupertileBuffer, so many iterators can run at once
+    on the same or different images.
+
+    Writers do not use the pixel buffer, and queue supertiles in the
+    raw_buffer once all of their pixels were assembled.
+
+    Readers use the pixel buffer as a ring of columns, so supertiles are never
+    shifted once they are stored. Image column ``c`` is stored in column
+    ``c % columns``, and the first ``halo`` columns are repeated after the
+    ring so any tile up to ``halo + 1`` columns wide is stored contiguously.
+
+    Attributes:
+        supertile_index: Queue of supertile coordinates to read or write.
+        raw_buffer: Queue of supertiles that were read or are waiting to be
+            written. Readers queue futures of the supertiles being read.
+        pixel_buffer: The pixels of the supertiles being tiled, or None.
+        x_offset: Image column of the first column of the pixel buffer.
+        y_offset: Image row of the first row of the pixel buffer.
+        last_column: Number of columns of the pixel buffer holding data.
+        z_index: Index of each z-slice in the pixel buffer.
+        t_index: Index of each timepoint in the pixel buffer.
+        executor: Executor reading or writing supertiles, or None.
+        columns: Number of columns in the ring.
+        halo: Number of columns repeated after the ring.
+    """
+
+    def __init__(
+        self,
+        pixel_buffer: typing.Optional[numpy.ndarray],
+        x_offset: int = 0,
+        y_offset: int = 0,
+        z: typing.Sequence[int] = (0,),
+        t: typing.Sequence[int] = (0,),
+        depth: int = 1,
+        executor: typing.Optional[Executor] = None,
+        halo: int = 0,
+    ):
+        """Initialize the buffers of a tile iterator.
+
+        Args:
+            pixel_buffer: The array tiles are cut from or assembled in, or
+                None if the iterator does not use one.
+            x_offset: Image column of the first column of the pixel buffer.
+                *Defaults to 0.*
+            y_offset: Image row of the first row of the pixel buffer.
+                *Defaults to 0.*
+            z: The z-slices in the pixel buffer. *Defaults to (0,).*
+            t: The timepoints in the pixel buffer. *Defaults to (0,).*
+            depth: Maximum number of supertiles in the raw_buffer.
+                *Defaults to 1.*
+            executor: Executor reading or writing supertiles. *Defaults to None.*
+            halo: Number of columns of the pixel buffer repeated after the
+                ring. *Defaults to 0.*
+        """
+        self.supertile_index = Queue()
+        self.raw_buffer = Queue(maxsize=depth)
+        self.pixel_buffer = pixel_buffer
+        self.x_offset = x_offset
+        self.y_offset = y_offset
+        self.last_column = 0
+        self.z_index = {z: i for i, z in enumerate(z)}
+        self.t_index = {t: i for i, t in enumerate(t)}
+        self.executor = executor
+        self.columns = 0 if pixel_buffer is None else pixel_buffer.shape[1] - halo
+        self.halo = halo
+
+    def _ring_slices(
+        self, column: int, width: int
+    ) -> typing.List[typing.Tuple[slice, slice]]:
+        """Get the ring columns storing a range of image columns.
+
+        Args:
+            column: The first image column.
+            width: The number of image columns.
+
+        Returns:
+            A list of (ring, image) slices, one for each part of the range
+            before and after wrapping around the ring.
+        """
+        start = column % self.columns
+        first = min(width, self.columns - start)
+        slices = [(slice(start, start + first), slice(0, first))]
+        if first < width:
+            slices.append((slice(0, width - first), slice(first, width)))
+        return slices
+
+    def put_columns(self, column: int, image: numpy.ndarray):
+        """Store a supertile in the ring.
+
+        Args:
+            column: The image column of the first column of the supertile.
+            image: The supertile, with the same shape as the pixel buffer
+                except for the number of columns.
+        """
+        for ring, part in self._ring_slices(column, image.shape[1]):
+            self.pixel_buffer[:, ring] = image[:, part]
+        self.pixel_buffer[:, self.columns :] = self.pixel_buffer[:, : self.halo]
+
+    def get_columns(self, column: int, width: int) -> numpy.ndarray:
+        """Copy image columns out of the ring.
+
+        Args:
+            column: The first image column.
+            width: The number of image columns.
+
+        Returns:
+            The columns, with the same shape as the pixel buffer except for
+            the number of columns.
+        """
+        image = numpy.empty(
+            (self.pixel_buffer.shape[0], width) + self.pixel_buffer.shape[2:],
+            dtype=self.pixel_buffer.dtype,
+        )
+        for ring, part in self._ring_slices(column, width):
+            image[:, part] = self.pixel_buffer[:, ring]
+        return image
+
+    def resize(self, columns: int):
+        """Change the number of columns in the ring, keeping the stored data.
+
+        Args:
+            columns: The new number of columns, at least last_column.
+        """
+        stored = self.get_columns(self.x_offset, self.last_column)
+        self.pixel_buffer = numpy.zeros(
+            (self.pixel_buffer.shape[0], columns + self.halo)
+            + self.pixel_buffer.shape[2:],
+            dtype=self.pixel_buffer.dtype,
+        )
+        self.columns = columns
+        self.put_columns(self.x_offset, stored)
+
+
 class BioBase(object, metaclass=abc.ABCMeta):
     """Abstract class for reading/writing OME tiled tiff images.
 
@@ -76,21 +215,15 @@ class BioBase(object, metaclass=abc.ABCMeta):
     # protected attribute to hold metadata
     _metadata: ome_types.model.OME = None
 
-    # protected buffering variables for iterating over an image
-    _raw_buffer = Queue(maxsize=1)  # only preload one supertile at a time
-    _data_in_buffer = Queue(maxsize=1)
-    _supertile_index = Queue()
-    _pixel_buffer = None
-    _fetch_thread = None
-    _tile_thread = None
-    _tile_x_offset = 0
-    _tile_last_column = 0
+    # protected kind of pool used to decode and encode tiles, thread or process
+    _executor_type = "thread"
 
     def __init__(
         self,
         file_path: typing.Union[str, Path],
         max_workers: typing.Optional[int] = None,
         read_only: typing.Optional[bool] = True,
+        executor: str = "thread",
     ):
         """Initialize BioBase object.
 
@@ -100,7 +233,14 @@ class BioBase(object, metaclass=abc.ABCMeta):
                 Defaults to None.
             read_only (typing.Optional[bool], optional): [description].
                 Defaults to True.
+            executor (str, optional): Use a pool of ``"thread"`` or
+                ``"process"`` workers to decode and encode tiles.
+                Defaults to "thread".
         """
+        if executor not in ["thread", "process"]:
+            raise ValueError('executor must be "thread" or "process".')
+        self._executor_type = executor
+
         # Whether the object is read only
         self._read_only = read_only
 
@@ -235,6 +375,12 @@ class BioBase(object, metaclass=abc.ABCMeta):
             # for tensorstore, we do not need to parse metadata to get shape
             if type(self._backend).__name__ == "TensorstoreReader":
                 return getattr(self._backend, name.upper())
+            # dimensions cached in a sidecar index also do not need metadata
+            elif (
+                self._metadata is None
+                and getattr(self._backend, "_sidecar", None) is not None
+            ):
+                return self._backend._sidecar.dims[name.upper()]
             else:
                 if self._metadata is None:
                     self._metadata = self._backend.read_metadata()
@@ -535,6 +681,8 @@ class BioBase(object, metaclass=abc.ABCMeta):
     def dtype(self) -> numpy.dtype:
         """The numpy pixel type of the data."""
         if self._metadata is None:
+            if getattr(self._backend, "_sidecar", None) is not None:
+                return self._backend._sidecar.dtype
             self._metadata = self._backend.read_metadata()
 
         dtype = numpy.dtype(self._DTYPE[self._metadata.images[0].pixels.type.value])
@@ -681,6 +829,87 @@ class BioBase(object, metaclass=abc.ABCMeta):
 
         return int(num_tile_cols * num_tile_rows)
 
+    def _iter_padding(
+        self,
+        tile_size: typing.Sequence[int],
+        tile_stride: typing.Sequence[int],
+        shape: typing.Optional[typing.Sequence[int]] = None,
+    ) -> typing.Tuple[typing.Tuple[int, int], typing.Tuple[int, int]]:
+        """Get the padding of the image for iterating over tiles.
+
+        Args:
+            tile_size: The height and width of the tiles.
+            tile_stride: The row and column stride of the tiles.
+            shape: The height and width of the region to iterate over.
+                *Defaults to None, which is the whole image.*
+
+        Returns:
+            The ((top, bottom), (left, right)) padding. The first tile starts at
+            (-top, -left).
+        """
+        height, width = (self.Y, self.X) if shape is None else shape
+        if not (set(tile_size) & set(tile_stride)):
+            xyoffset = [
+                (tile_size[0] - tile_stride[0]) / 2,
+                (tile_size[1] - tile_stride[1]) / 2,
+            ]
+            xypad = [
+                (tile_size[0] - tile_stride[0]) / 2,
+                (tile_size[1] - tile_stride[1]) / 2,
+            ]
+            xypad[0] = (
+                xyoffset[0] + (tile_stride[0] - numpy.mod(height, tile_stride[0])) / 2
+            )
+            xypad[1] = (
+                xyoffset[1] + (tile_stride[1] - numpy.mod(width, tile_stride[1])) / 2
+            )
+            xypad = (
+                (int(xyoffset[0]), int(2 * xypad[0] - xyoffset[0])),
+                (int(xyoffset[1]), int(2 * xypad[1] - xyoffset[1])),
+            )
+        else:
+            xypad = (
+                (0, max([tile_size[0] - tile_stride[0], 0])),
+                (0, max([tile_size[1] - tile_stride[1], 0])),
+            )
+
+        return xypad
+
+    def _tile_layout(
+        self,
+        tile_size: typing.Sequence[int],
+        tile_stride: typing.Sequence[int],
+        block_rows: int,
+        X: typing.Sequence[int],
+        Y: typing.Sequence[int],
+    ) -> typing.Tuple[typing.List[int], typing.List[typing.List[int]], int]:
+        """Lay out tiles over a region of the image, in bands of rows.
+
+        Tiles are laid out over the region as they would be over an image of
+        its size, and the rows of tiles are split into bands of at most
+        ``block_rows`` rows of pixels.
+
+        Args:
+            tile_size: The height and width of the tiles.
+            tile_stride: The row and column stride of the tiles.
+            block_rows: The maximum number of rows of pixels in a band.
+            X: The (min,max) range of columns of the region.
+            Y: The (min,max) range of rows of the region.
+
+        Returns:
+            The first column of every column of tiles, the first row of every
+            tile in each band, and the number of rows of pixels in a band.
+        """
+        xypad = self._iter_padding(tile_size, tile_stride, (Y[1] - Y[0], X[1] - X[0]))
+        x_list = numpy.arange(X[0] - xypad[1][0], X[1], tile_stride[1]).tolist()
+        y_list = numpy.arange(Y[0] - xypad[0][0], Y[1], tile_stride[0]).tolist()
+
+        band_tiles = max(1, (block_rows - tile_size[0]) // tile_stride[0] + 1)
+        band_rows = (band_tiles - 1) * tile_stride[0] + tile_size[0]
+        bands = [y_list[b : b + band_tiles] for b in range(0, len(y_list), band_tiles)]
+
+        return x_list, bands, band_rows
+
     def close(self):
         """Close the image."""
         if self._backend is not None:
@@ -718,6 +947,10 @@ class BioBase(object, metaclass=abc.ABCMeta):
 class AbstractBackend(object, metaclass=abc.ABCMeta):
     """Base class for backend readers/writers."""
 
+    _executor: ThreadPoolExecutor = None
+    # process pool used by backends that support executor="process"
+    _tile_pool = None
+
     @abc.abstractmethod
     def __init__(self, frontend: BioBase):
         """Initialize an Abstract backend.
@@ -728,6 +961,32 @@ class AbstractBackend(object, metaclass=abc.ABCMeta):
         self.frontend = frontend
         self._lock = threading.Lock()
 
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the thread pool used to read or write tiles.
+
+        The thread pool is created on first use and reused by all subsequent
+        reads and writes, so small reads do not pay for starting threads. It is
+        recreated if the number of workers of the frontend changes, and is shut
+        down when the backend is closed.
+        """
+        if (
+            self._executor is not None
+            and self._executor._max_workers != self.frontend._max_workers
+        ):
+            self._shutdown_executor()
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(self.frontend._max_workers)
+        return self._executor
+
+    def _shutdown_executor(self):
+        """Shut down the thread and process pools, waiting for pending tasks."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self._tile_pool is not None:
+            self._tile_pool.shutdown(wait=True)
+            self._tile_pool = None
+
     def _image_io(self, X, Y, Z, C, T, image):
         # Define tile bounds
         ts = self.frontend._TILE_SIZE
@@ -774,6 +1033,7 @@ class AbstractReader(AbstractBackend):
     """
 
     _metadata: ome_types.OME = None
+    _region: typing.Optional[typing.Tuple[typing.List[int], typing.List[int]]] = None
 
     @abc.abstractmethod
     def __init__(self, frontend: BioBase):
@@ -792,15 +1052,20 @@ class AbstractReader(AbstractBackend):
         """
         pass
 
-    def read_image(self, *args):
+    def read_image(self, *args, region=None):
         """Abstract read image executor.
 
         This function should ensures proper thread locking to prevent file reading
         errors when threading. It should not be overridden by subclasses unless
         absolutely necessary. Instead, `_image_io` and `_read_image` should be
         overridden.
+
+        If ``region`` is None, the output is padded to the tile boundaries given
+        by X and Y. Otherwise ``region`` holds the absolute (Y, X) bounds of an
+        output with shape (Y, X, Z, C, T), and tiles are cropped to it.
         """
         with self._lock:
+            self._region = region
             self._image_io(*args)
             self._read_image(*args)
 
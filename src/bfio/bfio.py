@@ -1,4 +1,6 @@
 # -*- coding: utf-8 -*-
+import asyncio
+import collections
 import json
 import logging
 import struct
@@ -7,13 +9,20 @@ from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import numpy
 import ome_types
+from numpy.lib.stride_tricks import sliding_window_view
 import tifffile
 
 
 from bfio import backends
-from bfio.base_classes import BioBase
+from bfio.base_classes import BioBase, SupertileBuffer
 from bfio.ts_backends import TensorstoreReader, TensorstoreWriter
-from bfio.utils import detect_zarr_format
+from bfio.utils import (
+    CHUNK_ACCESS_PATTERNS,
+    DEFAULT_CHUNK_BYTES,
+    DOWNSAMPLE_METHODS,
+    auto_chunks,
+    detect_zarr_format,
+)
 
 
 class BioReader(BioBase):
@@ -53,6 +62,9 @@ class BioReader(BioBase):
         "_backend_name",
         "clean_metadata",
         "_read_only",
+        "_cache_size",
+        "_sidecar_index",
+        "_executor_type",
         "_backend",
     ]
 
@@ -63,6 +75,9 @@ class BioReader(BioBase):
         backend: typing.Optional[str] = None,
         clean_metadata: bool = True,
         level: typing.Union[int, None] = None,
+        cache_size: typing.Union[int, None] = None,
+        sidecar_index: bool = False,
+        executor: str = "thread",
     ) -> None:
         """Initialize the BioReader.
 
@@ -78,9 +93,24 @@ class BioReader(BioBase):
                 *Default is True.*
             level: For multi-resolution image, specify the resolution level. For other
                 image type, this will be ignored
+            cache_size: Maximum number of bytes of decoded tiles to keep in
+                memory between reads. Only used by the ``python`` backend.
+                *Defaults to None, which disables the tile cache.*
+            sidecar_index: If True, the ``python`` backend stores the tile
+                offsets, dimensions and metadata of the image in a ``.bfidx``
+                file next to the image, and uses it to open the image without
+                walking the tiff headers or parsing the OME XML the next time
+                it is opened. The sidecar is rebuilt if the image changes.
+                *Defaults to False.*
+            executor: Decode tiles in a pool of ``"thread"`` or ``"process"``
+                workers. Processes scale across more cores, but take time to
+                start. Only used by the ``python`` backend.
+                *Defaults to "thread".*
         """
         # Initialize BioBase
-        super(BioReader, self).__init__(file_path, max_workers=max_workers)
+        super(BioReader, self).__init__(
+            file_path, max_workers=max_workers, executor=executor
+        )
 
         if backend == "tensorstore":
             # Tensorstore does not use Python's threading model
@@ -89,6 +119,21 @@ class BioReader(BioBase):
         self.clean_metadata = clean_metadata
         self.set_backend(backend)
         self.level = level
+        self._cache_size = cache_size
+        if cache_size is not None and self._backend_name != "python":
+            self.logger.warning(
+                "The cache_size keyword is only used by the python backend."
+            )
+        self._sidecar_index = sidecar_index
+        if sidecar_index and self._backend_name != "python":
+            self.logger.warning(
+                "The sidecar_index keyword is only used by the python backend."
+            )
+        if executor == "process" and self._backend_name != "python":
+            self.logger.warning(
+                'executor="process" is only used by the python backend.'
+            )
+            self._executor_type = "thread"
         # Ensure backend is supported
         self.logger.debug("Starting the backend...")
         if self._backend_name == "python":
@@ -151,6 +196,9 @@ class BioReader(BioBase):
                 "C": self._backend.C,
                 "T": self._backend.T,
             }
+        elif self._backend_name == "python" and self._backend._sidecar is not None:
+            # Dimensions are cached in the sidecar, delay parsing the metadata
+            self._DIMS = dict(self._backend._sidecar.dims)
         else:
             # Preload the metadata
             self._metadata = self._backend.read_metadata()
@@ -285,6 +333,46 @@ class BioReader(BioBase):
         else:
             self._backend.frontend = self
 
+    def cache_info(self) -> typing.Optional[backends.CacheInfo]:
+        """Tile cache statistics.
+
+        Returns:
+            A named tuple with the number of ``hits``, ``misses`` and
+            ``evictions``, the ``maxsize`` of the cache in bytes and the
+            ``currsize`` of the cached tiles in bytes. Returns None if the
+            tile cache is not enabled.
+        """
+        if self._backend_name != "python":
+            return None
+        return self._backend.cache_info()
+
+    def cache_clear(self) -> None:
+        """Remove all decoded tiles from the tile cache."""
+        if self._backend_name == "python":
+            self._backend.cache_clear()
+
+    def tile_grid(self, Z: int = 0, C: int = 0, T: int = 0) -> numpy.ndarray:
+        """Read-only memory map of the tiles of one plane.
+
+        For uncompressed OME tiled tiffs whose tiles are stored back to back,
+        the tiles of a plane can be accessed in place without any copies.
+
+        Args:
+            Z: The z-slice of the plane. Defaults to 0.
+            C: The channel of the plane. Defaults to 0.
+            T: The timepoint of the plane. Defaults to 0.
+
+        Returns:
+            A read-only array with shape ``(tiles_y, tiles_x, tile, tile)``.
+            Tiles on the right and bottom edges extend past the image.
+        """
+        if self._backend_name != "python":
+            raise ValueError("tile_grid() is only supported by the python backend.")
+        for name, value in zip("ZCT", (Z, C, T)):
+            if not 0 <= value < getattr(self, name):
+                raise IndexError(f"{name}={value} is outside of the image.")
+        return self._backend.tile_grid(Z + self.Z * (C + self.C * T))
+
     def __getitem__(self, keys: typing.Union[tuple, slice]) -> numpy.ndarray:
         """Image loading using numpy-like indexing.
 
@@ -341,6 +429,7 @@ class BioReader(BioBase):
         Z: typing.Union[list, tuple, int, None] = None,
         C: typing.Union[list, tuple, int, None] = None,
         T: typing.Union[list, tuple, int, None] = None,
+        out: typing.Optional[numpy.ndarray] = None,
     ) -> numpy.ndarray:
         """Read the image.
 
@@ -350,6 +439,10 @@ class BioReader(BioBase):
         For example, if an image is read and it represents an xz plane, then the
         shape will be [1,m,n].
 
+        If ``out`` is given, the image is read directly into it without
+        allocating a tile padded buffer. It must have the image dtype and the
+        shape of the returned array, with or without trailing empty dimensions.
+
         Args:
             X: The (min,max) range of pixels to load along the x-axis (columns).
                 If None, loads the full range. *Defaults to None.*
@@ -362,9 +455,11 @@ class BioReader(BioBase):
                 full range. *Defaults to None.*
             T: Values indicating timepoints to load. If None, loads the full
                 range. *Defaults to None.*
+            out: A preallocated array to read the image into. If None, a new
+                array is allocated. *Defaults to None.*
 
         Returns:
-            A 5-dimensional numpy array.
+            A 5-dimensional numpy array, or ``out`` if it was given.
         """
         # Validate inputs
         X = self._val_xyz(X, "X")
@@ -372,16 +467,21 @@ class BioReader(BioBase):
         Z = self._val_xyz(Z, "Z")
         C = self._val_ct(C, "C")
         T = self._val_ct(T, "T")
+        if out is not None:
+            output = self._val_out(out, X, Y, Z, C, T)
+
         if self._backend_name == "tensorstore":
-            output = self._backend.read_image(X, Y, Z, C, T)
+            data = self._backend.read_image(X, Y, Z, C, T)
             # (T, C, Z, Y, X) => (Y, X, Z, C, T)
-            output = output.transpose(3, 4, 0, 1, 2)
-
-            while output.shape[-1] == 1 and output.ndim > 2:
-                output = output[..., 0]
-            return output
+            data = data.transpose(3, 4, 2, 1, 0)
+            if out is not None:
+                output[:] = data
+                return out
+
+            while data.shape[-1] == 1 and data.ndim > 2:
+                data = data[..., 0]
+            return data
         else:
-
             # Define tile bounds
             X_tile_start = (X[0] // self._TILE_SIZE) * self._TILE_SIZE
             Y_tile_start = (Y[0] // self._TILE_SIZE) * self._TILE_SIZE
@@ -403,260 +503,487 @@ class BioReader(BioBase):
                 (X_tile_shape * Y_tile_shape) / (self._TILE_SIZE**2) + 1
             ) < Z_tile_shape * len(C) * len(T)
 
-            # Initialize the output for zarr and bioformats
-            if self._backend_name != "python":
-                output = numpy.zeros(
-                    [Y_tile_shape, X_tile_shape, Z_tile_shape, len(C), len(T)],
-                    dtype=self.dtype,
+            # Crop tiles straight into an output with the requested shape, unless
+            # the python backend benefits from storing whole tiles
+            if out is not None or not (self._backend_name == "python" and load_tiles):
+                if out is None:
+                    # Keep each plane contiguous in memory for fast tile copies
+                    output = numpy.empty(
+                        [Z_tile_shape, len(C), len(T), Y[1] - Y[0], X[1] - X[0]],
+                        dtype=self.dtype,
+                    ).transpose(3, 4, 0, 1, 2)
+
+                self._backend.load_tiles = False
+                self._backend.read_image(
+                    [X_tile_start, X_tile_end],
+                    [Y_tile_start, Y_tile_end],
+                    Z,
+                    C,
+                    T,
+                    output,
+                    region=(list(Y), list(X)),
                 )
+                if out is not None:
+                    return out
 
             # Initialize the output for python
             # We use a different matrix shape for loading images to reduce memory
             # copy time
-            # TODO: Should use this same scheme for the other readers to reduce
-            # copy times
             else:
-                if load_tiles:
-                    y_tile = self._TILE_SIZE
-                    x_tile = self._TILE_SIZE
-                    output = numpy.zeros(
-                        [
-                            Z_tile_shape,
-                            len(C),
-                            len(T),
-                            Y_tile_shape // self._TILE_SIZE,
-                            X_tile_shape // self._TILE_SIZE,
-                            y_tile,
-                            x_tile,
-                        ],
-                        dtype=self.dtype,
-                        order="C",
-                    )
-                else:
-                    output = numpy.zeros(
-                        [Z_tile_shape, len(C), len(T), Y_tile_shape, X_tile_shape],
-                        dtype=self.dtype,
-                        order="C",
-                    )
+                output = numpy.zeros(
+                    [
+                        Z_tile_shape,
+                        len(C),
+                        len(T),
+                        Y_tile_shape // self._TILE_SIZE,
+                        X_tile_shape // self._TILE_SIZE,
+                        self._TILE_SIZE,
+                        self._TILE_SIZE,
+                    ],
+                    dtype=self.dtype,
+                    order="C",
+                )
 
-            # Read the image
-            self._backend.load_tiles = load_tiles
-            self._backend.read_image(
-                [X_tile_start, X_tile_end], [Y_tile_start, Y_tile_end], Z, C, T, output
-            )
+                # Read the image
+                self._backend.load_tiles = load_tiles
+                self._backend.read_image(
+                    [X_tile_start, X_tile_end],
+                    [Y_tile_start, Y_tile_end],
+                    Z,
+                    C,
+                    T,
+                    output,
+                )
 
-            # Reshape the arrays into expected format
-            if self._backend_name == "python":
-                if load_tiles:
-                    output = output.transpose(3, 5, 4, 6, 0, 1, 2)
-                    output = output.reshape(
-                        Y_tile_shape, X_tile_shape, Z_tile_shape, len(C), len(T)
-                    )
-                else:
-                    output = output.transpose(3, 4, 0, 1, 2)
+                # Reshape the arrays into expected format
+                output = output.transpose(3, 5, 4, 6, 0, 1, 2)
+                output = output.reshape(
+                    Y_tile_shape, X_tile_shape, Z_tile_shape, len(C), len(T)
+                )
+                output = output[
+                    Y[0] - Y_tile_start : Y[1] - Y_tile_start,
+                    X[0] - X_tile_start : X[1] - X_tile_start,
+                    ...,
+                ]
 
-            output = output[
-                Y[0] - Y_tile_start : Y[1] - Y_tile_start,
-                X[0] - X_tile_start : X[1] - X_tile_start,
-                ...,
-            ]
             while output.shape[-1] == 1 and output.ndim > 2:
                 output = output[..., 0]
 
             return output
 
-    def _fetch(self) -> numpy.ndarray:
-        """Method for fetching image supertiles.
+    def read_into(
+        self,
+        out: numpy.ndarray,
+        X: typing.Union[list, tuple, None] = None,
+        Y: typing.Union[list, tuple, None] = None,
+        Z: typing.Union[list, tuple, int, None] = None,
+        C: typing.Union[list, tuple, int, None] = None,
+        T: typing.Union[list, tuple, int, None] = None,
+    ) -> numpy.ndarray:
+        """Read the image into a preallocated array.
+
+        This is equivalent to ``read(X, Y, Z, C, T, out=out)``, and is useful to
+        reuse the same buffer for many reads.
+
+        Args:
+            out: The array to read the image into. It must have the image dtype
+                and the shape that :attr:`~.read` would return.
+            X: The (min,max) range of pixels to load along the x-axis (columns).
+                If None, loads the full range. *Defaults to None.*
+            Y: The (min,max) range of pixels to load along the y-axis (rows). If
+                None, loads the full range. *Defaults to None.*
+            Z: The (min,max) range of pixels to load along the z-axis (depth).
+                Alternatively, an integer can be passed to select a single
+                z-plane. If None, loads the full range. *Defaults to None.*
+            C: Values indicating channel indices to load. If None, loads the
+                full range. *Defaults to None.*
+            T: Values indicating timepoints to load. If None, loads the full
+                range. *Defaults to None.*
+
+        Returns:
+            ``out``
+        """
+        return self.read(X, Y, Z, C, T, out=out)
+
+    async def aread(
+        self,
+        X: typing.Union[list, tuple, None] = None,
+        Y: typing.Union[list, tuple, None] = None,
+        Z: typing.Union[list, tuple, int, None] = None,
+        C: typing.Union[list, tuple, int, None] = None,
+        T: typing.Union[list, tuple, int, None] = None,
+        out: typing.Optional[numpy.ndarray] = None,
+    ) -> numpy.ndarray:
+        """Read the image without blocking the event loop.
 
-        This method is intended to be run within a thread, and grabs a chunk of
-        the image according to the coordinates in a queue.
+        This takes the same arguments and returns the same array as
+        :attr:`~.read`. The ``zarr`` and ``zarr3`` backends read with zarr's
+        asynchronous API on the running event loop, without threads or locks,
+        so a single process can serve many concurrent reads. Other backends run
+        :attr:`~.read` in the default executor of the event loop.
 
-        Currently, this function will only grab the first Z, C, and T positions
-        regardless of what Z, C, and T coordinate are provided to the function.
-        This function will need to be changed in then future to account for
-        this.
+        Example:
+            .. code:: python
 
-        If the first value in X or Y is negative, then the image is pre-padded
-        with the number of pixels equal to the absolute value of the negative
-        number.
+                import asyncio
+                from bfio import BioReader
 
-        If the last value in X or Y is larger than the size of the image, then
-        the image is post-padded with the difference between the number and the
-        size of the image. Input coordinate are read from the _supertile_index
-        Queue object. Output data is stored in the _raw_buffer Queue object.
+                async def main():
+                    with BioReader('/path/to/file.ome.zarr') as br:
+                        tiles = await asyncio.gather(
+                            br.aread(X=[0, 256], Y=[0, 256]),
+                            br.aread(X=[256, 512], Y=[0, 256]),
+                        )
 
-        As soon as the method is executed, a boolean value is put into the
-        _data_in_buffer Queue to indicate that data is either in the buffer or
-        will be put into the buffer.
+                asyncio.run(main())
+        """
+        if self._backend_name not in ["zarr", "zarr3"]:
+            return await asyncio.get_running_loop().run_in_executor(
+                None, self.read, X, Y, Z, C, T, out
+            )
+
+        X = self._val_xyz(X, "X")
+        Y = self._val_xyz(Y, "Y")
+        Z = self._val_xyz(Z, "Z")
+        C = self._val_ct(C, "C")
+        T = self._val_ct(T, "T")
+        if out is not None:
+            output = self._val_out(out, X, Y, Z, C, T)
+        else:
+            output = numpy.empty(
+                [Z[1] - Z[0], len(C), len(T), Y[1] - Y[0], X[1] - X[0]],
+                dtype=self.dtype,
+            ).transpose(3, 4, 0, 1, 2)
+
+        await self._backend.aread_image(
+            X, Y, Z, C, T, output, region=(list(Y), list(X))
+        )
+        if out is not None:
+            return out
+
+        while output.shape[-1] == 1 and output.ndim > 2:
+            output = output[..., 0]
+        return output
+
+    def read_regions(
+        self,
+        regions: typing.Sequence[tuple],
+        stack: bool = False,
+    ) -> typing.Union[typing.List[numpy.ndarray], numpy.ndarray]:
+        """Read many regions of the image at once.
+
+        With the python backend, tiles shared by several regions are read and
+        decoded only once, so extracting many small crops costs one decode per
+        unique tile instead of one per region and tile. Other backends read the
+        regions one at a time.
+
+        Args:
+            regions: The regions to read. Each region is a tuple with the X, Y,
+                Z, C and T arguments of :attr:`~.read`, in that order. Trailing
+                arguments may be omitted to load the full range.
+            stack: If True, stack the regions into one array with regions along
+                the first axis. All regions must then have the same shape.
+                *Defaults to False.*
 
         Returns:
-            An image supertile
+            A list with one array per region, shaped as :attr:`~.read` would
+            return it, or a single array if ``stack`` is True.
         """
-        self._data_in_buffer.put(True)
-        X, Y, Z, C, T = self._supertile_index.get()
-
-        # Attach the jvm to the thread if present
-        self._backend.attach()
-
-        # Determine padding if needed
-        reflect_x = False
-        x_min = X[0]
-        x_max = X[1]
-        y_min = Y[0]
-        y_max = Y[1]
-        prepad_x = 0
-        postpad_x = 0
-        prepad_y = 0
-        postpad_y = 0
-        if x_min < 0:
-            prepad_x = abs(x_min)
-            x_min = 0
-        if y_min < 0:
-            prepad_y = abs(y_min)
-            y_min = 0
-        if x_max > self.num_x():
-            if x_min >= self.num_x():
-                x_min = self._TILE_SIZE * ((self.num_x() - 1) // self._TILE_SIZE)
-                reflect_x = True
-            x_max = self.num_x()
-            postpad_x = x_max - self.num_x()
-        if y_max > self.num_y():
-            y_max = self.num_y()
-            postpad_y = y_max - self.num_y()
+        bounds = []
+        for region in regions:
+            X, Y, Z, C, T = tuple(region) + (None,) * (5 - len(region))
+            bounds.append(
+                (
+                    self._val_xyz(X, "X"),
+                    self._val_xyz(Y, "Y"),
+                    self._val_xyz(Z, "Z"),
+                    self._val_ct(C, "C"),
+                    self._val_ct(T, "T"),
+                )
+            )
 
-        # Read the image
-        image = self.read([x_min, x_max], [y_min, y_max], [0, 1], [0], [0]).squeeze()
-        if reflect_x:
-            image = numpy.fliplr(image)
-
-        # Pad the image if needed
-        if sum(1 for p in [prepad_x, prepad_y, postpad_x, postpad_y] if p != 0) > 0:
-            image = numpy.pad(
-                image, ((prepad_y, postpad_y), (prepad_x, postpad_x)), mode="symmetric"
+        # Allocate the outputs, keeping each plane contiguous in memory
+        shapes = [
+            (Y[1] - Y[0], X[1] - X[0], Z[1] - Z[0], len(C), len(T))
+            for X, Y, Z, C, T in bounds
+        ]
+        if stack:
+            if len(set(shapes)) > 1:
+                raise ValueError("All regions must have the same shape to be stacked.")
+            shape = shapes[0] if len(shapes) > 0 else (0, 0, 1, 1, 1)
+            stacked = numpy.empty(
+                (len(shapes),) + shape[2:] + shape[:2], dtype=self.dtype
+            ).transpose(0, 4, 5, 1, 2, 3)
+            outputs = list(stacked)
+        else:
+            outputs = [
+                numpy.empty(shape[2:] + shape[:2], dtype=self.dtype).transpose(
+                    3, 4, 0, 1, 2
+                )
+                for shape in shapes
+            ]
+
+        if self._backend_name == "python":
+            self._backend.read_regions(
+                [bound + (output,) for bound, output in zip(bounds, outputs)]
+            )
+        else:
+            for bound, output in zip(bounds, outputs):
+                self.read(*bound, out=output)
+
+        # Remove trailing empty dimensions, as in read
+        if stack:
+            while stacked.shape[-1] == 1 and stacked.ndim > 3:
+                stacked = stacked[..., 0]
+            return stacked
+
+        for i, output in enumerate(outputs):
+            while output.shape[-1] == 1 and output.ndim > 2:
+                output = output[..., 0]
+            outputs[i] = output
+
+        return outputs
+
+    def _val_out(
+        self,
+        out: numpy.ndarray,
+        X: typing.List[int],
+        Y: typing.List[int],
+        Z: typing.List[int],
+        C: typing.List[int],
+        T: typing.List[int],
+    ) -> numpy.ndarray:
+        """_val_out Utility function for validating an output array.
+
+        Args:
+            out: The output array passed to :attr:`~.read`.
+            X: The validated x-range.
+            Y: The validated y-range.
+            Z: The validated z-range.
+            C: The validated channels.
+            T: The validated timepoints.
+
+        Returns:
+            A 5-dimensional (Y, X, Z, C, T) view of ``out``.
+        """
+        if not isinstance(out, numpy.ndarray):
+            raise TypeError("out must be a numpy.ndarray.")
+        if not numpy.can_cast(self.dtype, out.dtype, "equiv"):
+            raise TypeError(
+                f"out has dtype {out.dtype}, but the image dtype is {self.dtype}."
+            )
+        if not out.flags.writeable:
+            raise ValueError("out must be writeable.")
+
+        shape = (Y[1] - Y[0], X[1] - X[0], Z[1] - Z[0], len(C), len(T))
+        if (
+            out.ndim < 2
+            or out.ndim > 5
+            or out.shape != shape[: out.ndim]
+            or any(s != 1 for s in shape[out.ndim :])
+        ):
+            raise ValueError(
+                f"out has shape {out.shape}, but the requested shape is {shape}."
             )
 
-        # Store the data in the bufferI
-        self._raw_buffer.put(image)
+        return out[(...,) + (None,) * (5 - out.ndim)]
 
-        # Detach the jvm
-        self._backend.detach()
+    def _fetch(
+        self,
+        X: typing.List[int],
+        Y: typing.List[int],
+        Z: typing.List[int],
+        C: typing.List[int],
+        T: typing.List[int],
+    ) -> numpy.ndarray:
+        """Method for fetching image supertiles.
+
+        This method is intended to be run within a thread, and reads a
+        supertile for all requested Z, C, and T positions at once, so every
+        supertile is only decoded once no matter how many planes are iterated
+        over. Pixels of the supertile that are outside of the image are zero.
+
+        Args:
+            X: The (min,max) range of columns of the supertile.
+            Y: The (min,max) range of rows of the supertile.
+            Z: The z-slices to read.
+            C: The channels to read.
+            T: The timepoints to read.
+
+        Returns:
+            The supertile as a ``(Y, X, Z, C, T)`` array.
+        """
+        image = numpy.zeros(
+            (Y[1] - Y[0], X[1] - X[0], len(Z), len(C), len(T)), dtype=self.dtype
+        )
+        x_min, x_max = max(X[0], 0), min(X[1], self.X)
+        y_min, y_max = max(Y[0], 0), min(Y[1], self.Y)
+        if x_min < x_max and y_min < y_max:
+            regions = [
+                (
+                    [x_min, x_max],
+                    [y_min, y_max],
+                    [z, z + 1],
+                    C,
+                    T,
+                    image[
+                        y_min - Y[0] : y_max - Y[0],
+                        x_min - X[0] : x_max - X[0],
+                        zi : zi + 1,
+                    ],
+                )
+                for zi, z in enumerate(Z)
+            ]
+
+            # The python backend only locks the reader while reading the file,
+            # so supertiles read ahead are decoded at the same time
+            if self._backend_name == "python":
+                self._backend.read_regions(regions)
+            else:
+                for *bounds, output in regions:
+                    self.read_into(output, *bounds)
 
         return image
 
-    def _buffer_supertile(self, column_start: int, column_end: int):
+    def _prefetch(self, buffer: SupertileBuffer):
+        """Start reading supertiles until the raw_buffer is full.
+
+        Supertiles at the coordinates in the supertile_index Queue object are
+        read by the executor of the buffer, and a future for each one is put
+        into the raw_buffer Queue object in order.
+
+        Args:
+            buffer: The buffers of the tile iterator.
+        """
+        while not buffer.raw_buffer.full() and not buffer.supertile_index.empty():
+            buffer.raw_buffer.put(
+                buffer.executor.submit(self._fetch, *buffer.supertile_index.get())
+            )
+
+    def _buffer_supertile(
+        self, buffer: SupertileBuffer, column_start: int, column_end: int
+    ):
         """_buffer_supertile Process the pixel buffer.
 
-        Give the column indices of the data to process, and determine if the
-        buffer needs to be processed. This method performs two operations on the
-        buffer. First, it checks to see if data in the buffer can be shifted out
-        of the buffer if it's already been processed, where data before
-        column_start is assumed to have been processed. Second, this function
-        loads data into the buffer if the image reader has made some available
-        and there is room in _pixel_buffer for it.
+        Give the column indices of the data to process, and load the data into
+        the buffer. This method performs two operations on the buffer. First,
+        data before column_start is assumed to have been processed and its
+        columns in the ring are released. Second, supertiles are moved from
+        the raw_buffer into the ring until it holds every column before
+        column_end, growing the ring if there is no room for them. Every
+        supertile taken from the raw_buffer is replaced by a new read.
 
         Args:
+            buffer: The buffers of the tile iterator.
             column_start: First column index of data to be loaded
             column_end: Last column index of data to be loaded
         """
-        # If the column indices are outside what is available in the buffer,
-        # shift the buffer so more data can be loaded.
-        if column_end - self._tile_x_offset >= self._TILE_SIZE:
-            x_min = column_start - self._tile_x_offset
-            x_max = self._pixel_buffer.shape[1] - x_min
-            self._pixel_buffer[:, 0:x_max] = self._pixel_buffer[:, x_min:]
-            self._pixel_buffer[:, x_max:] = 0
-            self._tile_x_offset = column_start
-            self._tile_last_column = numpy.argwhere(
-                (self._pixel_buffer == 0).all(axis=0)
-            )[0, 0]
-
-        # Is there data in the buffer?
-        if self._supertile_index.qsize() > 0 or self._data_in_buffer.qsize() > 0:
-            # If there is data in the _raw_buffer, return if there isn't room to load
-            # it into the _pixel_buffer
-            if self._pixel_buffer.shape[1] - self._tile_last_column < self._TILE_SIZE:
-                return
-
-            image = self._raw_buffer.get()
-            if self._tile_last_column == 0:
-                self._pixel_buffer[: image.shape[0], : image.shape[1]] = image
-                self._tile_last_column = image.shape[1]
-                self._tile_x_offset = column_start
-            else:
-                self._pixel_buffer[
-                    : image.shape[0],
-                    self._tile_last_column : self._tile_last_column + image.shape[1],
-                ] = image
-                self._tile_last_column += image.shape[1]
+        # Release processed columns
+        release = min(column_start - buffer.x_offset, buffer.last_column)
+        if release > 0:
+            buffer.last_column -= release
+            buffer.x_offset += release
 
-            self._data_in_buffer.get()
+        # Supertiles arrive in order, so each one starts where the last one ended
+        while buffer.x_offset + buffer.last_column < column_end:
+            supertile = buffer.raw_buffer.get()
+            self._prefetch(buffer)
+            image = supertile.result()
+
+            last_column = buffer.last_column + image.shape[1]
+            if last_column > buffer.columns:
+                buffer.resize(max(last_column, 2 * buffer.columns))
+
+            buffer.put_columns(buffer.x_offset + buffer.last_column, image)
+            buffer.last_column = last_column
 
     def _get_tiles(
         self,
+        buffer: SupertileBuffer,
         X: typing.List[typing.List[int]],
         Y: typing.List[typing.List[int]],
         Z: typing.List[typing.List[int]],
         C: typing.List[typing.List[int]],
         T: typing.List[typing.List[int]],
+        keep: typing.Optional[int] = None,
+        copy: bool = True,
     ) -> numpy.ndarray:
         """_get_tiles Handle data buffering and tiling.
 
         This function returns tiles of data according to the input coordinates.
         The X, Y, Z, C, and T are lists of lists, where each internal list
         indicates a set of coordinates specifying the range of pixel values to
-        grab from an image.
+        grab from an image. Tiles must be sorted by their first X index, and
+        every tile must be in the supertiles being iterated over.
+
+        All tiles are gathered at once from a sliding window view of the pixel
+        buffer, so the time spent only depends on the size of the tiles.
 
         Args:
+            buffer: The buffers of the tile iterator.
             X: List of 2-tuples indicating the (min,max) range of pixels to load
                 within a tile.
             Y: List of 2-tuples indicating the (min,max) range of pixels to load
                 within a tile.
-            Z: Placeholder, to be implemented.
-            C: Placeholder, to be implemented.
-            T: Placeholder, to be implemented.
+            Z: List of 2-tuples indicating the z-slice of each tile.
+            C: List of lists of channels to load for each tile.
+            T: List of 1-element lists indicating the timepoint of each tile.
+            keep: First column of the image that must stay in the pixel buffer,
+                such as the first column of tiles that are still in use.
+                *Defaults to None, which is the first column of the tiles.*
+            copy: If False, a single column of tiles of one plane is returned
+                as a read-only view of the pixel buffer, and other tiles are
+                not made contiguous. *Defaults to True.*
 
         Returns:
-            2-dimensional ndarray.
+            4-dimensional ndarray with dimensions ``[tile_num,Y,X,C]``.
         """
-        self._buffer_supertile(X[0][0], X[0][1])
-
-        if X[-1][0] - self._tile_x_offset > self._TILE_SIZE:
-            split_ind = 0
-            while X[split_ind][0] - self._tile_x_offset < self._TILE_SIZE:
-                split_ind += 1
-        else:
-            split_ind = len(X)
+        self._buffer_supertile(
+            buffer, X[0][0] if keep is None else keep, max(x[1] for x in X)
+        )
 
         # Tile the data
         num_rows = Y[0][1] - Y[0][0]
         num_cols = X[0][1] - X[0][0]
-        num_tiles = len(X)
-        images = numpy.zeros(
-            (num_tiles, num_rows, num_cols, 1), dtype=self.pixel_type()
+        windows = sliding_window_view(
+            buffer.pixel_buffer, (num_rows, num_cols), axis=(0, 1)
         )
+        rows = numpy.array([y[0] for y in Y]) - buffer.y_offset
+        cols = numpy.array([x[0] for x in X]) % buffer.columns
+        zi = numpy.array([buffer.z_index[z[0]] for z in Z])
+        ti = numpy.array([buffer.t_index[t[0]] for t in T])
+
+        # Windows have dimensions [Y,X,Z,C,T,tile_size[0],tile_size[1]]
+        step = rows[1] - rows[0] if len(rows) > 1 else 1
+        if (
+            not copy
+            and step > 0
+            and (numpy.diff(rows) == step).all()
+            and (cols == cols[0]).all()
+            and (zi == zi[0]).all()
+            and (ti == ti[0]).all()
+        ):
+            images = windows[rows[0] : rows[-1] + 1 : step, cols[0], zi[0], :, ti[0]]
+        else:
+            images = windows[rows, cols, zi, :, ti]
+        images = numpy.moveaxis(images, 1, -1)
 
-        for ind in range(split_ind):
-            images[ind, :, :, 0] = self._pixel_buffer[
-                Y[ind][0] - self._tile_y_offset : Y[ind][1] - self._tile_y_offset,
-                X[ind][0] - self._tile_x_offset : X[ind][1] - self._tile_x_offset,
-            ]
-
-        if split_ind != num_tiles:
-            self._buffer_supertile(X[-1][0], X[-1][1])
-            for ind in range(split_ind, num_tiles):
-                images[ind, :, :, 0] = self._pixel_buffer[
-                    Y[ind][0] - self._tile_y_offset : Y[ind][1] - self._tile_y_offset,
-                    X[ind][0] - self._tile_x_offset : X[ind][1] - self._tile_x_offset,
-                ]
-
-        return images
+        return numpy.ascontiguousarray(images) if copy else images
 
     def __call__(
         self,
         tile_size: typing.Union[list, tuple],
         tile_stride: typing.Union[list, tuple, None] = None,
         batch_size: typing.Union[int, None] = None,
-        channels: typing.List[int] = [0],
+        channels: typing.Union[int, typing.List[int]] = [0],
+        z: typing.Union[int, typing.List[int]] = 0,
+        t: typing.Union[int, typing.List[int]] = 0,
+        prefetch: int = 2,
+        prefetch_bytes: typing.Optional[int] = None,
+        copy: bool = True,
+        block_size: typing.Union[list, tuple, None] = None,
+        x: typing.Union[list, tuple, None] = None,
+        y: typing.Union[list, tuple, None] = None,
     ) -> typing.Iterable[typing.Tuple[numpy.ndarray, tuple]]:
         """Iterate through tiles of an image.
 
@@ -664,6 +991,27 @@ class BioReader(BioBase):
         tiles of an image. The iterator buffers the loading of pixels
         asynchronously to quickly deliver images of the appropriate size.
 
+        Each supertile of the image is read once for all of the requested
+        channels, z-slices and timepoints. For every tile position, one tile is
+        returned per z-slice and timepoint, with the z-slices changing fastest,
+        and every tile contains all of the requested channels.
+
+        The x and y arguments limit the iterator to a region of the image.
+        Tiles are laid out over the region as they would be over an image of
+        its size. Tiles that extend past the region still contain the pixels
+        of the image there, and only pixels outside of the image are zero.
+
+        The image is read in bands of rows at most ``block_size[0]`` pixels
+        high, as supertiles ``block_size[1]`` columns wide, so the memory used
+        does not depend on the size of the image. Rows shared by tiles of
+        neighboring bands are read with both bands. Tiles are returned band by
+        band, and column by column within a band.
+
+        Supertiles are read ahead of the tiles being returned, by a thread pool
+        owned by the iterator. The number of supertiles read ahead is set by
+        ``prefetch``, or by ``prefetch_bytes`` to bound the memory they use.
+        Reading ahead keeps the iterator from waiting on slow storage.
+
         Args:
             tile_size: A list/tuple of length 2, indicating the height and width
                 of the tiles to return.
@@ -672,9 +1020,28 @@ class BioReader(BioBase):
                 None.*
             batch_size: Number of tiles to return on each iteration. *Defaults
                 to None, which is the smaller of 32 or the*
-                :attr:`~.maximum_batch_size`
-            channels: A placeholder. Only the first channel is ever loaded.
-                *Defaults to [0].*
+                :attr:`~.maximum_batch_size` *times the number of z-slices and
+                timepoints.*
+            channels: The channel or list of channels to load. *Defaults to
+                [0].*
+            z: The z-slice or list of z-slices to load. *Defaults to 0.*
+            t: The timepoint or list of timepoints to load. *Defaults to 0.*
+            prefetch: Number of supertiles to read ahead. *Defaults to 2.*
+            prefetch_bytes: If given, read ahead as many supertiles as fit in
+                this number of bytes, and at least one. This overrides
+                ``prefetch``. *Defaults to None.*
+            copy: If False, batches are not copied into new contiguous arrays
+                when possible. A batch with a single column of tiles of one
+                z-slice and timepoint is then a read-only view of the pixel
+                buffer, which is only valid until the next batch is requested.
+                *Defaults to True.*
+            block_size: A list/tuple of length 2, indicating the maximum height
+                and width of the supertiles. *Defaults to None, which is 4096
+                rows and 1024 columns.*
+            x: The (min,max) range of columns to iterate over. *Defaults to
+                None, which is every column.*
+            y: The (min,max) range of rows to iterate over. *Defaults to None,
+                which is every row.*
 
         Returns:
             A tuple containing a 4-d numpy array and a tuple containing a list
@@ -701,29 +1068,47 @@ class BioReader(BioBase):
                         plt.show()
 
         """
-        self._iter_tile_size = tile_size
-        self._iter_tile_stride = tile_stride
-        self._iter_batch_size = batch_size
-        self._iter_channels = channels
-
-        return self
-
-    def __iter__(self):  # NOQA: C901
-        tile_size = self._iter_tile_size
-        tile_stride = self._iter_tile_stride
-        batch_size = self._iter_batch_size
-        channels = self._iter_channels
-        if tile_size is None:
-            raise SyntaxError(
-                "Cannot directly iterate over a BioReader object."
-                + "Call it (i.e. for i in bioreader(256,256))"
-            )
+        return self._iter_tiles(
+            tile_size,
+            tile_stride,
+            batch_size,
+            channels,
+            z,
+            t,
+            prefetch,
+            prefetch_bytes,
+            copy,
+            block_size,
+            x,
+            y,
+        )
+
+    def __iter__(self):
+        raise SyntaxError(
+            "Cannot directly iterate over a BioReader object."
+            + "Call it (i.e. for i in bioreader(256,256))"
+        )
 
-        self._iter_tile_size = None
-        self._iter_tile_stride = None
-        self._iter_batch_size = None
-        self._iter_channels = None
+    def _iter_args(
+        self,
+        tile_size: typing.Union[list, tuple],
+        tile_stride: typing.Union[list, tuple, None],
+        batch_size: typing.Union[int, None],
+        channels: typing.Union[int, typing.List[int]],
+        zs: typing.Union[int, typing.List[int]],
+        ts: typing.Union[int, typing.List[int]],
+        block_size: typing.Union[list, tuple, None],
+        x: typing.Union[list, tuple, None],
+        y: typing.Union[list, tuple, None],
+    ) -> tuple:
+        """Validate the arguments of the tile iterators and fill in defaults.
+
+        See :attr:`~.__call__` for the arguments.
 
+        Returns:
+            The tile_stride, batch_size, channels, z-slices, timepoints and
+            block_size, and the X and Y ranges of the region.
+        """
         # input error checking
         assert len(tile_size) == 2, "tile_size must be a list with 2 elements"
         if tile_stride is not None:
@@ -731,158 +1116,328 @@ class BioReader(BioBase):
         else:
             tile_stride = tile_size
 
-        if self._backend_name == "tensorstore":
-
-            self._backend._rdr.send_iter_read_request(tile_size, tile_stride)
-            for data in self._backend._rdr._image_reader.__iter__():
-                row_index, col_index = (
-                    self._backend._rdr._image_reader.get_tile_coordinate(
-                        data[3], data[5], tile_size[0], tile_size[1]
-                    )
-                )
-                yield (
-                    data[0],
-                    data[1],
-                    data[2],
-                    row_index,
-                    col_index,
-                ), self._backend._rdr._image_reader.get_iterator_requested_tile_data(
-                    data[0], data[1], data[2], data[3], data[4], data[5], data[6]
-                )
+        channels = [channels] if isinstance(channels, int) else list(channels)
+        zs = [zs] if isinstance(zs, int) else list(zs)
+        ts = [ts] if isinstance(ts, int) else list(ts)
+        self._val_ct(channels, "C")
+        self._val_ct(ts, "T")
+        assert len(zs) != 0, "At least one z-index must be selected."
+        assert all(
+            0 <= z < self.Z for z in zs
+        ), f"The z-indices must be between 0 and {self.Z - 1}."
+
+        # Ensure that the number of tiles does not exceed the supertile width
+        max_batch = self.maximum_batch_size(tile_size, tile_stride) * len(zs) * len(ts)
+        if batch_size is None:
+            batch_size = min([32, max_batch])
         else:
-            # Ensure that the number of tiles does not exceed the supertile width
-            if batch_size is None:
-                batch_size = min([32, self.maximum_batch_size(tile_size, tile_stride)])
-            else:
-                assert batch_size <= self.maximum_batch_size(
-                    tile_size, tile_stride
-                ), "batch_size must be less than or equal to {}.".format(
-                    self.maximum_batch_size(tile_size, tile_stride)
-                )
+            assert (
+                batch_size <= max_batch
+            ), "batch_size must be less than or equal to {}.".format(max_batch)
 
-            # calculate padding if needed
-            if not (set(tile_size) & set(tile_stride)):
-                xyoffset = [
-                    (tile_size[0] - tile_stride[0]) / 2,
-                    (tile_size[1] - tile_stride[1]) / 2,
-                ]
-                xypad = [
-                    (tile_size[0] - tile_stride[0]) / 2,
-                    (tile_size[1] - tile_stride[1]) / 2,
-                ]
-                xypad[0] = (
-                    xyoffset[0]
-                    + (tile_stride[0] - numpy.mod(self.Y, tile_stride[0])) / 2
-                )
-                xypad[1] = (
-                    xyoffset[1]
-                    + (tile_stride[1] - numpy.mod(self.X, tile_stride[1])) / 2
-                )
-                xypad = (
-                    (int(xyoffset[0]), int(2 * xypad[0] - xyoffset[0])),
-                    (int(xyoffset[1]), int(2 * xypad[1] - xyoffset[1])),
-                )
-            else:
-                xyoffset = [0, 0]
-                xypad = (
-                    (0, max([tile_size[0] - tile_stride[0], 0])),
-                    (0, max([tile_size[1] - tile_stride[1], 0])),
-                )
+        X_roi = self._val_xyz(x, "X")
+        Y_roi = self._val_xyz(y, "Y")
+        assert (
+            X_roi[0] < X_roi[1] and Y_roi[0] < Y_roi[1]
+        ), "The region must not be empty."
+        if block_size is None:
+            block_size = (4 * self._TILE_SIZE, self._TILE_SIZE)
+        assert len(block_size) == 2, "block_size must be a list with 2 elements"
+        assert block_size[0] > 0 and block_size[1] > 0, "block_size must be positive."
 
-            # determine supertile sizes
-            y_tile_dim = int(numpy.ceil((self.Y - 1) / self._TILE_SIZE))
-            x_tile_dim = 1
+        return tile_stride, batch_size, channels, zs, ts, block_size, X_roi, Y_roi
 
-            # Initialize the pixel buffer
-            self._pixel_buffer = numpy.zeros(
-                (
-                    y_tile_dim * self._TILE_SIZE + tile_size[0],
-                    2 * x_tile_dim * self._TILE_SIZE + tile_size[1],
-                ),
-                dtype=self.dtype,
+    def _iter_tiles(  # NOQA: C901
+        self,
+        tile_size: typing.Union[list, tuple],
+        tile_stride: typing.Union[list, tuple, None],
+        batch_size: typing.Union[int, None],
+        channels: typing.Union[int, typing.List[int]],
+        zs: typing.Union[int, typing.List[int]],
+        ts: typing.Union[int, typing.List[int]],
+        prefetch: int = 2,
+        prefetch_bytes: typing.Optional[int] = None,
+        copy: bool = True,
+        block_size: typing.Union[list, tuple, None] = None,
+        x: typing.Union[list, tuple, None] = None,
+        y: typing.Union[list, tuple, None] = None,
+    ) -> typing.Iterator[typing.Tuple[numpy.ndarray, tuple]]:
+        """Generator behind calling the BioReader.
+
+        All buffering state lives in the generator, so any number of tile
+        iterators can run at once. See :attr:`~.__call__` for the arguments.
+        """
+        tile_stride, batch_size, channels, zs, ts, block_size, X_roi, Y_roi = (
+            self._iter_args(
+                tile_size, tile_stride, batch_size, channels, zs, ts, block_size, x, y
             )
-            self._tile_x_offset = -xypad[1][0]
-            self._tile_y_offset = -xypad[0][0]
+        )
+        planes = [(z, t) for t in ts for z in zs]
+        block_rows, block_cols = block_size
+
+        # Lay out the tiles over the region as if it was the whole image, in
+        # bands of rows that overlap by the rows tiles share with the next
+        # band, which are read again with it.
+        x_list, bands, band_rows = self._tile_layout(
+            tile_size, tile_stride, block_rows, X_roi, Y_roi
+        )
 
-            # Generate the supertile loading order
-            tiles = []
-            y_tile_list = list(
-                range(0, self.Y + xypad[0][1], self._TILE_SIZE * y_tile_dim)
-            )
-            if y_tile_list[-1] != self._TILE_SIZE * y_tile_dim:
-                y_tile_list.append(self._TILE_SIZE * y_tile_dim)
-            if y_tile_list[0] != xypad[0][0]:
-                y_tile_list[0] = -xypad[0][0]
-            x_tile_list = list(
-                range(0, self.X + xypad[1][1], self._TILE_SIZE * x_tile_dim)
-            )
-            if x_tile_list[-1] < self.X + xypad[1][1]:
-                x_tile_list.append(x_tile_list[-1] + self._TILE_SIZE)
-            if x_tile_list[0] != xypad[1][0]:
-                x_tile_list[0] = -xypad[1][0]
-            for yi in range(len(y_tile_list) - 1):
-                for xi in range(len(x_tile_list) - 1):
-                    y_range = [y_tile_list[yi], y_tile_list[yi + 1]]
-                    x_range = [x_tile_list[xi], x_tile_list[xi + 1]]
-                    tiles.append([x_range, y_range])
-                    self._supertile_index.put((x_range, y_range, [0, 1], [0], [0]))
-
-            # Start the thread pool and start loading the first supertile
-            thread_pool = ThreadPoolExecutor(self._max_workers)
-            self._fetch_thread = thread_pool.submit(self._fetch)
-
-            # generate the indices for each tile
-            # TODO: modify this to grab more than just the first z-index
-            X = []
-            Y = []
-            Z = []
-            C = []
-            T = []
-            x_list = numpy.array(numpy.arange(-xypad[1][0], self.X, tile_stride[1]))
-            y_list = numpy.array(numpy.arange(-xypad[0][0], self.Y, tile_stride[0]))
-            for x in x_list:
-                for y in y_list:
-                    X.append([x, x + tile_size[1]])
-                    Y.append([y, y + tile_size[0]])
-                    Z.append([0, 1])
-                    C.append(channels)
-                    T.append([0])
+        # Columns of band b are stored in the buffer after those of band b - 1,
+        # so the buffer only ever moves forwards
+        x_end = x_list[-1] + tile_size[1]
+        band_cols = x_end - x_list[0]
+
+        # Initialize the pixel buffer, covering the height of a band, as a ring
+        # of columns followed by a halo for tiles that wrap around it
+        halo = tile_size[1] - 1
+        pixels = numpy.zeros(
+            (
+                band_rows,
+                2 * block_cols + tile_size[1] + halo,
+                len(zs),
+                len(channels),
+                len(ts),
+            ),
+            dtype=self.dtype,
+        )
+
+        # Read ahead as many supertiles as requested, or as fit in the budget
+        if prefetch_bytes is not None:
+            supertile_bytes = pixels.nbytes // pixels.shape[1] * block_cols
+            prefetch = max(1, prefetch_bytes // supertile_bytes)
+        assert prefetch >= 1, "prefetch must be at least 1."
+
+        buffer = SupertileBuffer(
+            pixels,
+            x_offset=x_list[0],
+            y_offset=0,
+            z=zs,
+            t=ts,
+            depth=prefetch,
+            executor=ThreadPoolExecutor(min(prefetch, self._max_workers)),
+            halo=halo,
+        )
+
+        # Supertiles are a band high and block_size[1] columns wide
+        for band in bands:
+            y_range = [band[0], band[0] + band_rows]
+            for x in range(x_list[0], x_end, block_cols):
+                x_range = [x, min(x + block_cols, x_end)]
+                buffer.supertile_index.put((x_range, y_range, zs, channels, ts))
 
+        # generate the indices for each tile, and where it is in the buffer
+        X = []
+        Y = []
+        Z = []
+        C = []
+        T = []
+        buffer_x = []
+        buffer_y = []
+        for b, band in enumerate(bands):
+            for x in x_list:
+                for y in band:
+                    for z, t in planes:
+                        X.append([x, x + tile_size[1]])
+                        Y.append([y, y + tile_size[0]])
+                        Z.append([z, z + 1])
+                        C.append(channels)
+                        T.append([t])
+                        x_band = x + b * band_cols
+                        buffer_x.append([x_band, x_band + tile_size[1]])
+                        buffer_y.append([y - band[0], y - band[0] + tile_size[0]])
+
+        # Supertiles are read by the buffer executor, while tiles are cut
+        # from the pixel buffer by another thread
+        tile_pool = ThreadPoolExecutor(1)
+        self._prefetch(buffer)
+
+        try:
             # Set up batches
             batches = list(range(0, len(X), batch_size))
 
             # get the first batch
             b = min([batch_size, len(X)])
             index = (X[0:b], Y[0:b], Z[0:b], C[0:b], T[0:b])
-            images = self._get_tiles(*index)
+            images = self._get_tiles(
+                buffer, buffer_x[0:b], buffer_y[0:b], *index[2:], copy=copy
+            )
+            keep = buffer_x[0][0]
 
             # start looping through batches
             for bn in batches[1:]:
-                # start the thread to get the next batch
+                # start the thread to get the next batch, keeping the pixels
+                # of the current batch in the buffer
                 b = min([bn + batch_size, len(X)])
-                self._tile_thread = thread_pool.submit(
-                    self._get_tiles, X[bn:b], Y[bn:b], Z[bn:b], C[bn:b], T[bn:b]
+                tile_thread = tile_pool.submit(
+                    self._get_tiles,
+                    buffer,
+                    buffer_x[bn:b],
+                    buffer_y[bn:b],
+                    Z[bn:b],
+                    C[bn:b],
+                    T[bn:b],
+                    keep=keep,
+                    copy=copy,
                 )
 
-                # Load another supertile if possible
-                if (
-                    self._supertile_index.qsize() > 0
-                    and not self._fetch_thread.running()
-                ):
-                    self._fetch_thread = thread_pool.submit(self._fetch)
-
                 # return the current set of images
                 yield images, index
 
                 # get the images from the thread
                 index = (X[bn:b], Y[bn:b], Z[bn:b], C[bn:b], T[bn:b])
-                images = self._tile_thread.result()
-
-            thread_pool.shutdown()
+                images = tile_thread.result()
+                keep = buffer_x[bn][0]
 
             # return the last set of images
             yield images, index
 
+        finally:
+            # Stop reading supertiles that are no longer needed
+            tile_pool.shutdown()
+            while not buffer.raw_buffer.empty():
+                buffer.raw_buffer.get().cancel()
+            buffer.executor.shutdown()
+
+    async def aiter_tiles(
+        self,
+        tile_size: typing.Union[list, tuple],
+        tile_stride: typing.Union[list, tuple, None] = None,
+        batch_size: typing.Optional[int] = None,
+        channels: typing.Union[int, typing.List[int]] = [0],
+        z: typing.Union[int, typing.List[int]] = 0,
+        t: typing.Union[int, typing.List[int]] = 0,
+        prefetch: int = 2,
+        prefetch_bytes: typing.Optional[int] = None,
+        copy: bool = True,
+        block_size: typing.Union[list, tuple, None] = None,
+        x: typing.Union[list, tuple, None] = None,
+        y: typing.Union[list, tuple, None] = None,
+    ) -> typing.AsyncIterator[typing.Tuple[numpy.ndarray, tuple]]:
+        """Asynchronously iterate through tiles of an image.
+
+        This yields the same batches of tiles as calling the BioReader with the
+        same arguments, but reads them with :attr:`~.aread`, so ``async for``
+        loops do not block the event loop. The tiles of a batch are read
+        concurrently, and the next batches are read while the current one is
+        processed.
+
+        Args:
+            tile_size: A list/tuple of length 2, indicating the height and width
+                of the tiles to return.
+            tile_stride: A list/tuple of length 2, indicating the row and column
+                stride size. If None, then tile_stride = tile_size. *Defaults to
+                None.*
+            batch_size: Number of tiles to return on each iteration. *Defaults
+                to None, which is the same as calling the BioReader.*
+            channels: The channel or list of channels to load. *Defaults to
+                [0].*
+            z: The z-slice or list of z-slices to load. *Defaults to 0.*
+            t: The timepoint or list of timepoints to load. *Defaults to 0.*
+            prefetch: Number of batches to read ahead. *Defaults to 2.*
+            prefetch_bytes: If given, read ahead as many batches as fit in this
+                number of bytes, and at least one. This overrides
+                ``prefetch``. *Defaults to None.*
+            copy: If False, the arrays of batches are reused, so a batch is only
+                valid until the next batch is requested. *Defaults to True.*
+            block_size: A list/tuple of length 2, which sets the order of the
+                tiles as when calling the BioReader. *Defaults to None.*
+            x: The (min,max) range of columns to iterate over. *Defaults to
+                None, which is every column.*
+            y: The (min,max) range of rows to iterate over. *Defaults to None,
+                which is every row.*
+
+        Returns:
+            An asynchronous iterator of tuples containing a 4-d numpy array and
+            a tuple containing a list of X,Y,Z,C,T indices. The numpy array has
+            dimensions ``[tile_num,tile_size[0],tile_size[1],channels]``
+
+        Example:
+            .. code:: python
+
+                async for tiles, ind in br.aiter_tiles(tile_size=[256, 256]):
+                    await process(tiles)
+        """
+        tile_stride, batch_size, channels, zs, ts, block_size, X_roi, Y_roi = (
+            self._iter_args(
+                tile_size, tile_stride, batch_size, channels, z, t, block_size, x, y
+            )
+        )
+        planes = [(z, t) for t in ts for z in zs]
+        x_list, bands, _ = self._tile_layout(
+            tile_size, tile_stride, block_size[0], X_roi, Y_roi
+        )
+        positions = [
+            (x, y, z, t)
+            for band in bands
+            for x in x_list
+            for y in band
+            for z, t in planes
+        ]
+
+        # Read ahead as many batches as requested, or as fit in the budget
+        shape = (batch_size, tile_size[0], tile_size[1], len(channels))
+        if prefetch_bytes is not None:
+            batch_bytes = int(numpy.prod(shape)) * numpy.dtype(self.dtype).itemsize
+            prefetch = max(1, prefetch_bytes // batch_bytes)
+        assert prefetch >= 1, "prefetch must be at least 1."
+
+        # Without copies, the batch being processed and those being read ahead
+        # are stored in a ring of arrays
+        ring = None
+        if not copy:
+            ring = [numpy.empty(shape, dtype=self.dtype) for _ in range(prefetch + 1)]
+
+        async def read_tile(images, i, x, y, z, t):
+            x0, x1 = max(x, 0), min(x + tile_size[1], self.X)
+            y0, y1 = max(y, 0), min(y + tile_size[0], self.Y)
+            await self.aread(
+                X=[x0, x1],
+                Y=[y0, y1],
+                Z=[z, z + 1],
+                C=channels,
+                T=[t],
+                out=images[i, y0 - y : y1 - y, x0 - x : x1 - x, numpy.newaxis],
+            )
+
+        async def read_batch(bn):
+            batch = positions[bn * batch_size : (bn + 1) * batch_size]
+
+            # tiles are padded with zeros outside of the image
+            if ring is None:
+                images = numpy.zeros(
+                    (len(batch),) + shape[1:],
+                    dtype=self.dtype,
+                )
+            else:
+                images = ring[bn % len(ring)][: len(batch)]
+                images.fill(0)
+            await asyncio.gather(
+                *(read_tile(images, i, *tile) for i, tile in enumerate(batch))
+            )
+            index = (
+                [[x, x + tile_size[1]] for x, _, _, _ in batch],
+                [[y, y + tile_size[0]] for _, y, _, _ in batch],
+                [[z, z + 1] for _, _, z, _ in batch],
+                [channels] * len(batch),
+                [[t] for _, _, _, t in batch],
+            )
+            return images, index
+
+        num_batches = -(-len(positions) // batch_size)
+        pending = collections.deque(
+            asyncio.ensure_future(read_batch(bn))
+            for bn in range(min(prefetch, num_batches))
+        )
+        try:
+            for bn in range(num_batches):
+                images, index = await pending.popleft()
+                if bn + prefetch < num_batches:
+                    pending.append(asyncio.ensure_future(read_batch(bn + prefetch)))
+                yield images, index
+        finally:
+            for task in pending:
+                task.cancel()
+
     @classmethod
     def image_size(cls, filepath: Path):  # NOQA: C901
         """image_size Read image width and height from header.
@@ -1061,6 +1616,16 @@ class BioWriter(BioBase):
         backend: typing.Optional[str] = None,
         metadata: typing.Union[ome_types.model.OME, None] = None,
         image: typing.Union[numpy.ndarray, None] = None,
+        executor: str = "thread",
+        compression: str = "deflate",
+        compression_level: typing.Optional[int] = None,
+        predictor: bool = False,
+        max_pending_tiles: typing.Optional[int] = None,
+        pyramid_levels: int = 0,
+        downsample: str = "mean",
+        chunks: typing.Union[typing.Tuple[int, int, int, int, int], str, None] = None,
+        chunk_bytes: typing.Optional[int] = None,
+        shards: typing.Optional[typing.Tuple[int, int, int, int, int]] = None,
         **kwargs,
     ) -> None:
         """Initialize a BioWriter.
@@ -1075,6 +1640,55 @@ class BioWriter(BioBase):
             image: The metadata will be set based on the dimensions and data
                 type of the numpy array specified by this keyword argument.
                 Ignored if metadata is specified. *Defaults to None.*
+            executor: Encode tiles in a pool of ``"thread"`` or ``"process"``
+                workers. Only used by the ``python`` backend.
+                *Defaults to "thread".*
+            compression: Lossless compression of the tiles, one of ``"none"``,
+                ``"deflate"``, ``"lzw"``, ``"packbits"``, ``"lzma"``, ``"zstd"``,
+                ``"jpegxl"`` or ``"jpeg2000"``. Only used by the ``python``
+                backend. *Defaults to "deflate".*
+            compression_level: Compression level of ``deflate``, ``lzma`` and
+                ``zstd``, or the effort of ``jpegxl``. *Defaults to the fastest
+                level for deflate and zstd, and the codec default otherwise.*
+            predictor: Apply the horizontal differencing predictor, or the
+                floating point predictor for float images, before compressing.
+                This often shrinks smooth images but slows down both reading and
+                writing. *Defaults to False.*
+            max_pending_tiles: Maximum number of tiles being encoded at once by
+                the ``python`` backend. Tiles are written to the file in raster
+                order, and memory used by a write is bounded by this many tiles
+                no matter how large the image is. *Defaults to twice
+                max_workers.*
+            pyramid_levels: Number of sub-resolution levels to write, each half
+                the size of the previous one. The python backend stores them as
+                SubIFDs of every plane, the zarr and zarr3 backends as the
+                datasets of an OME-NGFF multiscale image. Levels are built while
+                the full resolution tiles are written, so the image is never
+                held in memory. Read a level with ``BioReader(..., level=n)``.
+                *Defaults to 0.*
+            downsample: How sub-resolution pixels are computed from 2x2 blocks,
+                one of ``"mean"``, ``"mode"`` for label images, or
+                ``"nearest"``. *Defaults to "mean".*
+            chunks: The (T, C, Z, Y, X) chunk shape of the ``zarr``, ``zarr3``
+                and ``tensorstore`` backends, or the way the image will mostly
+                be read to pick a chunk shape of about ``chunk_bytes`` bytes:
+                ``"plane"`` for XY planes, ``"volume"`` for 3D blocks and XZ or
+                YZ slabs, ``"column"`` for regions through the whole Z stack,
+                or ``"auto"``. See :func:`bfio.utils.auto_chunks`. For the zarr
+                backends, the Y and X chunk sides must divide the tile size or
+                be multiples of it. Writing part of a chunk rewrites the whole
+                chunk, so write whole chunks at a time when possible.
+                *Defaults to None, one tile of one plane per chunk.*
+            chunk_bytes: The target chunk size in bytes when ``chunks`` is an
+                access pattern. *Defaults to 4 MiB.*
+            shards: Store the chunks of the ``zarr3`` backend in shards of this
+                (T, C, Z, Y, X) shape, using the zarr v3 sharding codec. Every
+                shard is a single file holding many chunks, e.g.
+                ``(1, 1, 1, 8192, 8192)`` for 64 tiles per file or
+                ``(1, 1, Z, 4096, 4096)`` for a tile column through the whole Z
+                stack. Shards must be multiples of the chunks. Writing part of
+                a shard rewrites the whole shard, so write whole shards at a
+                time when possible. *Defaults to None, one file per chunk.*
             kwargs: Most BioWriter object properties can be passed as keyword
                 arguments to initialize the image metadata. If the metadata
                 argument is used, then keyword arguments are ignored.
@@ -1083,8 +1697,53 @@ class BioWriter(BioBase):
             file_path=file_path,
             max_workers=max_workers,
             read_only=False,
+            executor=executor,
         )
 
+        compression = compression.lower()
+        if compression not in backends.TIFF_COMPRESSIONS:
+            raise ValueError(
+                "compression must be one of "
+                + f"{list(backends.TIFF_COMPRESSIONS)}, not {compression!r}"
+            )
+        if (
+            compression_level is not None
+            and backends.TIFF_COMPRESSIONS[compression][1] is None
+        ):
+            raise ValueError(f"{compression} compression does not have a level.")
+        if predictor:
+            backends.tiff_predictor(compression, numpy.uint8)
+        self._compression = compression
+        self._compression_level = compression_level
+        self._predictor = predictor
+        if max_pending_tiles is not None and max_pending_tiles < 1:
+            raise ValueError("max_pending_tiles must be at least 1.")
+        self._max_pending_tiles = max_pending_tiles
+        if pyramid_levels < 0:
+            raise ValueError("pyramid_levels must not be negative.")
+        if downsample not in DOWNSAMPLE_METHODS:
+            raise ValueError(
+                f"downsample must be one of {list(DOWNSAMPLE_METHODS)}, "
+                + f"not {downsample!r}"
+            )
+        self._pyramid_levels = pyramid_levels
+        self._downsample = downsample
+        if isinstance(chunks, str):
+            if chunks not in CHUNK_ACCESS_PATTERNS:
+                raise ValueError(
+                    f"chunks must be a shape or one of {list(CHUNK_ACCESS_PATTERNS)}"
+                    + f", not {chunks!r}"
+                )
+        elif chunks is not None:
+            chunks = self._val_block_shape(chunks, "chunks")
+        if chunk_bytes is not None and chunk_bytes < 1:
+            raise ValueError("chunk_bytes must be positive.")
+        self._chunks = chunks
+        self._chunk_bytes = chunk_bytes
+        if shards is not None:
+            shards = self._val_block_shape(shards, "shards")
+        self._shards = shards
+
         if metadata:
             assert metadata.__class__.__name__ == "OME"
             self._metadata = metadata.model_copy(deep=True)
@@ -1125,6 +1784,35 @@ class BioWriter(BioBase):
         if kwargs and "append" in kwargs:
             if kwargs["append"] is True:
                 self.append = True
+        if executor == "process" and self._backend_name != "python":
+            self.logger.warning(
+                'executor="process" is only used by the python backend.'
+            )
+            self._executor_type = "thread"
+        if (
+            compression != "deflate" or compression_level is not None or predictor
+        ) and self._backend_name != "python":
+            self.logger.warning(
+                "compression, compression_level and predictor are only used by "
+                + "the python backend."
+            )
+        if pyramid_levels > 0 and self._backend_name not in ["python", "zarr", "zarr3"]:
+            self.logger.warning(
+                "pyramid_levels is only used by the python, zarr and zarr3 backends."
+            )
+        if chunks is not None and self._backend_name not in [
+            "zarr",
+            "zarr3",
+            "tensorstore",
+        ]:
+            self.logger.warning(
+                "chunks is only used by the zarr, zarr3 and tensorstore backends."
+            )
+        if shards is not None and self._backend_name != "zarr3":
+            self.logger.warning("shards is only used by the zarr3 backend.")
+        if not isinstance(chunks, str):
+            # access patterns are checked once the image shape is known
+            self._chunk_shape()
 
         # Ensure backend is supported
         if self._backend_name == "python":
@@ -1335,6 +2023,66 @@ class BioWriter(BioBase):
 
         self.write(value, **ind)
 
+    def _val_block_shape(
+        self, shape: typing.Tuple[int, ...], name: str
+    ) -> typing.Tuple[int, int, int, int, int]:
+        """Validate a chunk or shard shape.
+
+        Args:
+            shape: The (T, C, Z, Y, X) shape.
+            name: The name of the argument, used in error messages.
+
+        Returns:
+            The shape as a tuple of ints.
+        """
+        shape = tuple(shape)
+        if len(shape) != 5 or any(
+            not isinstance(s, (int, numpy.integer)) or s < 1 for s in shape
+        ):
+            raise ValueError(
+                f"{name} must be five positive integers in (T, C, Z, Y, X) "
+                + f"order, not {shape!r}"
+            )
+        return tuple(int(s) for s in shape)
+
+    def _chunk_shape(self) -> typing.Tuple[int, int, int, int, int]:
+        """Get the (T, C, Z, Y, X) chunk shape of zarr and tensorstore images.
+
+        Access patterns are resolved with the image shape at the time the
+        first chunk is written.
+        """
+        if self._chunks is None:
+            chunks = (1, 1, 1, self._TILE_SIZE, self._TILE_SIZE)
+        elif isinstance(self._chunks, str):
+            chunks = auto_chunks(
+                (self.T, self.C, self.Z, self.Y, self.X),
+                self.dtype,
+                self._chunks,
+                self._chunk_bytes or DEFAULT_CHUNK_BYTES,
+            )
+        else:
+            chunks = self._chunks
+
+        if self._backend_name in ["zarr", "zarr3"]:
+            # tiles are written in parallel, so a chunk or shard may not be
+            # shared by two tiles unless it holds both of them entirely
+            for label, shape in [("chunk", chunks), ("shard", self._shards)]:
+                if shape is not None and any(
+                    s % self._TILE_SIZE != 0 and self._TILE_SIZE % s != 0
+                    for s in shape[3:]
+                ):
+                    raise ValueError(
+                        f"The Y and X {label} sides must divide {self._TILE_SIZE} "
+                        + f"or be multiples of it, not {shape[3:]}."
+                    )
+        if self._shards is not None and any(
+            s % c != 0 for s, c in zip(self._shards, chunks)
+        ):
+            raise ValueError(
+                f"shards {self._shards} must be multiples of the chunks {chunks}."
+            )
+        return chunks
+
     def _minimal_xml(self) -> ome_types.model.OME:
         """Generates minimal xml for ome tif initialization.
 
@@ -1463,140 +2211,200 @@ class BioWriter(BioBase):
         if self._backend is not None:
             self._backend.close()
 
-    def _put(self):
+    def _put(self, buffer: SupertileBuffer):
         """_put Method for saving image supertiles.
 
-        This method is intended to be run within a thread, and writes a
-        chunk of the image according to the coordinates in a queue.
-
-        Currently, this function will only write the first Z, C, and T
-        positions regardless of what Z, C, and T coordinate are provided
-        to the function. This function will need to be changed in then
-        future to account for this.
-
-        If the last value in X or Y is larger than the size of the
-        image, then the image is cropped to the appropriate size.
-
-        Input coordinates are read from the _supertile_index Queue object.
-
-        Input data is stored in the _raw_buffer Queue object.
+        This method is intended to be run within a thread, and writes the
+        next supertile in the raw_buffer Queue object at the coordinates
+        in the supertile_index Queue object.
 
         A boolean value is returned to indicate the processed has finished.
-        """
-        image = self._raw_buffer.get()
-        X, Y, Z, C, T = self._supertile_index.get()
 
-        # Attach the jvm to the thread
-        self._backend.attach()
+        Args:
+            buffer: The buffers of the tile iterator.
+        """
+        image = buffer.raw_buffer.get()
+        X, Y, Z, C, T = buffer.supertile_index.get()
 
-        # Write the image
-        self.write(
-            image[: self.num_y(), :, numpy.newaxis, numpy.newaxis, numpy.newaxis],
-            X=[X[0]],
-            Y=[Y[0]],
-        )
+        # Write each z-slice, since the z-slices may not be contiguous
+        for zi, z in enumerate(Z):
+            self.write(image[:, :, zi : zi + 1], X=X[0], Y=Y[0], Z=z, C=C, T=T)
 
         return True
 
-    def _buffer_supertile(self, column_start: int, column_end: int):
-        """_buffer_supertile Process the pixel buffer.
-
-        Give the column indices of the data to process, and determine if
-        the buffer needs to be processed. This method checks to see if
-        data in the buffer can be shifted into the _raw_buffer for writing.
+    def _tile_blocks(
+        self,
+        x: int,
+        y: int,
+        tile_size: typing.Sequence[int],
+        tile_stride: typing.Sequence[int],
+        xypad: typing.Tuple[typing.Tuple[int, int], typing.Tuple[int, int]],
+    ) -> typing.Iterator[typing.Tuple[tuple, tuple, tuple]]:
+        """Split the pixels saved from a tile between the supertiles.
+
+        Only the pixels of a tile that are not padding or shared with the next
+        tile are saved, so the tiles of an iterator save every pixel once.
+        Supertiles are aligned to the tiles of the file.
 
         Args:
-            column_start: First column index of data to be loaded
-            column_end: Last column index of data to be loaded
+            x: The first column of the tile.
+            y: The first row of the tile.
+            tile_size: The height and width of the tiles.
+            tile_stride: The row and column stride of the tiles.
+            xypad: The padding of the image, as returned by
+                :attr:`~._iter_padding`.
 
+        Yields:
+            The (row, column) of the supertile, and the (rows, columns) slices
+            of the pixels in the tile and in the supertile.
         """
-        # If the start column index is outside of the width of the supertile,
-        # write the data and shift the pixels
-        if column_start - self._tile_x_offset >= 1024:
-            self._raw_buffer.put(numpy.copy(self._pixel_buffer[:, 0:1024]))
-            self._pixel_buffer[:, 0:1024] = self._pixel_buffer[:, 1024:2048]
-            self._pixel_buffer[:, 1024:] = 0
-            self._tile_x_offset += 1024
-            self._tile_last_column = numpy.argwhere(
-                (self._pixel_buffer == 0).all(axis=0)
-            )[0, 0]
-
-    def _assemble_tiles(self, images, X, Y, Z, C, T):
-        """_assemble_tiles Handle data untiling.
+        y0 = y + max(xypad[0][0], 0)
+        x0 = x + max(xypad[1][0], 0)
+        y1 = min(y0 + min(tile_size[0], tile_stride[0]), self.Y)
+        x1 = min(x0 + min(tile_size[1], tile_stride[1]), self.X)
+        y0, x0 = max(y0, 0), max(x0, 0)
+        if y0 >= y1 or x0 >= x1:
+            return
+
+        for by in range(y0 - y0 % self._TILE_SIZE, y1, self._TILE_SIZE):
+            r0, r1 = max(y0, by), min(y1, by + self._TILE_SIZE)
+            for bx in range(x0 - x0 % self._TILE_SIZE, x1, self._TILE_SIZE):
+                c0, c1 = max(x0, bx), min(x1, bx + self._TILE_SIZE)
+                yield (by, bx), (slice(r0 - y, r1 - y), slice(c0 - x, c1 - x)), (
+                    slice(r0 - by, r1 - by),
+                    slice(c0 - bx, c1 - bx),
+                )
 
-        This function puts tiles into the _pixel_buffer, effectively
-        untiling them.
+    def _buffer_supertile(
+        self,
+        buffer: SupertileBuffer,
+        supertiles: dict,
+        key: typing.Tuple[int, int],
+        Z: typing.List[int],
+        C: typing.List[int],
+        T: typing.List[int],
+    ):
+        """_buffer_supertile Queue a finished supertile for writing.
+
+        The supertile is moved into the raw_buffer, which blocks while the
+        writer is more than the depth of the raw_buffer behind, and is then
+        written by the buffer executor.
 
         Args:
-            X (list): List of 2-tuples indicating the (min,max)
-                range of pixels to load within a tile.
-            Y (list): List of 2-tuples indicating the (min,max)
-                range of pixels to load within a tile.
-            Z (None): Placeholder, to be implemented.
-            C (None): Placeholder, to be implemented.
-            T (None): Placeholder, to be implemented.
+            buffer: The buffers of the tile iterator.
+            supertiles: The supertiles being assembled, with the number of
+                pixels each is still missing, by (row, column).
+            key: The (row, column) of the supertile to write.
+            Z: The z-slices of the supertile.
+            C: The channels of the supertile.
+            T: The timepoints of the supertile.
 
         Returns:
-            numpy.ndarray: 2-dimensional ndarray.
+            A future of the write.
         """
-        self._buffer_supertile(X[0][0], X[0][1])
+        image, _ = supertiles.pop(key)
+        Y = [key[0], key[0] + image.shape[0]]
+        X = [key[1], key[1] + image.shape[1]]
+        buffer.supertile_index.put((X, Y, Z, C, T))
+        buffer.raw_buffer.put(image)
 
-        if X[-1][0] - self._tile_x_offset > 1024:
-            split_ind = 0
-            while X[split_ind][0] - self._tile_x_offset < 1024:
-                split_ind += 1
-        else:
-            split_ind = len(X)
+        return buffer.executor.submit(self._put, buffer)
 
-        # Untile the data
-        num_tiles = len(X)
+    def _assemble_tiles(self, buffer, supertiles, images, X, Y, Z, C, T, layout):
+        """_assemble_tiles Handle data untiling.
 
-        for ind in range(split_ind):
-            r_min = Y[ind][0] - self._tile_y_offset
-            r_max = Y[ind][1] - self._tile_y_offset
-            c_min = X[ind][0] - self._tile_x_offset
-            c_max = X[ind][1] - self._tile_x_offset
-            self._pixel_buffer[r_min:r_max, c_min:c_max] = images[ind, :, :, 0]
+        This function puts tiles into the supertiles they are saved in,
+        effectively untiling them, and writes every supertile that is
+        complete.
 
-        if split_ind != num_tiles:
-            self._buffer_supertile(X[-1][0], X[-1][1])
-            for ind in range(split_ind, num_tiles):
-                r_min = Y[ind][0] - self._tile_y_offset
-                r_max = Y[ind][1] - self._tile_y_offset
-                c_min = X[ind][0] - self._tile_x_offset
-                c_max = X[ind][1] - self._tile_x_offset
-                self._pixel_buffer[r_min:r_max, c_min:c_max] = images[ind, :, :, 0]
+        Args:
+            buffer (SupertileBuffer): The buffers of the tile iterator.
+            supertiles (dict): The supertiles being assembled, with the
+                number of pixels each is still missing, by (row, column).
+            images (numpy.ndarray): The tiles, with dimensions
+                ``[tile_num,tile_size[0],tile_size[1],channels]``.
+            X (list): The first column of each tile.
+            Y (list): The first row of each tile.
+            Z (list): The z-slice of each tile.
+            C (list): The channels of the tiles.
+            T (list): The timepoint of each tile.
+            layout (tuple): The tile_size, tile_stride and padding of the
+                tiles.
 
-        self._tile_last_column = c_max
+        Returns:
+            list: Futures of the supertiles being written.
+        """
+        Zs = list(buffer.z_index)
+        Ts = list(buffer.t_index)
+
+        writes = []
+        for image, x, y, z, t in zip(images, X, Y, Z, T):
+            zi, ti = buffer.z_index[z], buffer.t_index[t]
+            for key, tile, block in self._tile_blocks(x, y, *layout):
+                pixels = supertiles[key]
+                if pixels[0] is None:
+                    pixels[0] = numpy.zeros(
+                        (
+                            min(self._TILE_SIZE, self.Y - key[0]),
+                            min(self._TILE_SIZE, self.X - key[1]),
+                            len(Zs),
+                            images.shape[-1],
+                            len(Ts),
+                        ),
+                        dtype=self.dtype,
+                    )
+                pixels[0][block + (zi, slice(None), ti)] = image[tile]
+                pixels[1] -= (block[0].stop - block[0].start) * (
+                    block[1].stop - block[1].start
+                )
+                if pixels[1] == 0:
+                    writes.append(
+                        self._buffer_supertile(buffer, supertiles, key, Zs, C, Ts)
+                    )
 
-        return True
+        return writes
 
-    def _writerate(
+    def _writerate(  # NOQA: C901
         self,
         tile_size: typing.Union[typing.List, typing.Tuple],
         tile_stride: typing.Union[typing.List, typing.Tuple, None] = None,
-        batch_size=None,
-        channels=[0],
+        batch_size: typing.Union[int, None] = None,
+        channels: typing.Union[int, typing.List[int]] = [0],
+        z: typing.Union[int, typing.List[int]] = 0,
+        t: typing.Union[int, typing.List[int]] = 0,
+        prefetch: int = 2,
+        block_size: typing.Union[list, tuple, None] = None,
     ):
         """Writerate Image saving iterator.
 
         This method is an iterator to save tiles of an image. This method
         buffers the saving of pixels asynchronously to quickly save
-        images to disk. It is designed to work in complement to the
-        BioReader.iterate method, and expects images to be fed into it in
-        the exact same order as they would come out of that method.
+        images to disk. It is designed to work in complement to calling a
+        BioReader, and expects images to be fed into it in the exact same
+        order as they would come out of it with the same arguments.
+
+        Only the pixels of each tile that are not padding or shared with the
+        next tile are saved. Pixels are assembled into supertiles aligned to
+        the tiles of the file, and each supertile is written as soon as all
+        of its pixels were sent.
 
         Data is sent to this iterator using the send() method once the
         iterator has been created. See the example for more information.
 
         Args:
             tile_size: A list/tuple of length 2, indicating the height and width
-                of the tiles to return.
+                of the tiles to save.
             tile_stride: A list/tuple of length 2, indicating the row and column
                 stride size. If None, then tile_stride = tile_size. Defaults to None.
-            batch_size: Number of tiles to return on each iteration. Defaults to 32.
-            channels: A placeholder. Only the first channel is ever loaded.
-                Defaults to [0].
+            batch_size: Unused, since the number of tiles in each batch is taken
+                from the tiles sent. Defaults to None.
+            channels: The channel or list of channels to save. Defaults to [0].
+            z: The z-slice or list of z-slices to save. Defaults to 0.
+            t: The timepoint or list of timepoints to save. Defaults to 0.
+            prefetch: Number of supertiles waiting to be written before sending
+                tiles blocks. Defaults to 2.
+            block_size: The block_size the tiles were read with. Defaults to
+                None.
 
         Yields:
             Nothing
@@ -1606,53 +2414,33 @@ class BioWriter(BioBase):
             import numpy as np
 
             # Create the BioReader
-            br = bfio.BioReader('/path/to/file')
+            br = BioReader('/path/to/file')
 
             # Create the BioWriter
             out_path = '/path/to/output'
-            bw = bfio.BioWriter(out_path,metadata=br.read_metadata())
-
-            # Get the batch size
-            batch_size = br.maximum_batch_size(
-                tile_size=[256,256],tile_stride=[256,256]
-            )
-            readerator = br.iterate(
-                tile_size=[256,256],tile_stride=[256,256],batch_size=batch_size
-            )
-            writerator = bw.writerate(
-                tile_size=[256,256],tile_stride=[256,256],batch_size=batch_size
-            )
+            bw = BioWriter(out_path,metadata=br.metadata)
 
             # Initialize the writerator
+            writerator = bw._writerate(tile_size=[256,256],tile_stride=[256,256])
             next(writerator)
 
-            # Load tiles of the imgae and save them
-            for images,indices in readerator:
+            # Load tiles of the image and save them
+            for images,indices in br(tile_size=[256,256],tile_stride=[256,256]):
                 writerator.send(images)
-            bw.close_image()
+            bw.close()
 
             # Verify images are the same
-            original_image = br.read_image()
-            bw = bfio.BioReader(out_path)
-            saved_image = bw.read_image()
+            original_image = br.read()
+            with BioReader(out_path) as saved:
+                saved_image = saved.read()
 
             print(
                 'Original and saved images are the same: {}'.format(
-                    numpy.array_equal(original_image,saved_image)
+                    np.array_equal(original_image,saved_image)
                 )
             )
 
         """
-        # Enure that the number of tiles does not exceed the width of a supertile
-        if batch_size is None:
-            batch_size = min([32, self.maximum_batch_size(tile_size, tile_stride)])
-        else:
-            assert batch_size <= self.maximum_batch_size(
-                tile_size, tile_stride
-            ), "batch_size must be less than or equal to {}.".format(
-                self.maximum_batch_size(tile_size, tile_stride)
-            )
-
         # input error checking
         assert len(tile_size) == 2, "tile_size must be a list with 2 elements"
         if tile_stride is not None:
@@ -1660,124 +2448,90 @@ class BioWriter(BioBase):
         else:
             tile_stride = tile_size
 
-        # calculate unpadding
-        if not (set(tile_size) & set(tile_stride)):
-            xyoffset = [
-                int((tile_size[0] - tile_stride[0]) / 2),
-                int((tile_size[1] - tile_stride[1]) / 2),
-            ]
-            xypad = [
-                (tile_size[0] - tile_stride[0]) / 2,
-                (tile_size[1] - tile_stride[1]) / 2,
-            ]
-            xypad[0] = (
-                xyoffset[0]
-                + (tile_stride[0] - numpy.mod(self.num_y(), tile_stride[0])) / 2
-            )
-            xypad[1] = (
-                xyoffset[1]
-                + (tile_stride[1] - numpy.mod(self.num_x(), tile_stride[1])) / 2
-            )
-            xypad = (
-                (int(xyoffset[0]), int(2 * xypad[0] - xyoffset[0])),
-                (int(xyoffset[1]), int(2 * xypad[1] - xyoffset[1])),
-            )
-        else:
-            xyoffset = [0, 0]
-            xypad = (
-                (0, max([tile_size[0] - tile_stride[0], 0])),
-                (0, max([tile_size[1] - tile_stride[1], 0])),
-            )
-
-        # determine supertile sizes
-        y_tile_dim = int(numpy.ceil((self.num_y() - 1) / 1024))
-        x_tile_dim = 1
-
-        # Initialize the pixel buffer
-        self._pixel_buffer = numpy.zeros(
-            (y_tile_dim * 1024 + tile_size[0], 2 * x_tile_dim * 1024 + tile_size[1]),
-            dtype=self.pixel_type(),
+        channels = [channels] if isinstance(channels, int) else list(channels)
+        zs = [z] if isinstance(z, int) else list(z)
+        ts = [t] if isinstance(t, int) else list(t)
+        self._val_ct(channels, "C")
+        self._val_ct(ts, "T")
+        assert len(zs) != 0, "At least one z-index must be selected."
+        assert all(
+            0 <= z < self.Z for z in zs
+        ), f"The z-indices must be between 0 and {self.Z - 1}."
+        planes = [(z, t) for t in ts for z in zs]
+        assert prefetch >= 1, "prefetch must be at least 1."
+
+        # Lay out the tiles in the order the BioReader returns them
+        if block_size is None:
+            block_size = (4 * self._TILE_SIZE, self._TILE_SIZE)
+        assert len(block_size) == 2, "block_size must be a list with 2 elements"
+        x_list, bands, _ = self._tile_layout(
+            tile_size, tile_stride, block_size[0], [0, self.X], [0, self.Y]
         )
-        self._tile_x_offset = 0
-        self._tile_y_offset = 0
-
-        # Generate the supertile saving order
-        tiles = []
-        y_tile_list = list(range(0, self.num_y(), 1024 * y_tile_dim))
-        if y_tile_list[-1] != 1024 * y_tile_dim:
-            y_tile_list.append(1024 * y_tile_dim)
-        x_tile_list = list(range(0, self.num_x(), 1024 * x_tile_dim))
-        if x_tile_list[-1] < self.num_x() + xypad[1][1]:
-            x_tile_list.append(x_tile_list[-1] + 1024)
-
-        for yi in range(len(y_tile_list) - 1):
-            for xi in range(len(x_tile_list) - 1):
-                y_range = [y_tile_list[yi], y_tile_list[yi + 1]]
-                x_range = [x_tile_list[xi], x_tile_list[xi + 1]]
-                tiles.append([x_range, y_range])
-                self._supertile_index.put((x_range, y_range, [0, 1], [0], [0]))
-
-        # Start the thread pool and start loading the first supertile
-        thread_pool = ThreadPoolExecutor(self._max_workers)
+        xypad = self._iter_padding(tile_size, tile_stride)
+        layout = (tile_size, tile_stride, xypad)
 
         # generate the indices for each tile
-        # TODO: modify this to grab more than just the first z-index
         X = []
         Y = []
         Z = []
-        C = []
         T = []
-        x_list = numpy.array(numpy.arange(0, self.num_x(), tile_stride[1]))
-        y_list = numpy.array(numpy.arange(0, self.num_y(), tile_stride[0]))
-        for x in x_list:
-            for y in y_list:
-                X.append([x, x + tile_stride[1]])
-                Y.append([y, y + tile_stride[0]])
-                Z.append([0, 1])
-                C.append(channels)
-                T.append([0])
-
-        # start looping through batches
-        bn = 0
-        while bn < len(X):
-            # Wait for tiles to be sent
-            images = yield
-
-            # Wait for the last untiling thread to finish
-            if self._tile_thread is not None:
-                self._tile_thread.result()
-
-            # start a thread to untile the data
-            b = bn + images.shape[0]
-            self._tile_thread = thread_pool.submit(
-                self._assemble_tiles,
-                images,
-                X[bn:b],
-                Y[bn:b],
-                Z[bn:b],
-                C[bn:b],
-                T[bn:b],
-            )
-            bn = b
+        for band in bands:
+            for x in x_list:
+                for y in band:
+                    for z, t in planes:
+                        X.append(x)
+                        Y.append(y)
+                        Z.append(z)
+                        T.append(t)
+
+        # Count the pixels each supertile needs before it is written. The
+        # pixels of a supertile are only allocated once a tile reaches it.
+        supertiles = {}
+        for band in bands:
+            for x in x_list:
+                for y in band:
+                    for key, _, block in self._tile_blocks(x, y, *layout):
+                        supertiles.setdefault(key, [None, 0])[1] += (
+                            (block[0].stop - block[0].start)
+                            * (block[1].stop - block[1].start)
+                            * len(planes)
+                        )
 
-            # Save a supertile if a thread is available
-            if self._raw_buffer.qsize() > 0:
-                if self._put_thread is not None:
-                    self._put_thread.result()
-                self._put_thread = thread_pool.submit(self._put)
+        # Supertiles are written in order by a single thread
+        buffer = SupertileBuffer(
+            None, z=zs, t=ts, depth=prefetch, executor=ThreadPoolExecutor(1)
+        )
+        writes = []
 
-        # Wait for the final untiling thread to finish
-        self._tile_thread.result()
+        try:
+            # start looping through batches
+            bn = 0
+            while bn < len(X):
+                # Wait for tiles to be sent
+                images = yield
+
+                b = bn + images.shape[0]
+                writes.extend(
+                    self._assemble_tiles(
+                        buffer,
+                        supertiles,
+                        images,
+                        X[bn:b],
+                        Y[bn:b],
+                        Z[bn:b],
+                        channels,
+                        T[bn:b],
+                        layout,
+                    )
+                )
+                writes = [w for w in writes if not w.done() or w.result()]
+                bn = b
 
-        # Put the remaining pixels in the buffer into the _raw_buffer
-        self._raw_buffer.put(
-            self._pixel_buffer[:, 0 : self.num_x() - self._tile_x_offset]
-        )
+            # Wait for the supertiles to be written
+            for write in writes:
+                write.result()
 
-        # Save the last supertile
-        if self._put_thread is not None:
-            self._put_thread.result()  # wait for the previous thread to finish
-        self._put()  # no need to use a thread for final save
+        finally:
+            buffer.executor.shutdown()
 
-        thread_pool.shutdown()
         yield
@@ -268,16 +268,18 @@ class TensorstoreReader(bfio.base_classes.TSAbstractReader):
         cols = Seq(X[0], X[-1] - 1, 1)
         rows = Seq(Y[0], Y[-1] - 1, 1)
         layers = Seq(Z[0], Z[-1] - 1, 1)
-        if len(C) == 1:
-            channels = Seq(C[0], C[0], 1)
-        else:
-            channels = Seq(C[0], C[-1], 1)
-        if len(T) == 1:
-            tsteps = Seq(T[0], T[0], 1)
-        else:
-            tsteps = Seq(T[0], T[-1], 1)
+        channels = Seq(min(C), max(C), 1)
+        tsteps = Seq(min(T), max(T), 1)
+
+        data = self._rdr.data(rows, cols, layers, channels, tsteps)
+
+        # Select the requested channels and timepoints from the ranges read
+        if list(T) != list(range(min(T), max(T) + 1)):
+            data = data[[t - min(T) for t in T]]
+        if list(C) != list(range(min(C), max(C) + 1)):
+            data = data[:, [c - min(C) for c in C]]
 
-        return self._rdr.data(rows, cols, layers, channels, tsteps)
+        return data
 
     def close(self):
         pass
@@ -428,7 +430,7 @@ class TensorstoreWriter(bfio.base_classes.TSAbstractWriter):
         self._writer = TSWriter(
             str(self.frontend._file_path.joinpath("0").resolve()),
             shape,
-            (1, 1, 1, self.frontend._TILE_SIZE, self.frontend._TILE_SIZE),
+            self.frontend._chunk_shape(),
             self.frontend.dtype,
             "TCZYX",
             file_type,
@@ -490,7 +492,12 @@ class TensorstoreWriter(bfio.base_classes.TSAbstractWriter):
             tsteps = Seq(T[0], T[-1], 1)
 
         self._writer.write_image_data(
-            image.flatten(), rows, cols, layers, channels, tsteps
+            image.transpose(4, 3, 2, 0, 1).flatten(),
+            rows,
+            cols,
+            layers,
+            channels,
+            tsteps,
         )
 
     def close(self):
@@ -10,6 +10,8 @@ from typing import Optional
 # Third party packages
 import re
 
+import numpy
+
 from xml.etree import ElementTree as ET
 from xsdata.utils.dates import DateTimeParser
 
@@ -495,3 +497,124 @@ def detect_zarr_format(path):
         pass
 
     return 0
+
+
+DOWNSAMPLE_METHODS = ("mean", "mode", "nearest")
+
+
+def downsample(image: numpy.ndarray, method: str = "mean") -> numpy.ndarray:
+    """Downsample the first two dimensions of an image by a factor of 2.
+
+    Every output pixel is computed from a 2x2 block of input pixels. Images with
+    an odd height or width are padded by repeating their last row or column, so
+    the output has shape ``(ceil(Y / 2), ceil(X / 2), ...)``.
+
+    Args:
+        image: The image to downsample, with Y and X as the first dimensions.
+        method: How to reduce each 2x2 block. ``"mean"`` averages the pixels and
+            rounds integers, ``"mode"`` takes the most common value, which
+            suits label images, and ``"nearest"`` takes the top left pixel.
+            *Defaults to "mean".*
+
+    Returns:
+        The downsampled image, with the same data type as the input.
+    """
+    if method not in DOWNSAMPLE_METHODS:
+        raise ValueError(
+            f"method must be one of {list(DOWNSAMPLE_METHODS)}, not {method!r}"
+        )
+
+    if method == "nearest":
+        return image[::2, ::2]
+
+    pad = [(0, image.shape[0] % 2), (0, image.shape[1] % 2)]
+    if pad[0][1] or pad[1][1]:
+        image = numpy.pad(image, pad + [(0, 0)] * (image.ndim - 2), mode="edge")
+    blocks = [image[i::2, j::2] for i in range(2) for j in range(2)]
+
+    if method == "mean":
+        mean = blocks[0].astype(numpy.float64)
+        for block in blocks[1:]:
+            mean += block
+        mean /= 4
+        if image.dtype.kind in "iub":
+            numpy.rint(mean, out=mean)
+        return mean.astype(image.dtype)
+
+    # count how often each pixel of the block appears, ties go to the first
+    counts = [sum((a == b).astype(numpy.uint8) for b in blocks) for a in blocks]
+    best = numpy.argmax(numpy.stack(counts), axis=0)
+    return numpy.choose(best, blocks)
+
+
+CHUNK_ACCESS_PATTERNS = ("auto", "plane", "volume", "column")
+
+# Chunks of a few megabytes keep both the number of files and the overhead of
+# reading a small region low
+DEFAULT_CHUNK_BYTES = 2**22
+
+
+def _power_of_two(value: float) -> int:
+    """Get the largest power of two that is not larger than value, at least 1."""
+    return 2 ** max(int(numpy.floor(numpy.log2(max(value, 1)))), 0)
+
+
+def _covering_power_of_two(value: int) -> int:
+    """Get the smallest power of two that is not smaller than value, at least 1."""
+    return 2 ** max(int(numpy.ceil(numpy.log2(max(value, 1)))), 0)
+
+
+def auto_chunks(
+    shape: tuple,
+    dtype: numpy.dtype,
+    access: str = "auto",
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+) -> tuple:
+    """Pick a zarr chunk shape for an image and the way it will be read.
+
+    The Y and X chunk sides are powers of two, so chunks line up with the
+    1024 pixel tiles written by bfio, and a chunk holds at most
+    ``chunk_bytes`` bytes unless a single row of the pattern is larger. On
+    images that are smaller than a chunk, the Y and X sides are the smallest
+    power of two covering the image, and zarr stores the partial edge chunks.
+
+    Args:
+        shape: The (T, C, Z, Y, X) shape of the image.
+        dtype: The pixel type of the image.
+        access: How the image will mostly be read. ``"plane"`` for XY planes,
+            ``"volume"`` for 3D blocks and XZ or YZ slabs, ``"column"`` for
+            regions through the whole Z stack, or ``"auto"`` for ``"plane"``
+            if the image has a single Z plane and ``"volume"`` otherwise.
+            *Defaults to "auto".*
+        chunk_bytes: The target size of a chunk in bytes.
+            *Defaults to 4 MiB.*
+
+    Returns:
+        The (T, C, Z, Y, X) chunk shape.
+    """
+    if access not in CHUNK_ACCESS_PATTERNS:
+        raise ValueError(
+            f"access must be one of {list(CHUNK_ACCESS_PATTERNS)}, not {access!r}"
+        )
+    if chunk_bytes < 1:
+        raise ValueError("chunk_bytes must be positive.")
+
+    T, C, Z, Y, X = shape
+    if access == "auto":
+        access = "plane" if Z == 1 else "volume"
+
+    pixels = chunk_bytes / numpy.dtype(dtype).itemsize
+    if access == "plane":
+        z = 1
+    elif access == "volume":
+        z = min(_power_of_two(numpy.cbrt(pixels)), Z)
+    else:
+        z = Z
+
+    # give any pixels left by small images to the other dimension
+    Y, X = _covering_power_of_two(Y), _covering_power_of_two(X)
+    y = min(_power_of_two(numpy.sqrt(pixels / z)), Y)
+    x = min(_power_of_two(pixels / (z * y)), X)
+    y = min(_power_of_two(pixels / (z * x)), Y)
+
+    return (1, 1, max(z, 1), max(y, 1), max(x, 1))
@@ -0,0 +1,1054 @@
+# -*- coding: utf-8 -*-
+"""Tests for the python (tifffile) backend using unittest."""
+
+import pickle
+import tempfile
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy
+import tifffile
+
+from bfio import BioReader, BioWriter
+from bfio.base_classes import SupertileBuffer
+from bfio.utils import downsample
+
+
+def write_test_image(path, image):
+    """Write a 5D (Y, X, Z, C, T) array to an OME tiled tiff."""
+    with BioWriter(
+        path,
+        X=image.shape[1],
+        Y=image.shape[0],
+        Z=image.shape[2],
+        C=image.shape[3],
+        T=image.shape[4],
+        dtype=image.dtype,
+    ) as bw:
+        bw[:] = image
+
+
+class TestTileCache(unittest.TestCase):
+    """Test the decoded tile cache of the PythonReader."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.path = Path(cls._tmp.name) / "cache.ome.tif"
+        cls.image = numpy.random.randint(
+            0, 2**16, (2100, 1500, 2, 2, 1), dtype=numpy.uint16
+        )
+        write_test_image(cls.path, cls.image)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmp.cleanup()
+
+    def test_cache_disabled_by_default(self):
+        """cache_info() returns None if no cache_size is given."""
+        with BioReader(self.path, backend="python") as br:
+            self.assertIsNone(br.cache_info())
+
+    def test_cache_hits(self):
+        """Repeated reads are served from the cache."""
+        with BioReader(self.path, backend="python", cache_size=2**30) as br:
+            first = br[:1024, :1024, 0, 1, 0]
+            info = br.cache_info()
+            self.assertEqual(info.hits, 0)
+            self.assertEqual(info.misses, 1)
+
+            second = br[100:200, 100:200, 0, 1, 0]
+            info = br.cache_info()
+            self.assertEqual(info.hits, 1)
+            self.assertEqual(info.misses, 1)
+
+            numpy.testing.assert_array_equal(first[100:200, 100:200], second)
+            numpy.testing.assert_array_equal(br[:], self.image[..., 0])
+
+    def test_cache_evictions(self):
+        """The cache never grows larger than its byte budget."""
+        tile_bytes = 1024 * 1024 * 2
+        with BioReader(self.path, backend="python", cache_size=2 * tile_bytes) as br:
+            numpy.testing.assert_array_equal(
+                br[:, :, 0, 0, 0], self.image[..., 0, 0, 0]
+            )
+            info = br.cache_info()
+            self.assertLessEqual(info.currsize, 2 * tile_bytes)
+            self.assertEqual(info.evictions, info.misses - 2)
+
+            br.cache_clear()
+            self.assertEqual(br.cache_info().currsize, 0)
+
+    def test_cache_pickle(self):
+        """A pickled reader keeps its cache settings."""
+        with BioReader(self.path, backend="python", cache_size=2**30) as br:
+            br2 = pickle.loads(pickle.dumps(br))
+            numpy.testing.assert_array_equal(br2[:], self.image[..., 0])
+            self.assertEqual(br2.cache_info().maxsize, 2**30)
+
+
+class TestPageIndex(unittest.TestCase):
+    """Test the tile offset index of the PythonReader."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.path = Path(cls._tmp.name) / "planes.ome.tif"
+        cls.image = numpy.random.randint(
+            0, 2**8, (1100, 1300, 5, 3, 2), dtype=numpy.uint8
+        )
+        write_test_image(cls.path, cls.image)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmp.cleanup()
+
+    def test_index_shape(self):
+        """The index holds one row of tile offsets per page."""
+        with BioReader(self.path, backend="python") as br:
+            br[:10, :10, 0, 0, 0]
+            self.assertEqual(br._backend._dataoffsets.shape, (5 * 3 * 2, 4))
+            self.assertEqual(br._backend._databytecounts.shape, (5 * 3 * 2, 4))
+
+    def test_random_plane_reads(self):
+        """Planes read in random order match the written data."""
+        planes = [(z, c, t) for z in range(5) for c in range(3) for t in range(2)]
+        numpy.random.shuffle(planes)
+        with BioReader(self.path, backend="python") as br:
+            for z, c, t in planes:
+                numpy.testing.assert_array_equal(
+                    br[1000:1100, 1000:1300, z, c, t],
+                    self.image[1000:1100, 1000:1300, z, c, t],
+                )
+
+
+class TestSidecarIndex(unittest.TestCase):
+    """Test the sidecar index of the PythonReader."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "sidecar.ome.tif"
+        self.image = numpy.random.randint(
+            0, 2**8, (1100, 1300, 4, 2, 1), dtype=numpy.uint8
+        )
+        write_test_image(self.path, self.image)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_sidecar_created(self):
+        """Opening an image with sidecar_index=True writes the sidecar."""
+        with BioReader(self.path, backend="python", sidecar_index=True) as br:
+            numpy.testing.assert_array_equal(br[:], self.image[..., 0])
+        self.assertTrue(self.path.with_name(self.path.name + ".bfidx").exists())
+
+    def test_sidecar_reopen(self):
+        """Reopening an image uses the sidecar and delays parsing metadata."""
+        BioReader(self.path, backend="python", sidecar_index=True).close()
+        with BioReader(self.path, backend="python", sidecar_index=True) as br:
+            self.assertIsNotNone(br._backend._sidecar)
+            self.assertEqual(br.shape, (1100, 1300, 4, 2))
+            self.assertEqual(br.dtype, numpy.uint8)
+            numpy.testing.assert_array_equal(
+                br[:, :, 1:3, 1, 0], self.image[:, :, 1:3, 1, 0]
+            )
+            self.assertIsNone(br._metadata)
+            self.assertEqual(br.metadata.images[0].pixels.size_z, 4)
+
+            br2 = pickle.loads(pickle.dumps(br))
+            numpy.testing.assert_array_equal(br2[:], self.image[..., 0])
+
+    def test_sidecar_level(self):
+        """Reopening a resolution level does not parse the series of the file."""
+        path = Path(self._tmp.name) / "levels.ome.tif"
+        image = self.image[:, :, 0, 0, 0]
+        with BioWriter(path, X=1300, Y=1100, dtype=image.dtype, pyramid_levels=1) as bw:
+            bw[:] = image
+        expected = downsample(image, "mean")
+
+        BioReader(path, backend="python", level=1, sidecar_index=True).close()
+        with BioReader(path, backend="python", level=1, sidecar_index=True) as br:
+            self.assertIsNotNone(br._backend._sidecar)
+            numpy.testing.assert_array_equal(br[:], expected)
+            self.assertNotIn("series", br._backend._rdr.__dict__)
+
+            br2 = pickle.loads(pickle.dumps(br))
+            numpy.testing.assert_array_equal(br2[:], expected)
+            self.assertNotIn("series", br2._backend._rdr.__dict__)
+
+    def test_sidecar_stale(self):
+        """A sidecar is ignored and rebuilt if the image was modified."""
+        BioReader(self.path, backend="python", sidecar_index=True).close()
+        image = self.image[:, :, :2]
+        write_test_image(self.path, image)
+        with BioReader(self.path, backend="python", sidecar_index=True) as br:
+            self.assertEqual(br.Z, 2)
+            numpy.testing.assert_array_equal(br[:], image[..., 0])
+
+
+class TestPersistentResources(unittest.TestCase):
+    """Test that the thread pool and file handle live as long as the reader."""
+
+    def test_executor_reused(self):
+        """Reads share one thread pool, which is shut down on close."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "pool.ome.tif"
+            image = numpy.random.randint(0, 2**8, (1100, 1100, 1, 1, 1), numpy.uint8)
+            write_test_image(path, image)
+
+            br = BioReader(path, backend="python", max_workers=2)
+            br[:10, :10]
+            executor = br._backend._executor
+            self.assertIsNotNone(executor)
+            self.assertFalse(br._backend._rdr.filehandle.closed)
+
+            numpy.testing.assert_array_equal(br[:], image[..., 0, 0, 0])
+            self.assertIs(br._backend._executor, executor)
+
+            br.close()
+            self.assertIsNone(br._backend._executor)
+            self.assertTrue(br._backend._rdr.filehandle.closed)
+
+
+class TestMemmapReads(unittest.TestCase):
+    """Test reading uncompressed tiles from a memory map."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.path = Path(cls._tmp.name) / "raw.ome.tif"
+        cls.image = numpy.random.randint(
+            0, 2**16, (2500, 2100, 3, 2, 1), dtype=numpy.uint16
+        )
+        tifffile.imwrite(
+            cls.path,
+            cls.image.transpose(4, 3, 2, 0, 1),
+            tile=(1024, 1024),
+            ome=True,
+            metadata={"axes": "TCZYX"},
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmp.cleanup()
+
+    def test_memmap_reads(self):
+        """Uncompressed tiles are read in place and match the written data."""
+        for max_workers in [1, 2]:
+            with BioReader(self.path, backend="python", max_workers=max_workers) as br:
+                numpy.testing.assert_array_equal(br[:], self.image[..., 0])
+                self.assertIsNotNone(br._backend._memmap)
+                numpy.testing.assert_array_equal(
+                    br[1000:2100, 5:1030, 2, 1, 0],
+                    self.image[1000:2100, 5:1030, 2, 1, 0],
+                )
+
+    def test_tile_grid(self):
+        """The tile grid of a plane is exposed as a read-only memory map."""
+        with BioReader(self.path, backend="python") as br:
+            grid = br.tile_grid(Z=1, C=1)
+            self.assertEqual(grid.shape, (3, 3, 1024, 1024))
+            self.assertFalse(grid.flags.writeable)
+            numpy.testing.assert_array_equal(
+                grid[1, 0], self.image[1024:2048, :1024, 1, 1, 0]
+            )
+            with self.assertRaises(IndexError):
+                br.tile_grid(Z=3)
+
+    def test_compressed_fallback(self):
+        """Compressed images are decoded and have no tile grid."""
+        path = Path(self._tmp.name) / "compressed.ome.tif"
+        write_test_image(path, self.image)
+        with BioReader(path, backend="python") as br:
+            numpy.testing.assert_array_equal(br[:], self.image[..., 0])
+            self.assertIsNone(br._backend._memmap)
+            with self.assertRaises(ValueError):
+                br.tile_grid()
+
+
+class TestReadInto(unittest.TestCase):
+    """Test reading into a preallocated array."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.path = Path(cls._tmp.name) / "read_into.ome.tif"
+        cls.image = numpy.random.randint(
+            0, 2**16, (2100, 1500, 3, 2, 1), dtype=numpy.uint16
+        )
+        write_test_image(cls.path, cls.image)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmp.cleanup()
+
+    def test_read_into(self):
+        """Regions read into an array match the written data."""
+        out = numpy.empty((1100, 530, 2, 2), dtype=numpy.uint16)
+        with BioReader(self.path, backend="python") as br:
+            result = br.read_into(out, X=(970, 1500), Y=(1000, 2100), Z=(1, 3))
+            self.assertIs(result, out)
+            numpy.testing.assert_array_equal(
+                out, self.image[1000:2100, 970:1500, 1:3, :, 0]
+            )
+
+            # out may keep the trailing empty dimensions
+            out = numpy.empty((10, 20, 1, 1, 1), dtype=numpy.uint16)
+            br.read(X=(5, 25), Y=(1030, 1040), Z=2, C=[1], out=out)
+            numpy.testing.assert_array_equal(
+                out[..., 0, 0, 0], self.image[1030:1040, 5:25, 2, 1, 0]
+            )
+
+    def test_read_into_batch(self):
+        """Reads can fill the slices of a larger batch buffer."""
+        batch = numpy.zeros((4, 64, 64), dtype=numpy.uint16)
+        corners = [(0, 0), (1000, 1000), (2036, 1436), (500, 1200)]
+        with BioReader(self.path, backend="python", max_workers=2) as br:
+            for out, (y, x) in zip(batch, corners):
+                br.read_into(out, X=(x, x + 64), Y=(y, y + 64), Z=0, C=[0])
+        for out, (y, x) in zip(batch, corners):
+            numpy.testing.assert_array_equal(
+                out, self.image[y : y + 64, x : x + 64, 0, 0, 0]
+            )
+
+    def test_tile_corner_patches(self):
+        """Small regions across tile corners are cropped from each tile."""
+        with BioReader(self.path, backend="python") as br:
+            for y, x in [(1000, 1000), (1020, 1020), (2036, 1436), (0, 1023)]:
+                patch = br[y : y + 64, x : x + 64, 1, 1, 0]
+                self.assertEqual(patch.shape, (64, 64))
+                numpy.testing.assert_array_equal(
+                    patch, self.image[y : y + 64, x : x + 64, 1, 1, 0]
+                )
+            numpy.testing.assert_array_equal(
+                br[1000:1050, 1000:1050, :, :, 0],
+                self.image[1000:1050, 1000:1050, ..., 0],
+            )
+
+    def test_read_into_invalid(self):
+        """Arrays with the wrong shape or dtype are rejected."""
+        with BioReader(self.path, backend="python") as br:
+            with self.assertRaises(ValueError):
+                br.read_into(numpy.empty((10, 10), numpy.uint16), X=(0, 10), Y=(0, 11))
+            with self.assertRaises(TypeError):
+                br.read_into(numpy.empty((10, 10), numpy.uint8), X=(0, 10), Y=(0, 10))
+
+
+class TestReadRegions(unittest.TestCase):
+    """Test batched reads of many regions."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.path = Path(cls._tmp.name) / "regions.ome.tif"
+        cls.image = numpy.random.randint(
+            0, 2**8, (2100, 1500, 2, 2, 1), dtype=numpy.uint8
+        )
+        write_test_image(cls.path, cls.image)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmp.cleanup()
+
+    def test_read_regions(self):
+        """Each region matches a regular read."""
+        regions = [
+            ([1000, 1100], [1000, 1100]),
+            ([0, 1500], [2000, 2100], [0, 2]),
+            ([10, 20], [1030, 1040], 1, [1]),
+            ([1020, 1030], [0, 2100], [1, 2], [0, 1], [0]),
+        ]
+        for max_workers in [1, 2]:
+            with BioReader(self.path, backend="python", max_workers=max_workers) as br:
+                crops = br.read_regions(regions)
+                self.assertEqual(len(crops), len(regions))
+                for region, crop in zip(regions, crops):
+                    numpy.testing.assert_array_equal(crop, br.read(*region))
+
+    def test_read_regions_stack(self):
+        """Regions of the same shape can be stacked."""
+        corners = [(0, 0), (1000, 1000), (1010, 1010), (2036, 1436)]
+        regions = [([x, x + 64], [y, y + 64], 1, [0]) for y, x in corners]
+        with BioReader(self.path, backend="python") as br:
+            crops = br.read_regions(regions, stack=True)
+            self.assertEqual(crops.shape, (4, 64, 64))
+            for crop, (y, x) in zip(crops, corners):
+                numpy.testing.assert_array_equal(
+                    crop, self.image[y : y + 64, x : x + 64, 1, 0, 0]
+                )
+
+            with self.assertRaises(ValueError):
+                br.read_regions([([0, 10], [0, 10]), ([0, 10], [0, 20])], stack=True)
+
+    def test_read_regions_decodes_once(self):
+        """Tiles shared by several regions are only decoded once."""
+        regions = [([x, x + 10], [1000, 1010], 0, [0]) for x in range(1000, 1040)]
+        with BioReader(self.path, backend="python", cache_size=2**30) as br:
+            br.read_regions(regions)
+            # the regions overlap two tiles
+            self.assertEqual(br.cache_info().misses, 2)
+            self.assertEqual(br.cache_info().hits, 0)
+
+
+class TestProcessExecutor(unittest.TestCase):
+    """Test decoding and encoding tiles in worker processes."""
+
+    def test_process_round_trip(self):
+        """Images written and read with worker processes are unchanged."""
+        image = numpy.random.randint(0, 2**8, (1100, 2100, 2, 1, 1), numpy.uint16)
+        image[:1024, :1024] = 0
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "process.ome.tif"
+            with BioWriter(
+                path,
+                X=2100,
+                Y=1100,
+                Z=2,
+                dtype=image.dtype,
+                max_workers=2,
+                executor="process",
+            ) as bw:
+                bw[:] = image
+
+            br = BioReader(path, backend="python", max_workers=2, executor="process")
+            numpy.testing.assert_array_equal(br[:], image[..., 0, 0])
+            numpy.testing.assert_array_equal(
+                br.read_regions([([1000, 1100], [1000, 1100], 1)])[0],
+                image[1000:1100, 1000:1100, 1, 0, 0],
+            )
+            self.assertIsNotNone(br._backend._tile_pool)
+
+            br.close()
+            self.assertIsNone(br._backend._tile_pool)
+
+    def test_invalid_executor(self):
+        """Only thread and process executors are supported."""
+        with self.assertRaises(ValueError):
+            BioWriter("invalid.ome.tif", X=10, Y=10, executor="fiber")
+
+
+class TestCompression(unittest.TestCase):
+    """Test the compression options of the python writer."""
+
+    def write(self, path, image, **kwargs):
+        with BioWriter(
+            path, X=image.shape[1], Y=image.shape[0], dtype=image.dtype, **kwargs
+        ) as bw:
+            bw[:] = image
+
+    def test_compressions(self):
+        """Every compression round trips and sets the tiff tags."""
+        image = numpy.random.randint(0, 2**10, (1100, 1100), numpy.uint16)
+        with tempfile.TemporaryDirectory() as tmp:
+            for compression, predictor, tag in [
+                ("none", False, tifffile.COMPRESSION.NONE),
+                ("deflate", True, tifffile.COMPRESSION.ADOBE_DEFLATE),
+                ("lzw", True, tifffile.COMPRESSION.LZW),
+                ("zstd", False, tifffile.COMPRESSION.ZSTD),
+                ("jpegxl", False, tifffile.COMPRESSION.JPEGXL),
+            ]:
+                with self.subTest(compression=compression, predictor=predictor):
+                    path = Path(tmp) / f"{compression}.ome.tif"
+                    self.write(
+                        path, image, compression=compression, predictor=predictor
+                    )
+                    with tifffile.TiffFile(path) as tif:
+                        self.assertEqual(tif.pages[0].compression, tag)
+                        self.assertEqual(tif.pages[0].predictor, 1 + predictor)
+                    with BioReader(path, backend="python") as br:
+                        numpy.testing.assert_array_equal(br[:], image)
+
+    def test_float_predictor(self):
+        """Float images use the floating point predictor."""
+        image = numpy.random.rand(600, 700).astype(numpy.float32)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "float.ome.tif"
+            self.write(path, image, compression="zstd", predictor=True)
+            with tifffile.TiffFile(path) as tif:
+                self.assertEqual(
+                    tif.pages[0].predictor, tifffile.PREDICTOR.FLOATINGPOINT
+                )
+            with BioReader(path, backend="python") as br:
+                numpy.testing.assert_array_equal(br[:], image)
+
+    def test_compression_level(self):
+        """Higher compression levels produce smaller files."""
+        image = numpy.repeat(numpy.arange(1024, dtype=numpy.uint16), 1024)
+        image = image.reshape(1024, 1024) // 7
+        sizes = []
+        with tempfile.TemporaryDirectory() as tmp:
+            for level in [1, 9]:
+                path = Path(tmp) / f"level{level}.ome.tif"
+                self.write(path, image, compression="deflate", compression_level=level)
+                sizes.append(path.stat().st_size)
+        self.assertLess(sizes[1], sizes[0])
+
+    def test_invalid_compression(self):
+        """Unknown compressions, levels and predictors are rejected."""
+        for kwargs in [
+            {"compression": "lz4"},
+            {"compression": "lzw", "compression_level": 5},
+            {"compression": "none", "predictor": True},
+            {"compression": "jpegxl", "predictor": True},
+        ]:
+            with self.subTest(**kwargs), self.assertRaises(ValueError):
+                BioWriter("invalid.ome.tif", X=10, Y=10, **kwargs)
+
+
+class TestConstantTiles(unittest.TestCase):
+    """Test that constant tiles are only encoded and written once."""
+
+    def test_constant_tiles(self):
+        """Constant tiles with the same value share their bytes in the file."""
+        image = numpy.zeros((3072, 3072, 2, 1, 1), numpy.uint16)
+        image[1024:2048, 1024:2048, 0] = 7
+        image[2048:, 2048:, 1] = 7
+        image[:100, :100, 1, 0, 0] = numpy.arange(100, dtype=numpy.uint16)
+        for max_workers, executor in [(1, "thread"), (2, "thread"), (2, "process")]:
+            with self.subTest(
+                max_workers=max_workers, executor=executor
+            ), tempfile.TemporaryDirectory() as tmp:
+                path = Path(tmp) / "sparse.ome.tif"
+                with BioWriter(
+                    path,
+                    X=3072,
+                    Y=3072,
+                    Z=2,
+                    dtype=image.dtype,
+                    max_workers=max_workers,
+                    executor=executor,
+                ) as bw:
+                    bw[:] = image
+
+                with tifffile.TiffFile(path) as tif:
+                    offsets = [o for p in tif.pages for o in p.dataoffsets]
+                # one tile of zeros, one of sevens and the tile with a gradient
+                self.assertEqual(len(set(offsets)), 3)
+
+                with BioReader(path, backend="python") as br:
+                    numpy.testing.assert_array_equal(br[:], image[..., 0, 0])
+
+    def test_constant_float_tiles(self):
+        """Float tiles are constant only if the bits of their pixels are equal."""
+        image = numpy.zeros((2048, 3072, 1, 1, 1), numpy.float32)
+        image[:1024, 1024:2048] = -0.0
+        image[:1024, 1024:1536] = 0.0
+        image[1024:, :2048] = numpy.nan
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "float.ome.tif"
+            with BioWriter(path, X=3072, Y=2048, dtype=image.dtype) as bw:
+                bw[:] = image
+
+            with tifffile.TiffFile(path) as tif:
+                offsets = tif.pages[0].dataoffsets
+            # zeros, mixed signed zeros and NaN are each encoded once
+            self.assertEqual(len(set(offsets)), 3)
+            self.assertEqual(offsets[0], offsets[2])
+            self.assertEqual(offsets[3], offsets[4])
+
+            with BioReader(path, backend="python") as br:
+                saved = br[:]
+            numpy.testing.assert_array_equal(
+                numpy.signbit(saved), numpy.signbit(image[..., 0, 0, 0])
+            )
+            numpy.testing.assert_array_equal(saved, image[..., 0, 0, 0])
+
+
+class TestTileOrder(unittest.TestCase):
+    """Test that tiles are written in raster order."""
+
+    def test_raster_order(self):
+        """Tile offsets increase in raster order for parallel writes."""
+        image = numpy.random.randint(0, 2**16, (3000, 3000, 2, 1, 1), numpy.uint16)
+        for executor, max_pending_tiles in [
+            ("thread", None),
+            ("thread", 3),
+            ("process", 1),
+        ]:
+            with self.subTest(
+                executor=executor, max_pending_tiles=max_pending_tiles
+            ), tempfile.TemporaryDirectory() as tmp:
+                path = Path(tmp) / "order.ome.tif"
+                with BioWriter(
+                    path,
+                    X=3000,
+                    Y=3000,
+                    Z=2,
+                    dtype=image.dtype,
+                    max_workers=2,
+                    executor=executor,
+                    max_pending_tiles=max_pending_tiles,
+                ) as bw:
+                    bw[:] = image
+
+                with tifffile.TiffFile(path) as tif:
+                    offsets = [o for p in tif.pages for o in p.dataoffsets]
+                self.assertEqual(offsets, sorted(offsets))
+
+                with BioReader(path, backend="python") as br:
+                    numpy.testing.assert_array_equal(br[:], image[..., 0, 0])
+
+    def test_invalid_max_pending_tiles(self):
+        """At least one tile must be allowed in flight."""
+        with self.assertRaises(ValueError):
+            BioWriter("invalid.ome.tif", X=10, Y=10, max_pending_tiles=0)
+
+
+class TestPyramid(unittest.TestCase):
+    """Test writing sub-resolution levels with the python writer."""
+
+    def test_downsample(self):
+        """Blocks of 2x2 pixels are reduced, odd edges are padded."""
+        image = numpy.array(
+            [[1, 1, 2, 3, 5], [2, 1, 2, 3, 5], [7, 7, 7, 4, 9]], numpy.uint8
+        )
+        numpy.testing.assert_array_equal(
+            downsample(image, "mean"), [[1, 2, 5], [7, 6, 9]]
+        )
+        numpy.testing.assert_array_equal(
+            downsample(image, "mode"), [[1, 2, 5], [7, 7, 9]]
+        )
+        numpy.testing.assert_array_equal(
+            downsample(image, "nearest"), [[1, 2, 5], [7, 7, 9]]
+        )
+        with self.assertRaises(ValueError):
+            downsample(image, "max")
+
+    def test_pyramid(self):
+        """Every level is written as SubIFDs and can be read back."""
+        image = numpy.random.randint(0, 2**16, (3000, 2500, 2, 1, 1), numpy.uint16)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "pyramid.ome.tif"
+            with BioWriter(
+                path, X=2500, Y=3000, Z=2, dtype=image.dtype, pyramid_levels=2
+            ) as bw:
+                bw[:] = image
+
+            with tifffile.TiffFile(path) as tif:
+                self.assertEqual(len(tif.pages), 2)
+                self.assertEqual(
+                    [level.shape for level in tif.series[0].levels],
+                    [(2, 3000, 2500), (2, 1500, 1250), (2, 750, 625)],
+                )
+
+            expected = image[..., 0, 0]
+            for level in range(3):
+                with BioReader(path, backend="python", level=level) as br:
+                    numpy.testing.assert_array_equal(br[:], expected)
+                expected = downsample(expected, "mean")
+
+    def test_streaming_pyramid(self):
+        """Levels are built from tiles written in any order, or not at all."""
+        image = numpy.random.randint(0, 4, (2500, 2100), numpy.uint8)
+        positions = [(y, x) for y in range(0, 2500, 1024) for x in range(0, 2100, 1024)]
+        numpy.random.shuffle(positions)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "labels.ome.tif"
+            with BioWriter(
+                path,
+                X=2100,
+                Y=2500,
+                dtype=image.dtype,
+                pyramid_levels=2,
+                downsample="mode",
+            ) as bw:
+                for y, x in positions[1:]:
+                    tile = image[y : y + 1024, x : x + 1024]
+                    bw[y : y + tile.shape[0], x : x + tile.shape[1]] = tile
+
+            y, x = positions[0]
+            image[y : y + 1024, x : x + 1024] = 0
+            expected = downsample(downsample(image, "mode"), "mode")
+            with BioReader(path, backend="python", level=2) as br:
+                numpy.testing.assert_array_equal(br[:], expected)
+
+    def test_overwritten_pyramid(self):
+        """Overwritten tiles update the levels, before and after they are done."""
+        image = numpy.random.randint(0, 2**16, (2048, 2048), numpy.uint16)
+        for max_workers in [1, 2]:
+            with self.subTest(
+                max_workers=max_workers
+            ), tempfile.TemporaryDirectory() as tmp:
+                path = Path(tmp) / "overwrite.ome.tif"
+                with BioWriter(
+                    path,
+                    X=2048,
+                    Y=2048,
+                    dtype=image.dtype,
+                    pyramid_levels=2,
+                    max_workers=max_workers,
+                ) as bw:
+                    bw[:1024, :1024] = numpy.zeros((1024, 1024), image.dtype)
+                    bw[:1024, :1024] = image[:1024, :1024]
+                    bw[:] = numpy.zeros_like(image)
+                    bw[1024:, 1024:] = image[1024:, 1024:]
+                    bw[:1024, 1024:] = image[:1024, 1024:]
+                    bw[1024:, :1024] = image[1024:, :1024]
+                    bw[:1024, :1024] = image[:1024, :1024]
+
+                expected = image
+                for level in range(3):
+                    with BioReader(path, backend="python", level=level) as br:
+                        numpy.testing.assert_array_equal(br[:], expected)
+                    expected = downsample(expected, "mean")
+
+    def test_invalid_pyramid(self):
+        """Negative levels and unknown downsampling methods are rejected."""
+        with self.assertRaises(ValueError):
+            BioWriter("invalid.ome.tif", X=10, Y=10, pyramid_levels=-1)
+        with self.assertRaises(ValueError):
+            BioWriter("invalid.ome.tif", X=10, Y=10, downsample="max")
+
+
+def expected_tile(image, x, y, tile_size, z, channels, t):
+    """Crop a zero padded tile from a 5D (Y, X, Z, C, T) array."""
+    tile = numpy.zeros(tuple(tile_size) + (len(channels),), dtype=image.dtype)
+    x0, x1 = max(x, 0), min(x + tile_size[1], image.shape[1])
+    y0, y1 = max(y, 0), min(y + tile_size[0], image.shape[0])
+    tile[y0 - y : y1 - y, x0 - x : x1 - x] = image[y0:y1, x0:x1, z, channels, t]
+    return tile
+
+
+class TestTileIterator(unittest.TestCase):
+    """Test iterating over tiles of several planes."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.path = Path(cls._tmp.name) / "iterate.ome.tif"
+        cls.image = numpy.random.randint(
+            0, 2**16, (1300, 2200, 3, 3, 2), dtype=numpy.uint16
+        )
+        # zero valued columns must not be mistaken for empty buffer columns
+        cls.image[:, 1000:1400] = 0
+        write_test_image(cls.path, cls.image)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmp.cleanup()
+
+    def check_tiles(self, tile_size, tile_stride=None, max_workers=1, **kwargs):
+        with BioReader(self.path, backend="python", max_workers=max_workers) as br:
+            tiles = list(br(tile_size, tile_stride, **kwargs))
+            xypad = br._iter_padding(tile_size, tile_stride or tile_size)
+
+        channels = kwargs.get("channels", [0])
+        num_tiles = 0
+        for images, (X, Y, Z, C, T) in tiles:
+            self.assertEqual(images.shape[1:], tuple(tile_size) + (len(channels),))
+            for i, image in enumerate(images):
+                self.assertEqual(C[i], channels)
+                numpy.testing.assert_array_equal(
+                    image,
+                    expected_tile(
+                        self.image, X[i][0], Y[i][0], tile_size, Z[i][0], C[i], T[i][0]
+                    ),
+                )
+            num_tiles += len(images)
+
+        return num_tiles, xypad
+
+    def test_planes(self):
+        """Tiles of every requested plane and channel match the image."""
+        for max_workers in [1, 2]:
+            num_tiles, _ = self.check_tiles(
+                [256, 256],
+                max_workers=max_workers,
+                channels=[2, 0],
+                z=[2, 0],
+                t=[1, 0],
+            )
+            self.assertEqual(num_tiles, 6 * 9 * 4)
+
+    def test_stride(self):
+        """Overlapping tiles are zero padded at the edges of the image."""
+        num_tiles, xypad = self.check_tiles([300, 200], [200, 150], z=1, t=1)
+        self.assertEqual(
+            num_tiles,
+            len(range(-xypad[0][0], 1300, 200)) * len(range(-xypad[1][0], 2200, 150)),
+        )
+
+    def test_batch_order(self):
+        """Tiles of a position are returned together, z-slices first."""
+        with BioReader(self.path, backend="python") as br:
+            images, index = next(iter(br([512, 512], batch_size=5, z=[0, 1], t=[0, 1])))
+        self.assertEqual(images.shape, (5, 512, 512, 1))
+        self.assertEqual(index[2], [[0, 1], [1, 2], [0, 1], [1, 2], [0, 1]])
+        self.assertEqual(index[4], [[0], [0], [1], [1], [0]])
+        self.assertEqual(index[1][4], [512, 1024])
+
+    def test_stop_early(self):
+        """A reader can be iterated over again after breaking out of a loop."""
+        with BioReader(self.path, backend="python") as br:
+            for _ in br([128, 128], batch_size=2):
+                break
+            images, index = next(iter(br([128, 128], channels=1)))
+            numpy.testing.assert_array_equal(
+                images[0, ..., 0], self.image[:128, :128, 0, 1, 0]
+            )
+
+    def test_invalid_planes(self):
+        """Planes outside of the image are rejected."""
+        with BioReader(self.path, backend="python") as br:
+            with self.assertRaises(AssertionError):
+                next(iter(br([256, 256], z=3)))
+            with self.assertRaises(AssertionError):
+                next(iter(br([256, 256], t=[2])))
+
+    def test_concurrent_iterators(self):
+        """Iterators over the same or different readers do not share buffers."""
+        with BioReader(self.path, backend="python") as br, BioReader(
+            self.path, backend="python"
+        ) as br2:
+            first = br([256, 256], channels=0)
+            second = br([256, 256], channels=1, z=1)
+            third = br2([256, 256], channels=2, t=1)
+            for (a, ind), (b, _), (c, _) in zip(first, second, third):
+                for i in range(len(a)):
+                    x, y = ind[0][i][0], ind[1][i][0]
+                    for images, plane in [
+                        (a, (0, 0, 0)),
+                        (b, (1, 1, 0)),
+                        (c, (0, 2, 1)),
+                    ]:
+                        numpy.testing.assert_array_equal(
+                            images[i, ..., 0],
+                            expected_tile(
+                                self.image,
+                                x,
+                                y,
+                                [256, 256],
+                                plane[0],
+                                [plane[1]],
+                                plane[2],
+                            )[..., 0],
+                        )
+
+    def test_threaded_iterators(self):
+        """Readers can iterate over tiles in several threads at once."""
+
+        def check_channel(channel):
+            num_tiles = 0
+            with BioReader(self.path, backend="python") as br:
+                for images, (X, Y, Z, C, T) in br([512, 512], channels=channel):
+                    for i, image in enumerate(images):
+                        numpy.testing.assert_array_equal(
+                            image,
+                            expected_tile(
+                                self.image, X[i][0], Y[i][0], [512, 512], 0, C[i], 0
+                            ),
+                        )
+                    num_tiles += len(images)
+            return num_tiles
+
+        with ThreadPoolExecutor(3) as executor:
+            self.assertEqual(list(executor.map(check_channel, range(3))), [15] * 3)
+
+    def test_prefetch(self):
+        """Up to prefetch supertiles are read ahead of the one being tiled."""
+        with BioReader(self.path, backend="python", max_workers=2) as br:
+            reads = []
+            fetch = br._fetch
+
+            def record(X, *args):
+                reads.append(X[0])
+                return fetch(X, *args)
+
+            br._fetch = record
+            tiles = br([256, 256], batch_size=1, prefetch=1)
+            next(tiles)
+            self.assertLessEqual(len(reads), 2)
+            tiles.close()
+
+            reads.clear()
+            tiles = br([256, 256], batch_size=1, prefetch=3)
+            next(tiles)
+            for _ in range(500):
+                if len(reads) == 3:
+                    break
+                time.sleep(0.01)
+            self.assertEqual(sorted(reads), [0, 1024, 2048])
+            tiles.close()
+
+            # one supertile of 1280 rows, 1024 columns and 2 channels is 5MiB
+            reads.clear()
+            tiles = br([256, 256], batch_size=1, channels=[0, 1], prefetch_bytes=2**23)
+            next(tiles)
+            self.assertLessEqual(len(reads), 2)
+            tiles.close()
+
+        for prefetch in [1, 3]:
+            num_tiles, _ = self.check_tiles(
+                [300, 300], [256, 256], channels=[1], z=[0, 2], prefetch=prefetch
+            )
+            self.assertEqual(num_tiles, 6 * 9 * 2)
+        self.check_tiles([128, 128], prefetch_bytes=1)
+
+        with BioReader(self.path, backend="python") as br:
+            with self.assertRaises(AssertionError):
+                next(br([256, 256], prefetch=0))
+
+    def test_unlocked_decode(self):
+        """Supertiles read ahead are decoded without locking the reader."""
+        with BioReader(self.path, backend="python", max_workers=2) as br:
+            keyframe = br._backend._rdr_pages[0].keyframe
+            decode = keyframe.decode
+            locked = []
+
+            def record(*args, **kwargs):
+                locked.append(br._backend._lock.locked())
+                return decode(*args, **kwargs)
+
+            keyframe.decode = record
+            for images, (X, Y, Z, C, T) in br([256, 256], prefetch=3):
+                for i, image in enumerate(images):
+                    numpy.testing.assert_array_equal(
+                        image,
+                        expected_tile(
+                            self.image, X[i][0], Y[i][0], [256, 256], 0, C[i], 0
+                        ),
+                    )
+
+        self.assertGreater(len(locked), 0)
+        self.assertFalse(any(locked))
+
+    def test_views(self):
+        """Batches can be views of the pixel buffer instead of copies."""
+        with BioReader(self.path, backend="python") as br:
+            num_views = 0
+            for images, (X, Y, Z, C, T) in br(
+                [256, 256], batch_size=6, channels=[1, 2], z=2, copy=False
+            ):
+                num_views += not images.flags.writeable
+                for i, image in enumerate(images):
+                    numpy.testing.assert_array_equal(
+                        image,
+                        expected_tile(
+                            self.image, X[i][0], Y[i][0], [256, 256], 2, C[i], 0
+                        ),
+                    )
+            self.assertEqual(num_views, 9)
+
+            images, _ = next(br([256, 256], batch_size=7, copy=False))
+            self.assertEqual(images.shape, (7, 256, 256, 1))
+
+    def test_ring_buffer(self):
+        """Columns wrap around the ring and survive resizing it."""
+        image = numpy.arange(4 * 10).reshape(4, 10)
+        buffer = SupertileBuffer(numpy.zeros((4, 8), int), x_offset=-2, halo=2)
+        self.assertEqual(buffer.columns, 6)
+        buffer.put_columns(-2, image[:, :4])
+
+        # release the first three columns before storing more
+        buffer.x_offset, buffer.last_column = 1, 1
+        buffer.put_columns(2, image[:, 4:8])
+        buffer.last_column = 5
+        numpy.testing.assert_array_equal(buffer.get_columns(1, 5), image[:, 3:8])
+        numpy.testing.assert_array_equal(
+            buffer.pixel_buffer[:, 6:], buffer.pixel_buffer[:, :2]
+        )
+
+        buffer.resize(9)
+        self.assertEqual(buffer.pixel_buffer.shape, (4, 11))
+        buffer.put_columns(6, image[:, 8:])
+        numpy.testing.assert_array_equal(buffer.get_columns(1, 7), image[:, 3:])
+
+    def test_blocks(self):
+        """Supertiles are bounded by the block size, and tiles are unchanged."""
+        for tile_size, tile_stride in [([256, 256], None), ([300, 200], [200, 150])]:
+            with BioReader(self.path, backend="python") as br:
+                tiles = list(br(tile_size, tile_stride, channels=[2], t=1))
+
+            with BioReader(self.path, backend="python", max_workers=2) as br:
+                shapes = []
+                fetch = br._fetch
+
+                def record(X, Y, *args):
+                    shapes.append((Y[1] - Y[0], X[1] - X[0]))
+                    return fetch(X, Y, *args)
+
+                br._fetch = record
+                blocks = list(
+                    br(
+                        tile_size,
+                        tile_stride,
+                        channels=[2],
+                        t=1,
+                        block_size=[600, 500],
+                        prefetch=3,
+                    )
+                )
+
+            self.assertLessEqual(max(s[0] for s in shapes), 600)
+            self.assertLessEqual(max(s[1] for s in shapes), 500)
+
+            positions = {}
+            for images, (X, Y, Z, C, T) in tiles:
+                for i, image in enumerate(images):
+                    positions[(X[i][0], Y[i][0])] = image
+            num_tiles = 0
+            for images, (X, Y, Z, C, T) in blocks:
+                for i, image in enumerate(images):
+                    numpy.testing.assert_array_equal(
+                        image, positions[(X[i][0], Y[i][0])]
+                    )
+                    num_tiles += 1
+            self.assertEqual(num_tiles, len(positions))
+
+        num_tiles, _ = self.check_tiles(
+            [256, 256], block_size=[256, 256], z=[0, 1], channels=[0, 2]
+        )
+        self.assertEqual(num_tiles, 6 * 9 * 2)
+
+    def test_region(self):
+        """Tiles can be limited to a region of the image."""
+        with BioReader(self.path, backend="python") as br:
+            xypad = br._iter_padding([256, 256], [200, 200], (700, 1100))
+            num_tiles, _ = self.check_tiles(
+                [256, 256], [200, 200], channels=[1], x=[1000, 2100], y=[600, 1300]
+            )
+            self.assertEqual(num_tiles, 6 * 4)
+
+            X, Y = [], []
+            for _, index in br([256, 256], [200, 200], x=[1000, 2100], y=[600, 1300]):
+                X.extend(index[0])
+                Y.extend(index[1])
+            self.assertEqual(min(x[0] for x in X), 1000 - xypad[1][0])
+            self.assertEqual(min(y[0] for y in Y), 600 - xypad[0][0])
+
+            with self.assertRaises(AssertionError):
+                next(br([256, 256], x=[1000, 2300]))
+
+    def test_writerate(self):
+        """Tiles streamed from a reader into a writer save the same image."""
+        cases = [
+            ([256, 256], None, {}),
+            ([256, 256], [200, 200], {"channels": [1], "t": 1}),
+            (
+                [300, 200],
+                [200, 150],
+                {"channels": [2, 0], "z": [2, 0], "t": 1, "block_size": [600, 500]},
+            ),
+        ]
+        for tile_size, tile_stride, kwargs in cases:
+            with self.subTest(tile_size=tile_size, tile_stride=tile_stride):
+                channels = kwargs.get("channels", [0])
+                zs = kwargs.get("z", [0])
+                t = kwargs.get("t", 0)
+                path = Path(self._tmp.name) / "writerate.ome.tif"
+                with BioReader(self.path, backend="python") as br, BioWriter(
+                    path, metadata=br.metadata
+                ) as bw:
+                    writerator = bw._writerate(tile_size, tile_stride, **kwargs)
+                    next(writerator)
+                    for images, _ in br(tile_size, tile_stride, **kwargs):
+                        writerator.send(images)
+
+                with BioReader(path, backend="python") as br:
+                    for z in zs:
+                        numpy.testing.assert_array_equal(
+                            br.read(Z=[z, z + 1], C=channels, T=[t]).squeeze(),
+                            self.image[:, :, z, channels, t].squeeze(),
+                        )
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 """Tests for zarr v3 support in bfio using unittest."""
 
+import asyncio
 import json
 import tempfile
 import unittest
@@ -281,6 +282,408 @@ class TestZarrRoundTrip(unittest.TestCase):
             numpy.testing.assert_array_equal(data, read_data)
 
 
+class TestZarrReadInto(unittest.TestCase):
+    """Test reading zarr v2 and v3 images into a preallocated array."""
+
+    def test_read_into(self):
+        """A region read into an array matches a regular read."""
+        from bfio import BioReader, BioWriter
+
+        data = numpy.random.randint(0, 65535, (1100, 1300, 3), dtype=numpy.uint16)
+        for backend in ["zarr", "zarr3"]:
+            with tempfile.TemporaryDirectory() as tmp:
+                out_path = Path(tmp) / f"read_into_{backend}.zarr"
+                with BioWriter(
+                    out_path, backend=backend, X=1300, Y=1100, Z=3, dtype=data.dtype
+                ) as bw:
+                    bw[:] = data
+
+                out = numpy.empty((90, 300, 2), dtype=numpy.uint16)
+                with BioReader(out_path, backend=backend) as br:
+                    result = br.read_into(out, X=(1000, 1300), Y=(1010, 1100), Z=(1, 3))
+                self.assertIs(result, out)
+                numpy.testing.assert_array_equal(out, data[1010:1100, 1000:1300, 1:3])
+
+
+class TestZarrBatchedRead(unittest.TestCase):
+    """Test reading many planes of zarr v2 and v3 images at once."""
+
+    def test_read_channels_and_timepoints(self):
+        """Subsets of channels and timepoints are read into the right planes."""
+        from bfio import BioReader, BioWriter
+
+        data = numpy.random.randint(0, 255, (1100, 1300, 2, 3, 2), dtype=numpy.uint8)
+        for backend in ["zarr", "zarr3"]:
+            with self.subTest(backend=backend), tempfile.TemporaryDirectory() as tmp:
+                out_path = Path(tmp) / f"batched_{backend}.zarr"
+                with BioWriter(
+                    out_path,
+                    backend=backend,
+                    X=1300,
+                    Y=1100,
+                    Z=2,
+                    C=3,
+                    T=2,
+                    dtype=data.dtype,
+                ) as bw:
+                    bw[:] = data
+
+                for max_workers in [1, 2]:
+                    with BioReader(
+                        out_path, backend=backend, max_workers=max_workers
+                    ) as br:
+                        result = br.read(X=(5, 1290), Y=(1000, 1100), C=[2, 0], T=[1])
+                    numpy.testing.assert_array_equal(
+                        result, data[1000:1100, 5:1290, :, [2, 0], 1]
+                    )
+
+    def test_read_errors_are_raised(self):
+        """A chunk that cannot be decoded fails the read."""
+        from bfio import BioReader, BioWriter
+
+        data = numpy.random.randint(0, 255, (1100, 1300, 2), dtype=numpy.uint8)
+        with tempfile.TemporaryDirectory() as tmp:
+            out_path = Path(tmp) / "corrupt.zarr"
+            with BioWriter(
+                out_path, backend="zarr3", X=1300, Y=1100, Z=2, dtype=data.dtype
+            ) as bw:
+                bw[:] = data
+            with open(out_path / "0" / "c" / "0" / "0" / "1" / "1" / "1", "wb") as fw:
+                fw.write(b"not a zstd frame")
+
+            for max_workers in [1, 2]:
+                with BioReader(
+                    out_path, backend="zarr3", max_workers=max_workers
+                ) as br:
+                    numpy.testing.assert_array_equal(
+                        br[:1024, :1024, 1], data[:1024, :1024, 1]
+                    )
+                    with self.assertRaises(Exception):
+                        br[:]
+
+
+class TestZarrAsyncRead(unittest.IsolatedAsyncioTestCase):
+    """Test reading zarr v2 and v3 images with the asyncio API."""
+
+    async def test_aread(self):
+        """Concurrent async reads match regular reads."""
+        from bfio import BioReader, BioWriter
+
+        data = numpy.random.randint(0, 255, (1100, 1300, 2, 3), dtype=numpy.uint8)
+        for backend in ["zarr", "zarr3"]:
+            with self.subTest(backend=backend), tempfile.TemporaryDirectory() as tmp:
+                out_path = Path(tmp) / f"aread_{backend}.zarr"
+                with BioWriter(
+                    out_path,
+                    backend=backend,
+                    X=1300,
+                    Y=1100,
+                    Z=2,
+                    C=3,
+                    dtype=data.dtype,
+                ) as bw:
+                    bw[:] = data
+
+                with BioReader(out_path, backend=backend) as br:
+                    regions = [
+                        ((x, x + 300), (y, y + 300))
+                        for x in (0, 1000)
+                        for y in (0, 800)
+                    ]
+                    results = await asyncio.gather(
+                        *(br.aread(X=X, Y=Y, Z=1, C=[2, 0]) for X, Y in regions)
+                    )
+                    for (X, Y), result in zip(regions, results):
+                        numpy.testing.assert_array_equal(
+                            result, data[Y[0] : Y[1], X[0] : X[1], 1:2, [2, 0]]
+                        )
+
+                    out = numpy.empty((100, 1300, 2), dtype=numpy.uint8)
+                    result = await br.aread(Y=(1000, 1100), C=[1], out=out)
+                    self.assertIs(result, out)
+                    numpy.testing.assert_array_equal(out, data[1000:1100, :, :, 1])
+
+    async def test_aiter_tiles(self):
+        """Async tile batches are zero padded regions of the image."""
+        from bfio import BioReader, BioWriter
+
+        data = numpy.random.randint(0, 255, (700, 500, 1, 2), dtype=numpy.uint8)
+        with tempfile.TemporaryDirectory() as tmp:
+            out_path = Path(tmp) / "aiter.zarr"
+            with BioWriter(
+                out_path, backend="zarr3", X=500, Y=700, C=2, dtype=data.dtype
+            ) as bw:
+                bw[:] = data
+
+            padded = numpy.zeros((1000, 1000, 2), dtype=numpy.uint8)
+            padded[:700, :500] = data[:, :, 0]
+            count = 0
+            with BioReader(out_path, backend="zarr3") as br:
+                async for tiles, index in br.aiter_tiles(
+                    tile_size=(256, 256), batch_size=5, channels=[0, 1]
+                ):
+                    self.assertEqual(tiles.shape[1:], (256, 256, 2))
+                    for tile, (x0, x1), (y0, y1) in zip(tiles, index[0], index[1]):
+                        numpy.testing.assert_array_equal(tile, padded[y0:y1, x0:x1])
+                    count += tiles.shape[0]
+            self.assertEqual(count, 3 * 2)
+
+    async def test_aiter_tiles_arguments(self):
+        """Async tile batches match the batches of the tile iterator."""
+        from bfio import BioReader, BioWriter
+
+        data = numpy.random.randint(0, 255, (700, 1300, 3, 2, 2), dtype=numpy.uint8)
+        cases = [
+            {"z": [2, 0], "t": 1, "channels": [1, 0]},
+            {"tile_stride": (200, 150), "block_size": (500, 400), "prefetch": 3},
+            {"x": (300, 1100), "y": (100, 600), "copy": False, "prefetch_bytes": 1},
+        ]
+        with tempfile.TemporaryDirectory() as tmp:
+            out_path = Path(tmp) / "aiter_args.zarr"
+            with BioWriter(
+                out_path,
+                backend="zarr3",
+                X=1300,
+                Y=700,
+                Z=3,
+                C=2,
+                T=2,
+                dtype=data.dtype,
+            ) as bw:
+                bw[:] = data
+
+            with BioReader(out_path, backend="zarr3") as br:
+                for kwargs in cases:
+                    with self.subTest(**kwargs):
+                        expected = list(br((256, 256), **kwargs))
+                        count = 0
+                        async for tiles, index in br.aiter_tiles((256, 256), **kwargs):
+                            images, expected_index = expected[count]
+                            numpy.testing.assert_array_equal(tiles, images)
+                            self.assertEqual(index, expected_index)
+                            count += 1
+                        self.assertEqual(count, len(expected))
+
+
+class TestZarrPyramid(unittest.TestCase):
+    """Test writing multiscale zarr v2 and v3 images."""
+
+    def test_pyramid(self):
+        """Every level is written, can be read and has a scale transformation."""
+        from bfio import BioReader, BioWriter
+        from bfio.utils import downsample
+
+        data = numpy.random.randint(0, 65535, (2100, 1300, 2), dtype=numpy.uint16)
+        for backend in ["zarr", "zarr3"]:
+            with self.subTest(backend=backend), tempfile.TemporaryDirectory() as tmp:
+                out_path = Path(tmp) / f"pyramid_{backend}.ome.zarr"
+                with BioWriter(
+                    out_path,
+                    backend=backend,
+                    X=1300,
+                    Y=2100,
+                    Z=2,
+                    dtype=data.dtype,
+                    pyramid_levels=2,
+                    max_workers=2,
+                ) as bw:
+                    # overwritten regions update the levels, before and after
+                    # every tile of a level tile was written
+                    bw[:1024, :1024] = numpy.zeros((1024, 1024, 2), data.dtype)
+                    bw[:1024, :1024] = data[:1024, :1024]
+                    bw[:] = numpy.zeros_like(data)
+                    bw[1024:, :] = data[1024:]
+                    bw[:1024, :] = data[:1024]
+
+                expected = data
+                for level in range(3):
+                    with BioReader(out_path, backend=backend, level=level) as br:
+                        numpy.testing.assert_array_equal(br[:], expected)
+                    expected = downsample(expected)
+
+                if backend == "zarr":
+                    with open(out_path / ".zattrs") as f:
+                        multiscales = json.load(f)["multiscales"][0]
+                    self.assertEqual(multiscales["version"], "0.4")
+                else:
+                    with open(out_path / "zarr.json") as f:
+                        meta = json.load(f)
+                    multiscales = meta["attributes"]["ome"]["multiscales"][0]
+                datasets = multiscales["datasets"]
+                self.assertEqual([d["path"] for d in datasets], ["0", "1", "2"])
+                scales = [d["coordinateTransformations"][0]["scale"] for d in datasets]
+                self.assertEqual([s[-2:] for s in scales], [[1, 1], [2, 2], [4, 4]])
+
+
+class TestZarrChunks(unittest.TestCase):
+    """Test writing zarr images with custom chunk shapes."""
+
+    def test_chunks_roundtrip(self):
+        """Images with volumetric chunks read back unchanged."""
+        from bfio import BioReader, BioWriter
+
+        data = numpy.random.randint(0, 255, (1100, 2100, 5, 2), dtype=numpy.uint8)
+        for backend in ["zarr", "zarr3", "tensorstore"]:
+            for chunks in [(1, 2, 2, 512, 2048), "volume"]:
+                with self.subTest(
+                    backend=backend, chunks=chunks
+                ), tempfile.TemporaryDirectory() as tmp:
+                    out_path = Path(tmp) / f"chunks_{backend}.ome.zarr"
+                    with BioWriter(
+                        out_path,
+                        backend=backend,
+                        X=2100,
+                        Y=1100,
+                        Z=5,
+                        C=2,
+                        dtype=data.dtype,
+                        chunks=chunks,
+                        chunk_bytes=2**20,
+                        max_workers=2,
+                    ) as bw:
+                        bw[:] = data
+
+                    expected = [1, 2, 2, 512, 2048]
+                    if chunks == "volume":
+                        expected = [1, 1, 5, 256, 512]
+                    if backend == "zarr3":
+                        with open(out_path / "0" / "zarr.json") as f:
+                            grid = json.load(f)["chunk_grid"]
+                        self.assertEqual(grid["configuration"]["chunk_shape"], expected)
+                    else:
+                        with open(out_path / "0" / ".zarray") as f:
+                            self.assertEqual(json.load(f)["chunks"], expected)
+
+                    with BioReader(out_path) as br:
+                        numpy.testing.assert_array_equal(br[:], data)
+
+    def test_auto_chunks(self):
+        """Auto chunks follow the access pattern and the byte target."""
+        from bfio.utils import auto_chunks
+
+        shape = (1, 1, 300, 4096, 4096)
+        self.assertEqual(
+            auto_chunks(shape, numpy.uint16, "plane"), (1, 1, 1, 1024, 2048)
+        )
+        self.assertEqual(
+            auto_chunks(shape, numpy.uint16, "volume"), (1, 1, 128, 128, 128)
+        )
+        self.assertEqual(
+            auto_chunks(shape, numpy.uint8, "column"), (1, 1, 300, 64, 128)
+        )
+        self.assertEqual(auto_chunks(shape, numpy.uint8), (1, 1, 128, 128, 256))
+        self.assertEqual(
+            auto_chunks((1, 1, 1, 100, 50000), numpy.uint8, chunk_bytes=2**20),
+            (1, 1, 1, 128, 8192),
+        )
+        self.assertEqual(
+            auto_chunks((1, 1, 3, 1500, 700), numpy.uint16, "plane"),
+            (1, 1, 1, 2048, 1024),
+        )
+
+    def test_auto_chunks_odd_shapes(self):
+        """Auto chunks work on images that are not powers of two or are small."""
+        from bfio import BioReader, BioWriter
+
+        for Y, X in [(1500, 1500), (700, 300), (100, 2100)]:
+            data = numpy.random.randint(0, 255, (Y, X, 3), dtype=numpy.uint8)
+            for backend in ["zarr", "zarr3"]:
+                for chunks in ["auto", "plane", "volume", "column"]:
+                    with self.subTest(
+                        shape=(Y, X), backend=backend, chunks=chunks
+                    ), tempfile.TemporaryDirectory() as tmp:
+                        out_path = Path(tmp) / f"odd_{backend}.ome.zarr"
+                        with BioWriter(
+                            out_path,
+                            backend=backend,
+                            X=X,
+                            Y=Y,
+                            Z=3,
+                            dtype=data.dtype,
+                            chunks=chunks,
+                        ) as bw:
+                            bw[:] = data
+
+                        with BioReader(out_path, backend=backend) as br:
+                            numpy.testing.assert_array_equal(br[:], data)
+
+    def test_invalid_chunks(self):
+        """Chunks must be five positive integers that line up with the tiles."""
+        from bfio import BioWriter
+
+        with tempfile.TemporaryDirectory() as tmp:
+            for chunks in [
+                (1, 1, 512, 512),
+                (1, 1, 1, 0, 512),
+                "rows",
+                (1, 1, 1, 1000, 512),
+            ]:
+                with self.subTest(chunks=chunks), self.assertRaises(ValueError):
+                    BioWriter(Path(tmp) / "bad.ome.zarr", backend="zarr", chunks=chunks)
+            with self.assertRaises(ValueError):
+                BioWriter(
+                    Path(tmp) / "bad.ome.zarr",
+                    backend="zarr3",
+                    chunks=(1, 1, 2, 512, 512),
+                    shards=(1, 1, 3, 1024, 1024),
+                )
+
+
+class TestZarrShards(unittest.TestCase):
+    """Test writing and reading sharded zarr v3 images."""
+
+    def test_sharded_roundtrip(self):
+        """Shards hold many tiles and read back the same as unsharded arrays."""
+        from bfio import BioReader, BioWriter
+
+        data = numpy.random.randint(0, 255, (2100, 2500, 3, 2), dtype=numpy.uint8)
+        with tempfile.TemporaryDirectory() as tmp:
+            out_path = Path(tmp) / "sharded.ome.zarr"
+            with BioWriter(
+                out_path,
+                backend="zarr3",
+                X=2500,
+                Y=2100,
+                Z=3,
+                C=2,
+                dtype=data.dtype,
+                shards=(1, 1, 3, 2048, 2048),
+                max_workers=2,
+            ) as bw:
+                bw[:] = data
+
+            with open(out_path / "0" / "zarr.json") as f:
+                codec = json.load(f)["codecs"][0]
+            self.assertEqual(codec["name"], "sharding_indexed")
+            self.assertEqual(
+                codec["configuration"]["chunk_shape"], [1, 1, 1, 1024, 1024]
+            )
+            # one file per channel and 2x2 block of tiles instead of one per tile
+            chunks = [f for f in (out_path / "0" / "c").rglob("*") if f.is_file()]
+            self.assertEqual(len(chunks), 2 * 2 * 2)
+
+            with BioReader(out_path, backend="zarr3", max_workers=2) as br:
+                numpy.testing.assert_array_equal(br[:], data)
+                numpy.testing.assert_array_equal(
+                    br[37:2081, 1000:2300, 1:3, 1], data[37:2081, 1000:2300, 1:3, 1]
+                )
+
+    def test_invalid_shards(self):
+        """Shards must be five positive integers aligned to the tiles."""
+        from bfio import BioWriter
+
+        with tempfile.TemporaryDirectory() as tmp:
+            for shards in [
+                (1, 1, 2048, 2048),
+                (1, 1, 0, 2048, 2048),
+                (1, 1, 1, 1000, 2048),
+            ]:
+                with self.subTest(shards=shards), self.assertRaises(ValueError):
+                    BioWriter(
+                        Path(tmp) / "bad.ome.zarr", backend="zarr3", shards=shards
+                    )
+
+
 class TestImageSizeV3(unittest.TestCase):
     """Test BioReader.image_size() works with both v2 and v3 format."""
 
@@ -317,3 +720,49 @@ class TestImageSizeV3(unittest.TestCase):
 
 if __name__ == "__main__":
     unittest.main()
+
+
+class TestTensorstoreTileIterator(unittest.TestCase):
+    """Test iterating over tiles with the tensorstore backend."""
+
+    def test_iterator(self):
+        """Tensorstore yields the same batches as the zarr3 backend."""
+        from bfio import BioReader, BioWriter
+
+        data = numpy.random.randint(0, 65535, (1300, 2200, 2, 3, 2), numpy.uint16)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "iterate.ome.zarr"
+            with BioWriter(
+                path, backend="zarr3", X=2200, Y=1300, Z=2, C=3, T=2, dtype=data.dtype
+            ) as bw:
+                bw[:] = data
+
+            kwargs = {
+                "tile_size": [256, 256],
+                "tile_stride": [200, 200],
+                "batch_size": 20,
+                "channels": [2, 0],
+                "z": [1, 0],
+                "t": 1,
+                "x": [300, 1500],
+                "y": [100, 900],
+            }
+            with BioReader(path, backend="zarr3") as br:
+                expected = list(br(**kwargs))
+            with BioReader(path, backend="tensorstore") as br:
+                batches = list(br(prefetch=4, **kwargs))
+                numpy.testing.assert_array_equal(
+                    br.read(Z=1, C=[2, 0], T=[1]), data[:, :, 1:2][..., [2, 0], 1]
+                )
+
+        self.assertEqual(len(batches), 4)
+        for (images, index), (expected_images, expected_index) in zip(
+            batches, expected
+        ):
+            self.assertEqual(index, expected_index)
+            numpy.testing.assert_array_equal(images, expected_images)
+        images, (X, Y, Z, C, T) = batches[0]
+        self.assertEqual(images.shape, (20, 256, 256, 2))
+        numpy.testing.assert_array_equal(
+            images[1], data[72:328, 272:528, 0][..., [2, 0], 1]
+        )